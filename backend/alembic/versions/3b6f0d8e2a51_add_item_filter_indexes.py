@@ -0,0 +1,27 @@
+"""Add composite indexes for item list filters
+
+Revision ID: 3b6f0d8e2a51
+Revises: e7b3a9c1d2f4
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b6f0d8e2a51'
+down_revision = 'e7b3a9c1d2f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (owner_id, updated_at) 已由 c4d2e7f91a36 创建
+    op.create_index('ix_item_owner_id_category', 'item', ['owner_id', 'category'], unique=False)
+    op.create_index('ix_item_owner_id_location_id', 'item', ['owner_id', 'location_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_item_owner_id_location_id', table_name='item')
+    op.drop_index('ix_item_owner_id_category', table_name='item')
@@ -0,0 +1,24 @@
+"""Add item (owner_id, expiry_date) index
+
+Revision ID: 5e8a2c4f7d13
+Revises: 9d4c1e7a5b20
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e8a2c4f7d13'
+down_revision = '9d4c1e7a5b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_item_owner_id_expiry_date', 'item', ['owner_id', 'expiry_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_item_owner_id_expiry_date', table_name='item')
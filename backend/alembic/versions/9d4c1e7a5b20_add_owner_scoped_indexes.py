@@ -0,0 +1,33 @@
+"""Add owner-scoped composite and partial indexes
+
+Revision ID: 9d4c1e7a5b20
+Revises: 3b6f0d8e2a51
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4c1e7a5b20'
+down_revision = '3b6f0d8e2a51'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_location_owner_id_parent_id', 'location', ['owner_id', 'parent_id'], unique=False)
+    # 只索引未完成的提醒，条件与查询中的 is_completed = false 一致
+    op.create_index(
+        'ix_reminder_owner_id_due_date_open', 'reminder', ['owner_id', 'due_date'], unique=False,
+        postgresql_where=sa.text('is_completed = false'),
+        sqlite_where=sa.text('is_completed = 0'),
+    )
+    op.create_index(op.f('ix_reminder_item_id'), 'reminder', ['item_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_reminder_item_id'), table_name='reminder')
+    op.drop_index('ix_reminder_owner_id_due_date_open', table_name='reminder')
+    op.drop_index('ix_location_owner_id_parent_id', table_name='location')
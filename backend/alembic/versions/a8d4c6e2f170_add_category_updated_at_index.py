@@ -0,0 +1,24 @@
+"""Add category (owner_id, updated_at) index for sync
+
+Revision ID: a8d4c6e2f170
+Revises: f1a7c3e9b258
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4c6e2f170'
+down_revision = 'f1a7c3e9b258'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 类别作为独立集合参与增量同步，按 (owner_id, updated_at) 扫描变更
+    op.create_index('ix_category_owner_id_updated_at', 'category', ['owner_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_category_owner_id_updated_at', table_name='category')
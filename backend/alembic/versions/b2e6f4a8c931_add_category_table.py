@@ -0,0 +1,130 @@
+"""Add per-owner category table referenced by item.category_id
+
+Revision ID: b2e6f4a8c931
+Revises: 5e8a2c4f7d13
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import SQLITE_FTS_CREATE, SQLITE_FTS_DROP
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2e6f4a8c931'
+down_revision = '5e8a2c4f7d13'
+branch_labels = None
+depends_on = None
+
+category = sa.table(
+    'category',
+    sa.column('id', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('owner_id', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+    sa.column('updated_at', sa.DateTime),
+)
+item = sa.table(
+    'item',
+    sa.column('owner_id', sa.Integer),
+    sa.column('category', sa.String),
+    sa.column('category_id', sa.Integer),
+)
+
+
+def _same_owner():
+    # 没有所有者的物品对应没有所有者的类别
+    return sa.or_(
+        category.c.owner_id == item.c.owner_id,
+        sa.and_(category.c.owner_id.is_(None), item.c.owner_id.is_(None)),
+    )
+
+
+def _recreate_item_table(drop_column, add_column=None):
+    # SQLite 上 batch_alter_table 会重建 item 表，全文索引的触发器随旧表一起删除，需要重建
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_DROP:
+            op.execute(statement)
+    with op.batch_alter_table('item') as batch_op:
+        if add_column is not None:
+            add_column(batch_op)
+        batch_op.drop_column(drop_column)
+    if bind.dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_CREATE:
+            op.execute(statement)
+        op.execute("INSERT INTO item_fts(item_fts) VALUES ('rebuild')")
+
+
+def upgrade():
+    op.create_table(
+        'category',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('owner_id', 'name', name='uq_category_owner_id_name'),
+    )
+    op.create_index(op.f('ix_category_id'), 'category', ['id'], unique=False)
+    op.add_column('item', sa.Column('category_id', sa.Integer(), nullable=True))
+
+    # 回填：每个用户用过的类别名称各建一条类别，再把物品指向对应的类别ID
+    now = datetime.utcnow()
+    op.execute(
+        category.insert().from_select(
+            ['owner_id', 'name', 'created_at', 'updated_at'],
+            sa.select(
+                item.c.owner_id, item.c.category, sa.literal(now), sa.literal(now)
+            )
+            .where(item.c.category.is_not(None), item.c.category != '')
+            .distinct(),
+        )
+    )
+    op.execute(
+        item.update()
+        .where(item.c.category.is_not(None), item.c.category != '')
+        .values(
+            category_id=sa.select(category.c.id)
+            .where(category.c.name == item.c.category, _same_owner())
+            .scalar_subquery()
+        )
+    )
+
+    op.drop_index('ix_item_owner_id_category', table_name='item')
+    op.drop_index('ix_item_category', table_name='item')
+
+    def add_foreign_key(batch_op):
+        batch_op.create_foreign_key('fk_item_category_id_category', 'category', ['category_id'], ['id'])
+
+    _recreate_item_table('category', add_foreign_key)
+    op.create_index('ix_item_owner_id_category_id', 'item', ['owner_id', 'category_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_item_owner_id_category_id', table_name='item')
+    op.add_column('item', sa.Column('category', sa.String(), nullable=True))
+    op.execute(
+        item.update()
+        .where(item.c.category_id.is_not(None))
+        .values(
+            category=sa.select(category.c.name)
+            .where(category.c.id == item.c.category_id)
+            .scalar_subquery()
+        )
+    )
+
+    def drop_foreign_key(batch_op):
+        if op.get_bind().dialect.name != 'sqlite':
+            batch_op.drop_constraint('fk_item_category_id_category', type_='foreignkey')
+
+    _recreate_item_table('category_id', drop_foreign_key)
+    op.create_index('ix_item_category', 'item', ['category'], unique=False)
+    op.create_index('ix_item_owner_id_category', 'item', ['owner_id', 'category'], unique=False)
+    op.drop_index(op.f('ix_category_id'), table_name='category')
+    op.drop_table('category')
@@ -0,0 +1,42 @@
+"""Add tombstone table and sync indexes
+
+Revision ID: c4d2e7f91a36
+Revises: 8a1f3c2d9b47
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d2e7f91a36'
+down_revision = '8a1f3c2d9b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tombstone',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(length=16), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tombstone_id'), 'tombstone', ['id'], unique=False)
+    op.create_index('ix_tombstone_owner_id_deleted_at', 'tombstone', ['owner_id', 'deleted_at'], unique=False)
+    op.create_index('ix_item_owner_id_updated_at', 'item', ['owner_id', 'updated_at'], unique=False)
+    op.create_index('ix_location_owner_id_updated_at', 'location', ['owner_id', 'updated_at'], unique=False)
+    op.create_index('ix_reminder_owner_id_updated_at', 'reminder', ['owner_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_reminder_owner_id_updated_at', table_name='reminder')
+    op.drop_index('ix_location_owner_id_updated_at', table_name='location')
+    op.drop_index('ix_item_owner_id_updated_at', table_name='item')
+    op.drop_index('ix_tombstone_owner_id_deleted_at', table_name='tombstone')
+    op.drop_index(op.f('ix_tombstone_id'), table_name='tombstone')
+    op.drop_table('tombstone')
@@ -0,0 +1,78 @@
+"""Add item search tokens and full-text index
+
+Revision ID: e7b3a9c1d2f4
+Revises: c4d2e7f91a36
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import SQLITE_FTS_CREATE, SQLITE_FTS_DROP, search_tokens
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3a9c1d2f4'
+down_revision = 'c4d2e7f91a36'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = (
+    "(setweight(to_tsvector('simple'::regconfig, name_tokens), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, description_tokens), 'B'))"
+)
+
+
+def upgrade():
+    op.add_column('item', sa.Column('name_tokens', sa.Text(), server_default='', nullable=False))
+    op.add_column('item', sa.Column('description_tokens', sa.Text(), server_default='', nullable=False))
+
+    # 分词在应用中完成，为已有物品回填词元
+    bind = op.get_bind()
+    item = sa.table(
+        'item',
+        sa.column('id', sa.Integer),
+        sa.column('name', sa.String),
+        sa.column('description', sa.Text),
+        sa.column('name_tokens', sa.Text),
+        sa.column('description_tokens', sa.Text),
+    )
+    rows = bind.execute(sa.select(item.c.id, item.c.name, item.c.description)).all()
+    if rows:
+        bind.execute(
+            item.update()
+            .where(item.c.id == sa.bindparam('row_id'))
+            .values(
+                name_tokens=sa.bindparam('name_value'),
+                description_tokens=sa.bindparam('description_value'),
+            ),
+            [
+                {
+                    'row_id': row.id,
+                    'name_value': search_tokens(row.name),
+                    'description_value': search_tokens(row.description),
+                }
+                for row in rows
+            ],
+        )
+
+    if bind.dialect.name == 'postgresql':
+        op.create_index(
+            'ix_item_search_vector', 'item', [sa.text(SEARCH_VECTOR)], postgresql_using='gin'
+        )
+    elif bind.dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_CREATE:
+            op.execute(statement)
+        op.execute("INSERT INTO item_fts(item_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_item_search_vector', table_name='item')
+    elif bind.dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_DROP:
+            op.execute(statement)
+    with op.batch_alter_table('item') as batch_op:
+        batch_op.drop_column('description_tokens')
+        batch_op.drop_column('name_tokens')
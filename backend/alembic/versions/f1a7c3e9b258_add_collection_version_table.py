@@ -0,0 +1,31 @@
+"""Add per-user collection version table
+
+Revision ID: f1a7c3e9b258
+Revises: b2e6f4a8c931
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a7c3e9b258'
+down_revision = 'b2e6f4a8c931'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 已有用户没有版本行时版本号为 0，第一次写入后开始递增
+    op.create_table('collection_version',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('collection', sa.String(length=16), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('owner_id', 'collection')
+    )
+
+
+def downgrade():
+    op.drop_table('collection_version')
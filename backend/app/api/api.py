@@ -1,13 +1,18 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import items, auth, locations, reminders, health, stats, uploads
+from app.api.endpoints import (
+    items, auth, categories, locations, reminders, health, stats, uploads, sync, suggest,
+)
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
+api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(locations.router, prefix="/locations", tags=["locations"])
 api_router.include_router(reminders.router, prefix="/reminders", tags=["reminders"])
 api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
+api_router.include_router(suggest.router, prefix="/suggest", tags=["suggest"])
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
 
@@ -1,37 +1,62 @@
-from typing import Generator
+from typing import Any, Generator, Optional, Sequence, Tuple, Type
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.core import security
 from app.core.settings import settings
-from app.db.session import get_db
+from app.db import session as db_session
+from app.core.cache import user_cache
+from app.core.revocation import revocation_list
+from app.crud.pagination import PageParams, PaginationError, resolve_page
+from app.db.routing import bind_user, recent_writes
+from app.db.session import get_db, get_async_db, get_replica_db, get_async_replica_db
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> models.User:
+def _decode_token(token: str) -> schemas.TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        token_data = schemas.TokenPayload(**payload)
+        return schemas.TokenPayload(**payload)
     except (jwt.JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+
+
+def _check_not_revoked(user_id: int, token_data: schemas.TokenPayload) -> None:
+    if revocation_list.is_revoked(user_id, token_data.iat):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+
+
+def _load_user(db: Session, token_data: schemas.TokenPayload) -> models.User:
     user = crud.user.get_by_username(db, username=token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    _check_not_revoked(user.id, token_data)
+    return user
+
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> models.User:
+    user = _load_user(db, _decode_token(token))
+    # 该会话上提交的写操作会让用户进入从库粘滞窗口
+    bind_user(db, user.id)
     return user
 
 
@@ -40,4 +65,163 @@ def get_current_active_user(
 ) -> models.User:
     if not crud.user.is_active(current_user):
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user 
\ No newline at end of file
+    return current_user
+
+
+def _stateless_principal(token_data: schemas.TokenPayload) -> Optional[schemas.UserPrincipal]:
+    """
+    开启 STATELESS_AUTH 且令牌带有 uid/act 声明时直接构造用户快照，不查询用户表；
+    停用和改密通过进程内吊销名单检查
+    """
+    if not settings.STATELESS_AUTH or token_data.uid is None or token_data.act is None:
+        return None
+    _check_not_revoked(token_data.uid, token_data)
+    return schemas.UserPrincipal(
+        id=token_data.uid,
+        username=token_data.sub,
+        is_active=token_data.act and not revocation_list.is_deactivated(token_data.uid),
+    )
+
+
+def _cached_principal(token_data: schemas.TokenPayload) -> Optional[schemas.UserPrincipal]:
+    """
+    用户快照缓存，未命中时返回 None。快照与会话分离，用户更新/停用时由 crud.user 失效
+    """
+    principal = user_cache.get(token_data.sub)
+    if principal is not None:
+        _check_not_revoked(principal.id, token_data)
+    return principal
+
+
+def _cache_principal(token_data: schemas.TokenPayload, user: models.User) -> schemas.UserPrincipal:
+    principal = schemas.UserPrincipal.model_validate(user)
+    user_cache.set(token_data.sub, principal)
+    return principal
+
+
+def get_current_principal(
+    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> schemas.UserPrincipal:
+    """
+    只需要用户ID的端点使用的轻量认证：无状态令牌直接由声明构造，
+    否则使用带 TTL 的用户快照缓存，未命中时才查询用户表
+    """
+    token_data = _decode_token(token)
+    principal = _stateless_principal(token_data) or _cached_principal(token_data)
+    if principal is None:
+        principal = _cache_principal(token_data, _load_user(db, token_data))
+    bind_user(db, principal.id)
+    return principal
+
+
+def get_current_active_principal(
+    current_user: schemas.UserPrincipal = Depends(get_current_principal),
+) -> schemas.UserPrincipal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
+async def get_async_principal(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
+) -> schemas.UserPrincipal:
+    """
+    get_current_principal 的异步版本，供 async def 端点使用：缓存未命中时通过
+    AsyncSession 查询用户表，不占用线程池，也不为请求额外签出同步连接
+    """
+    token_data = _decode_token(token)
+    principal = _stateless_principal(token_data) or _cached_principal(token_data)
+    if principal is None:
+        user = await crud.user.aget_by_username(db, username=token_data.sub)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        _check_not_revoked(user.id, token_data)
+        principal = _cache_principal(token_data, user)
+    bind_user(db, principal.id)
+    return principal
+
+
+async def get_async_active_principal(
+    current_user: schemas.UserPrincipal = Depends(get_async_principal),
+) -> schemas.UserPrincipal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
+def _use_replica(user: schemas.UserPrincipal) -> bool:
+    return db_session.replica_enabled and not recent_writes.is_sticky(user.id)
+
+
+async def get_read_db(
+    current_user: schemas.UserPrincipal = Depends(get_current_active_principal),
+    db: Session = Depends(get_db),
+    replica_db: Session = Depends(get_replica_db),
+) -> Session:
+    """
+    只读查询使用的会话：优先走从库，用户刚写入过数据时走主库
+    （会话在首次执行语句时才签出连接，未选中的会话没有开销；
+    定义为 async def 以免为纯内存判断占用线程池）
+    """
+    return replica_db if _use_replica(current_user) else db
+
+
+async def get_async_read_db(
+    current_user: schemas.UserPrincipal = Depends(get_async_active_principal),
+    db: AsyncSession = Depends(get_async_db),
+    replica_db: AsyncSession = Depends(get_async_replica_db),
+) -> AsyncSession:
+    """
+    get_read_db 的异步版本
+    """
+    return replica_db if _use_replica(current_user) else db
+
+
+class Pagination:
+    """
+    列表接口的分页参数依赖：兼容旧的 skip/limit，同时支持不透明的 cursor 与 sort
+    （"field" 升序，"-field" 降序）。
+    """
+
+    def __init__(self, sortable_fields: Sequence[str], model: Optional[Type[Any]] = None) -> None:
+        self.sortable_fields = tuple(sortable_fields)
+        # 用于按排序列的类型校验游标中的值
+        self.model = model
+
+    def __call__(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> PageParams:
+        try:
+            return resolve_page(
+                skip=skip, limit=limit, cursor=cursor, sort=sort,
+                allowed=self.sortable_fields, model=self.model,
+            )
+        except PaginationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+
+class FieldSelection:
+    """
+    稀疏字段集依赖：fields=name,category,quantity 只返回（并只从数据库加载）所选字段，
+    id 始终包含。未指定时返回 None，表示返回完整对象。
+    """
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        self.schema = schema
+
+    def __call__(self, fields: Optional[str] = None) -> Optional[Tuple[str, ...]]:
+        if not fields:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(self.schema.model_fields)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        # 按模型中的字段顺序输出
+        return tuple(name for name in self.schema.model_fields if name in requested | {"id"})
@@ -1,7 +1,8 @@
+import math
 from datetime import timedelta
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -9,30 +10,82 @@ from app import crud, models, schemas
 from app.api import deps
 from app.core import security
 from app.core.settings import settings
+from app.core.throttle import login_throttle
 
 router = APIRouter()
 
 
 @router.post("/login", response_model=schemas.Token)
 def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
+    client_ip = login_throttle.client_ip(
+        request.client.host if request.client else None, request.headers.get("x-forwarded-for")
+    )
+    if settings.LOGIN_THROTTLE_ENABLED:
+        # 被限流的请求在查询用户和校验密码之前直接拒绝
+        retry_after = login_throttle.retry_after(form_data.username, client_ip)
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts, please try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
     user = crud.user.authenticate(
         db, username=form_data.username, password=form_data.password
     )
     if not user:
+        if settings.LOGIN_THROTTLE_ENABLED:
+            login_throttle.record_failure(form_data.username, client_ip)
         raise HTTPException(status_code=400, detail="Incorrect username or password")
     elif not crud.user.is_active(user):
         raise HTTPException(status_code=400, detail="Inactive user")
+    if settings.LOGIN_THROTTLE_ENABLED:
+        login_throttle.record_success(form_data.username, client_ip)
+    refresh_token = crud.refresh_token.issue(db, user_id=user.id, commit=False)
+    # 先生成响应再提交，避免提交后 user 过期触发重新加载
+    response = _token_response(user, refresh_token)
+    db.commit()
+    return response
+
+
+@router.post("/refresh", response_model=schemas.Token)
+def refresh_access_token(
+    *,
+    db: Session = Depends(deps.get_db),
+    token_in: schemas.RefreshTokenRequest,
+) -> Any:
+    """
+    Exchange a refresh token for a new access token and a rotated refresh token.
+    Reusing an already rotated refresh token revokes the whole token family.
+    """
+    rotated = crud.refresh_token.rotate(db, token=token_in.refresh_token)
+    if not rotated:
+        raise HTTPException(status_code=403, detail="Invalid refresh token")
+    old_token, new_refresh_token = rotated
+    user = crud.user.get(db, id=old_token.user_id)
+    if not user or not crud.user.is_active(user):
+        crud.refresh_token.revoke_family(db, family_id=old_token.family_id)
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return _token_response(user, new_refresh_token)
+
+
+def _token_response(user: models.User, refresh_token: str) -> dict:
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": security.create_access_token(
-            user.username, expires_delta=access_token_expires
+            user.username,
+            expires_delta=access_token_expires,
+            user_id=user.id,
+            is_active=user.is_active,
         ),
         "token_type": "bearer",
+        "refresh_token": refresh_token,
     }
 
 
@@ -0,0 +1,70 @@
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.api import deps
+from app.api.etag import check_etag
+from app.crud.pagination import PageParams
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[schemas.Category])
+async def read_categories(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: PageParams = Depends(deps.Pagination(crud.category.sortable_fields, crud.category.model)),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    当前用户仍有物品引用的类别，默认按名称排列。类别在写入物品时按名称自动创建
+    """
+    # 列表只包含有物品引用的类别，物品集合的变化也会改变结果
+    not_modified = check_etag(
+        request,
+        response,
+        current_user.id,
+        await crud.category.acollection_version(db, owner_id=current_user.id),
+        await crud.item.acollection_version(db, owner_id=current_user.id),
+    )
+    if not_modified:
+        return not_modified
+
+    categories = await crud.category.aget_multi_by_owner(db, owner_id=current_user.id, **page.kwargs)
+    next_cursor = crud.category.next_cursor(
+        categories, limit=page.limit, sort=page.sort, default_sort="name"
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return categories
+
+
+@router.put("/{id}", response_model=schemas.Category)
+def rename_category(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    category_in: schemas.CategoryUpdate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    类别改名：只修改类别表中的一行，所有引用该类别的物品随之显示新名称
+    （物品行不变；物品列表的 ETag 包含类别集合的版本号，增量同步下发类别的变更）
+    """
+    try:
+        category = crud.category.update_owned(
+            db, id=id, owner_id=current_user.id, obj_in=category_in
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Category already exists")
+    if category is None:
+        if crud.category.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+        raise HTTPException(status_code=404, detail="Category not found")
+    return category
@@ -4,7 +4,11 @@ from datetime import datetime
 from sqlalchemy import text
 
 from app.api import deps
-from app.db.session import engine
+from app.core.admission import admission_controller
+from app.core.cache import user_cache
+from app.db.pool import pool_status
+from app.db import session as db_session
+from app.db.session import async_engine, engine
 
 router = APIRouter()
 
@@ -29,7 +33,33 @@ def db_health_check(db: Session = Depends(deps.get_db)):
             "status": "ok", 
             "message": "数据库连接正常",
             "database": "connected",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            "pool": pool_status(engine),
         }
     except Exception as e:
-        return {"status": "error", "message": f"数据库连接异常: {str(e)}"} 
\ No newline at end of file
+        return {"status": "error", "message": f"数据库连接异常: {str(e)}"}
+
+
+@router.get("/health/db/pool", status_code=200)
+def db_pool_status():
+    """
+    连接池状态：容量、当前签出/溢出连接数，以及累计签出次数、等待时间和超时次数
+    """
+    status = {
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine.sync_engine),
+        "admission": admission_controller.snapshot(),
+        "timestamp": datetime.now().isoformat(),
+    }
+    if db_session.replica_enabled:
+        status["replica_sync"] = pool_status(db_session.replica_engine)
+        status["replica_async"] = pool_status(db_session.async_replica_engine.sync_engine)
+    return status
+
+
+@router.get("/health/cache", status_code=200)
+def cache_status():
+    """
+    进程内缓存的命中/未命中统计
+    """
+    return {"user": user_cache.stats()}
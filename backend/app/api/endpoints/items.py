@@ -1,60 +1,366 @@
-from typing import Any, List, Optional
+import os
+import tempfile
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
+from app.api.etag import check_etag
+from app.api.projection import serialize_list
+from app.core.export import iter_csv, iter_xlsx
+from app.core.facets import facet_cache
+from app.core.importer import IMPORT_FORMATS, ImportFileError, ImportJob, import_jobs, read_rows
+from app.core.settings import settings
+from app.crud.crud_item import ItemFilter
+from app.crud.pagination import PageParams
+from app.db.routing import bind_user
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[schemas.Item])
-def read_items(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+def item_filter(
     category: Optional[str] = None,
     categories: Optional[str] = None,
     location_id: Optional[int] = None,
+    include_sublocations: bool = False,
     search: Optional[str] = None,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    purchased_after: Optional[datetime] = None,
+    purchased_before: Optional[datetime] = None,
+    expires_after: Optional[datetime] = None,
+    expires_before: Optional[datetime] = None,
+) -> ItemFilter:
+    """
+    物品列表和分面计数共用的筛选参数
+    """
+    # 优先使用 categories 参数，兼容旧版单类别筛选
+    if categories:
+        categories_list = tuple(cat.strip() for cat in categories.split(','))
+    else:
+        categories_list = (category,) if category else ()
+    return ItemFilter(
+        categories=categories_list,
+        location_id=location_id,
+        include_sublocations=include_sublocations,
+        search=search or None,
+        min_price=min_price,
+        max_price=max_price,
+        purchased_after=purchased_after,
+        purchased_before=purchased_before,
+        expires_after=expires_after,
+        expires_before=expires_before,
+    )
+
+
+@router.get("/", response_model=List[schemas.Item])
+async def read_items(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: PageParams = Depends(deps.Pagination(crud.item.sortable_fields, crud.item.model)),
+    fields: Optional[Tuple[str, ...]] = Depends(deps.FieldSelection(schemas.Item)),
+    filters: ItemFilter = Depends(item_filter),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Retrieve items.
-    
+
+    以下筛选条件可以任意组合，在同一条 SQL 中完成：
+
     - **categories**: 可选，多个类别，用逗号分隔 (例如: "类别1,类别2,类别3")
-    - **category**: 可选，单一类别 (兼容旧版接口)
+    - **category**: 可选，单一类别 (兼容旧版接口，与 categories 同时提供时忽略)
     - **location_id**: 可选，位置ID
-    - **search**: 可选，搜索关键词，会匹配物品名称和描述
+    - **include_sublocations**: 可选，为 true 时同时包含 location_id 的所有子位置
+    - **search**: 可选，搜索关键词，会匹配物品名称和描述（支持中文），未指定 sort 时按相关度排序
+    - **min_price** / **max_price**: 可选，价格区间（含端点）
+    - **purchased_after** / **purchased_before**: 可选，购买日期区间（含端点）
+    - **expires_after** / **expires_before**: 可选，过期日期区间（含端点）
+    - **sort**: 可选，排序字段，前缀 "-" 表示降序 (例如: "-created_at")
+    - **cursor**: 可选，上一页响应头 X-Next-Cursor 的值；提供时忽略 skip
+    - **fields**: 可选，只返回指定字段，用逗号分隔 (例如: "name,category,quantity,image_url")
+
+    响应带 ETag；集合未变化时 If-None-Match 请求只执行一次版本查询并返回 304
     """
-    # 处理多类别筛选（优先使用categories参数）
-    if categories:
-        categories_list = [cat.strip() for cat in categories.split(',')]
-        if categories_list:
-            items = crud.item.get_by_categories(
-                db, categories=categories_list, owner_id=current_user.id, skip=skip, limit=limit
-            )
-            return items
-    
-    # 兼容旧版单类别筛选
-    if category:
-        items = crud.item.get_by_category(
-            db, category=category, owner_id=current_user.id, skip=skip, limit=limit
-        )
-    elif location_id:
-        items = crud.item.get_by_location(
-            db, location_id=location_id, owner_id=current_user.id, skip=skip, limit=limit
-        )
-    elif search:
-        items = crud.item.search_by_name(
-            db, name=search, owner_id=current_user.id, skip=skip, limit=limit
-        )
-    else:
-        items = crud.item.get_multi_by_owner(
-            db, owner_id=current_user.id, skip=skip, limit=limit
+    # 物品显示类别名称，类别改名不修改物品行，类别集合的版本号同样参与 ETag
+    not_modified = check_etag(
+        request,
+        response,
+        current_user.id,
+        await crud.item.acollection_version(db, owner_id=current_user.id),
+        await crud.category.acollection_version(db, owner_id=current_user.id),
+    )
+    if not_modified:
+        return not_modified
+
+    items = await crud.item.aget_filtered(
+        db, filters=filters, owner_id=current_user.id, **page.kwargs, fields=fields
+    )
+
+    # 搜索结果默认按相关度排序，不提供游标（指定 sort 后才可使用游标翻页）
+    ranked = bool(filters.search) and not page.sort
+    next_cursor = None if ranked else crud.item.next_cursor(items, limit=page.limit, sort=page.sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return serialize_list(items, schemas.Item, response, fields)
+
+
+@router.get("/facets", response_model=schemas.ItemFacets)
+async def read_item_facets(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    filters: ItemFilter = Depends(item_filter),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    分面计数：符合筛选条件的物品总数，以及按类别、按位置和按临期分组的数量，
+    筛选参数与物品列表（GET /items）相同。
+
+    所有分组计数由一条 SQL 完成；结果按用户和筛选条件缓存，该用户写入数据后失效
+    """
+    now = datetime.utcnow()
+    key = facet_cache.key(current_user.id, (filters, now.strftime("%Y%m%d%H%M")))
+    facets = facet_cache.get(key)
+    if facets is None:
+        facets = await crud.item.aget_facets(
+            db, filters=filters, owner_id=current_user.id, now=now
         )
-    return items
+        facet_cache.set(key, facets)
+    return facets
+
+
+@router.get("/expiring", response_model=schemas.ExpiringItems)
+async def read_expiring_items(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: PageParams = Depends(deps.Pagination(crud.item.sortable_fields, crud.item.model)),
+    bucket: Literal["expired", "7d", "30d", "90d"] = "7d",
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    临期物品：返回各分组的物品数量，以及所选分组中的一页物品。
+
+    - **bucket**: expired（已过期）、7d / 30d / 90d（今后 N 天内过期，累计区间），默认 7d
+    - **sort** / **cursor** / **limit**: 同物品列表，默认按过期时间从早到晚排列
+
+    数量由一次聚合查询得到；ETag 随物品集合变化，并按分钟失效
+    """
+    now = datetime.utcnow()
+    not_modified = check_etag(
+        request,
+        response,
+        current_user.id,
+        await crud.item.acollection_version(db, owner_id=current_user.id),
+        await crud.category.acollection_version(db, owner_id=current_user.id),
+        now.strftime("%Y%m%d%H%M"),
+    )
+    if not_modified:
+        return not_modified
+
+    counts = await crud.item.aget_expiry_counts(db, owner_id=current_user.id, now=now)
+    items = await crud.item.aget_expiring(
+        db, owner_id=current_user.id, bucket=bucket, now=now, **page.kwargs
+    )
+    return {
+        "counts": counts,
+        "bucket": bucket,
+        "items": items,
+        "next_cursor": crud.item.next_cursor(
+            items, limit=page.limit, sort=page.sort, default_sort="expiry_date"
+        ),
+    }
+
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+@router.get("/export")
+async def export_items(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    export_format: Literal["csv", "xlsx"] = Query("csv", alias="format"),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    导出当前用户的全部物品（CSV 或 XLSX），位置列为完整的位置路径。
+
+    数据通过服务端游标分批读取并边读边写入响应，内存占用与物品数量无关
+    """
+    batches = crud.item.astream_export(
+        db, owner_id=current_user.id, batch_size=settings.EXPORT_BATCH_SIZE
+    )
+    body = iter_csv(batches) if export_format == "csv" else iter_xlsx(batches)
+    filename = f"items-{datetime.utcnow():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# 保存导入文件时每次读取的字节数
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+
+
+def _import_format(file: UploadFile) -> Optional[str]:
+    extension = os.path.splitext(file.filename or "")[1].lower().lstrip(".")
+    if extension in IMPORT_FORMATS:
+        return extension
+    content_type = (file.content_type or "").split(";")[0]
+    for file_format in IMPORT_FORMATS:
+        if EXPORT_MEDIA_TYPES[file_format].split(";")[0] == content_type:
+            return file_format
+    return None
+
+
+def _save_upload(file: UploadFile, suffix: str) -> str:
+    """
+    将上传的文件分块复制到临时文件并返回路径；超过 IMPORT_MAX_BYTES 时停止复制、
+    删除临时文件并返回 413
+    """
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as buffer:
+        try:
+            while block := file.file.read(UPLOAD_BLOCK_SIZE):
+                size += len(block)
+                if size > settings.IMPORT_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Import file is larger than {settings.IMPORT_MAX_BYTES} bytes",
+                    )
+                buffer.write(block)
+        except BaseException:
+            buffer.close()
+            os.remove(buffer.name)
+            raise
+    return buffer.name
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+
+def _import_chunk(db: Session, job: ImportJob, chunk: List[Tuple[int, Dict[str, Any]]]) -> None:
+    """
+    校验并写入一批行：先逐行校验，再用一次查询解析整批的位置路径/名称
+    （以及一次查询校验整批的 location_id），最后整批写入并提交
+    """
+    parsed = []
+    for line, row in chunk:
+        location = row.pop("location", None)
+        try:
+            obj_in = schemas.ItemCreate.model_validate(row)
+        except ValidationError as e:
+            job.add_error(line, _validation_detail(e))
+            continue
+        parsed.append((line, location, obj_in))
+
+    names = {location for _, location, _ in parsed if location is not None}
+    resolved = crud.location.resolve_paths(db, names=names, owner_id=job.owner_id)
+    location_ids = [
+        obj_in.location_id for _, location, obj_in in parsed
+        if location is None and obj_in.location_id is not None
+    ]
+    owned_locations = crud.location.get_owned_ids(db, ids=location_ids, owner_id=job.owner_id)
+
+    valid = []
+    for line, location, obj_in in parsed:
+        if location is not None:
+            if location not in resolved:
+                job.add_error(line, "Location not found")
+                continue
+            if resolved[location] is None:
+                job.add_error(line, "Ambiguous location name, use the full path")
+                continue
+            obj_in.location_id = resolved[location]
+        elif obj_in.location_id is not None and obj_in.location_id not in owned_locations:
+            job.add_error(line, "Location not found")
+            continue
+        valid.append(obj_in)
+
+    job.imported += crud.item.load_multi(db, objs_in=valid, owner_id=job.owner_id)
+    job.processed += len(chunk)
+
+
+def _run_import(job: ImportJob, path: str, file_format: str, bind: Engine) -> None:
+    """
+    后台导入任务：每 IMPORT_CHUNK_SIZE 行为一批，每批单独提交，进度随批次更新
+    """
+    job.status = "running"
+    db = Session(bind=bind)
+    bind_user(db, job.owner_id)
+    try:
+        rows = read_rows(path, file_format)
+        while True:
+            chunk = list(islice(rows, settings.IMPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+            _import_chunk(db, job, chunk)
+        job.finish("completed")
+    except ImportFileError as e:
+        db.rollback()
+        job.finish("failed", str(e))
+    except Exception:
+        db.rollback()
+        job.finish("failed", "Import failed")
+        raise
+    finally:
+        db.close()
+        os.remove(path)
+        import_jobs.finish(job)
+
+
+@router.post("/import", response_model=schemas.ItemImportJob, status_code=202)
+def import_items(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    background_tasks: BackgroundTasks,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    从 CSV 或 XLSX 导入物品，表头与导出文件一致（location 列可以是位置路径或唯一的位置名称）。
+
+    文件大小不能超过 IMPORT_MAX_BYTES（否则返回 413），保存到临时文件后立即返回导入任务，由后台任务分批校验和写入；
+    通过 GET /items/import/{job_id} 查询进度和出错的行
+    """
+    file_format = _import_format(file)
+    if file_format is None:
+        raise HTTPException(status_code=400, detail="Only CSV or XLSX files can be imported")
+    path = _save_upload(file, f".{file_format}")
+    job = ImportJob(owner_id=current_user.id)
+    import_jobs.start(job)
+    background_tasks.add_task(_run_import, job, path, file_format, db.get_bind())
+    return job
+
+
+@router.get("/import/{job_id}", response_model=schemas.ItemImportJob)
+def read_import_job(
+    *,
+    job_id: str,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    查询导入任务的进度和出错的行
+    """
+    job = import_jobs.get(job_id)
+    if job is None or job.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
 
 
 @router.post("/", response_model=schemas.Item)
@@ -62,7 +368,7 @@ def create_item(
     *,
     db: Session = Depends(deps.get_db),
     item_in: schemas.ItemCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new item.
@@ -71,22 +377,101 @@ def create_item(
     return item
 
 
-@router.get("/{id}", response_model=schemas.Item)
-def read_item(
+def _missing_ids(ids: List[int], rows: List[Any]) -> List[schemas.BulkError]:
+    found = {row.id for row in rows}
+    return [
+        schemas.BulkError(index=index, id=item_id, detail="Item not found")
+        for index, item_id in enumerate(ids)
+        if item_id not in found
+    ]
+
+
+@router.post("/bulk", response_model=schemas.ItemBulkResult)
+def create_items_bulk(
     *,
     db: Session = Depends(deps.get_db),
+    bulk_in: schemas.ItemBulkCreate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    批量创建物品：一条多行 INSERT ... RETURNING，整批一次提交。
+    位置不存在或不属于当前用户的行不会写入，并在 errors 中按下标返回。
+    """
+    location_ids = [obj.location_id for obj in bulk_in.items if obj.location_id is not None]
+    owned_locations = crud.location.get_owned_ids(db, ids=location_ids, owner_id=current_user.id)
+    valid, errors = [], []
+    for index, obj in enumerate(bulk_in.items):
+        if obj.location_id is not None and obj.location_id not in owned_locations:
+            errors.append(schemas.BulkError(index=index, detail="Location not found"))
+        else:
+            valid.append(obj)
+    rows = crud.item.create_multi(db, objs_in=valid, owner_id=current_user.id)
+    return schemas.ItemBulkResult(
+        items=[schemas.Item.model_validate(row, from_attributes=True) for row in rows], errors=errors
+    )
+
+
+@router.patch("/bulk", response_model=schemas.ItemBulkResult)
+def update_items_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    bulk_in: schemas.ItemBulkUpdate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    批量修改物品：对 ids 中属于当前用户的物品应用同一组修改（如批量移动位置、改类别），
+    一条 UPDATE ... RETURNING 完成；不存在或无权限的ID在 errors 中返回。
+    """
+    changes = bulk_in.changes
+    if "location_id" in changes.model_fields_set and changes.location_id is not None:
+        if not crud.location.get_owned_ids(db, ids=[changes.location_id], owner_id=current_user.id):
+            raise HTTPException(status_code=404, detail="Location not found")
+    rows = crud.item.update_multi(
+        db, ids=bulk_in.ids, owner_id=current_user.id, obj_in=changes
+    )
+    return schemas.ItemBulkResult(
+        items=[schemas.Item.model_validate(row, from_attributes=True) for row in rows],
+        errors=_missing_ids(bulk_in.ids, rows),
+    )
+
+
+@router.delete("/bulk", response_model=schemas.ItemBulkResult)
+def delete_items_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    bulk_in: schemas.ItemBulkDelete,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    批量删除物品：一条 DELETE ... RETURNING，返回被删除的物品；
+    不存在或无权限的ID在 errors 中返回。
+    """
+    rows = crud.item.remove_multi(db, ids=bulk_in.ids, owner_id=current_user.id)
+    return schemas.ItemBulkResult(
+        items=[schemas.Item.model_validate(row, from_attributes=True) for row in rows],
+        errors=_missing_ids(bulk_in.ids, rows),
+    )
+
+
+@router.get("/{id}", response_model=schemas.Item)
+async def read_item(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Get item by ID.
     """
-    item = crud.item.get(db=db, id=id)
+    item = await crud.item.aget(db=db, id=id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if item.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    return item
+    # 类别改名只修改类别行，ETag 同时包含类别的修改时间
+    return check_etag(request, response, item.updated_at, item.category_updated_at) or item
 
 
 @router.put("/{id}", response_model=schemas.Item)
@@ -95,17 +480,16 @@ def update_item(
     db: Session = Depends(deps.get_db),
     id: int,
     item_in: schemas.ItemUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update an item.
     """
-    item = crud.item.get(db=db, id=id)
-    if not item:
+    item = crud.item.update_owned(db, id=id, owner_id=current_user.id, obj_in=item_in)
+    if item is None:
+        if crud.item.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Item not found")
-    if item.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    item = crud.item.update(db=db, db_obj=item, obj_in=item_in)
     return item
 
 
@@ -114,15 +498,14 @@ def delete_item(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete an item.
     """
-    item = crud.item.get(db=db, id=id)
-    if not item:
+    item = crud.item.remove_owned(db, id=id, owner_id=current_user.id)
+    if item is None:
+        if crud.item.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Item not found")
-    if item.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    item = crud.item.remove(db=db, id=id)
     return item 
\ No newline at end of file
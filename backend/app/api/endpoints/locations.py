@@ -1,45 +1,69 @@
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
+from app.api.etag import check_etag
+from app.api.projection import serialize_list
+from app.crud.pagination import PageParams
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.Location])
-def read_locations(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+async def read_locations(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: PageParams = Depends(deps.Pagination(crud.location.sortable_fields, crud.location.model)),
+    fields: Optional[Tuple[str, ...]] = Depends(deps.FieldSelection(schemas.Location)),
     parent_id: Optional[int] = None,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Retrieve locations.
+
+    不按 parent_id 筛选时支持分页：sort 指定排序字段，cursor 为上一页响应头 X-Next-Cursor 的值；
+    fields 可只返回指定字段
     """
+    version = await crud.location.acollection_version(db, owner_id=current_user.id)
+    not_modified = check_etag(request, response, current_user.id, version)
+    if not_modified:
+        return not_modified
+
     if parent_id is not None:
-        locations = crud.location.get_multi_by_parent(
+        locations = await crud.location.aget_multi_by_parent(
             db, parent_id=parent_id, owner_id=current_user.id
         )
-    else:
-        locations = crud.location.get_multi_by_owner(
-            db, owner_id=current_user.id, skip=skip, limit=limit
-        )
-    return locations
+        return serialize_list(locations, schemas.Location, response, fields)
+    locations = await crud.location.aget_multi_by_owner(
+        db, owner_id=current_user.id, **page.kwargs, fields=fields
+    )
+    next_cursor = crud.location.next_cursor(locations, limit=page.limit, sort=page.sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return serialize_list(locations, schemas.Location, response, fields)
 
 
 @router.get("/tree", response_model=List[schemas.LocationTree])
-def read_location_tree(
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+async def read_location_tree(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Retrieve location tree.
     """
-    return crud.location.get_location_tree(db, owner_id=current_user.id)
+    version = await crud.location.acollection_version(db, owner_id=current_user.id)
+    not_modified = check_etag(request, response, current_user.id, version)
+    if not_modified:
+        return not_modified
+    tree = await crud.location.aget_location_tree(db, owner_id=current_user.id)
+    return serialize_list(tree, schemas.LocationTree, response)
 
 
 @router.post("/", response_model=schemas.Location)
@@ -47,7 +71,7 @@ def create_location(
     *,
     db: Session = Depends(deps.get_db),
     location_in: schemas.LocationCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new location.
@@ -57,21 +81,23 @@ def create_location(
 
 
 @router.get("/{id}", response_model=schemas.Location)
-def read_location(
+async def read_location(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Get location by ID.
     """
-    location = crud.location.get(db=db, id=id)
+    location = await crud.location.aget(db=db, id=id)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
     if location.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    return location
+    return check_etag(request, response, location.updated_at) or location
 
 
 @router.put("/{id}", response_model=schemas.Location)
@@ -80,17 +106,16 @@ def update_location(
     db: Session = Depends(deps.get_db),
     id: int,
     location_in: schemas.LocationUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a location.
     """
-    location = crud.location.get(db=db, id=id)
-    if not location:
+    location = crud.location.update_owned(db, id=id, owner_id=current_user.id, obj_in=location_in)
+    if location is None:
+        if crud.location.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Location not found")
-    if location.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    location = crud.location.update(db=db, db_obj=location, obj_in=location_in)
     return location
 
 
@@ -99,32 +124,31 @@ def delete_location(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a location.
     """
-    location = crud.location.get(db=db, id=id)
-    if not location:
+    location = crud.location.remove_empty_owned(db, id=id, owner_id=current_user.id)
+    if location is not None:
+        return location
+
+    # 删除未成功时再查询具体原因
+    existing = crud.location.get(db=db, id=id)
+    if not existing:
         raise HTTPException(status_code=404, detail="Location not found")
-    if location.owner_id != current_user.id:
+    if existing.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+
     # Check if location has items
-    items = crud.item.get_by_location(db, location_id=id)
+    items = crud.item.get_by_location(db, location_id=id, limit=1)
     if items:
         raise HTTPException(
             status_code=400, 
             detail="Cannot delete location with items. Move or delete items first."
         )
-    
-    # Check if location has children
-    children = crud.location.get_multi_by_parent(db, parent_id=id, owner_id=current_user.id)
-    if children:
-        raise HTTPException(
-            status_code=400, 
-            detail="Cannot delete location with sub-locations. Delete sub-locations first."
-        )
-    
-    location = crud.location.remove(db=db, id=id)
-    return location 
\ No newline at end of file
+
+    raise HTTPException(
+        status_code=400, 
+        detail="Cannot delete location with sub-locations. Delete sub-locations first."
+    ) 
\ No newline at end of file
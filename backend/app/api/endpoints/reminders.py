@@ -1,45 +1,69 @@
-from typing import Any, List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
+from app.api.etag import check_etag
+from app.api.projection import serialize_list
+from app.crud.pagination import PageParams
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.Reminder])
-def read_reminders(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+async def read_reminders(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: PageParams = Depends(deps.Pagination(crud.reminder.sortable_fields, crud.reminder.model)),
+    fields: Optional[Tuple[str, ...]] = Depends(deps.FieldSelection(schemas.Reminder)),
     item_id: Optional[int] = None,
     due: bool = False,
     upcoming: bool = False,
     days: int = 7,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Retrieve reminders.
+
+    支持 sort 排序（到期/即将到期列表默认按 due_date）和 cursor 游标分页，
+    下一页游标通过响应头 X-Next-Cursor 返回；fields 可只返回指定字段
     """
+    version = await crud.reminder.acollection_version(db, owner_id=current_user.id)
+    # 到期/即将到期列表随时间变化，ETag 按分钟失效
+    time_bucket = datetime.utcnow().strftime("%Y%m%d%H%M") if due or upcoming else ""
+    not_modified = check_etag(request, response, current_user.id, version, time_bucket)
+    if not_modified:
+        return not_modified
+
+    default_sort = "id"
     if item_id:
-        reminders = crud.reminder.get_multi_by_item(
-            db, item_id=item_id, owner_id=current_user.id, skip=skip, limit=limit
+        reminders = await crud.reminder.aget_multi_by_item(
+            db, item_id=item_id, owner_id=current_user.id, **page.kwargs, fields=fields
         )
     elif due:
-        reminders = crud.reminder.get_due_reminders(
-            db, owner_id=current_user.id, skip=skip, limit=limit
+        default_sort = "due_date"
+        reminders = await crud.reminder.aget_due_reminders(
+            db, owner_id=current_user.id, **page.kwargs, fields=fields
         )
     elif upcoming:
-        reminders = crud.reminder.get_upcoming_reminders(
-            db, owner_id=current_user.id, days=days, skip=skip, limit=limit
+        default_sort = "due_date"
+        reminders = await crud.reminder.aget_upcoming_reminders(
+            db, owner_id=current_user.id, days=days, **page.kwargs, fields=fields
         )
     else:
-        reminders = crud.reminder.get_multi_by_owner(
-            db, owner_id=current_user.id, skip=skip, limit=limit
+        reminders = await crud.reminder.aget_multi_by_owner(
+            db, owner_id=current_user.id, **page.kwargs, fields=fields
         )
-    return reminders
+
+    next_cursor = crud.reminder.next_cursor(reminders, limit=page.limit, sort=page.sort, default_sort=default_sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return serialize_list(reminders, schemas.Reminder, response, fields)
 
 
 @router.post("/", response_model=schemas.Reminder)
@@ -47,7 +71,7 @@ def create_reminder(
     *,
     db: Session = Depends(deps.get_db),
     reminder_in: schemas.ReminderCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new reminder.
@@ -57,21 +81,23 @@ def create_reminder(
 
 
 @router.get("/{id}", response_model=schemas.Reminder)
-def read_reminder(
+async def read_reminder(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     Get reminder by ID.
     """
-    reminder = crud.reminder.get(db=db, id=id)
+    reminder = await crud.reminder.aget(db=db, id=id)
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
     if reminder.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    return reminder
+    return check_etag(request, response, reminder.updated_at) or reminder
 
 
 @router.put("/{id}", response_model=schemas.Reminder)
@@ -80,17 +106,16 @@ def update_reminder(
     db: Session = Depends(deps.get_db),
     id: int,
     reminder_in: schemas.ReminderUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a reminder.
     """
-    reminder = crud.reminder.get(db=db, id=id)
-    if not reminder:
+    reminder = crud.reminder.update_owned(db, id=id, owner_id=current_user.id, obj_in=reminder_in)
+    if reminder is None:
+        if crud.reminder.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Reminder not found")
-    if reminder.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    reminder = crud.reminder.update(db=db, db_obj=reminder, obj_in=reminder_in)
     return reminder
 
 
@@ -99,17 +124,16 @@ def delete_reminder(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a reminder.
     """
-    reminder = crud.reminder.get(db=db, id=id)
-    if not reminder:
+    reminder = crud.reminder.remove_owned(db, id=id, owner_id=current_user.id)
+    if reminder is None:
+        if crud.reminder.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Reminder not found")
-    if reminder.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    reminder = crud.reminder.remove(db=db, id=id)
     return reminder
 
 
@@ -118,15 +142,16 @@ def complete_reminder(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Mark a reminder as completed.
     """
-    reminder = crud.reminder.get(db=db, id=id)
-    if not reminder:
+    reminder = crud.reminder.update_owned(
+        db, id=id, owner_id=current_user.id, obj_in={"is_completed": True}
+    )
+    if reminder is None:
+        if crud.reminder.exists(db, id=id):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
         raise HTTPException(status_code=404, detail="Reminder not found")
-    if reminder.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    reminder = crud.reminder.mark_completed(db=db, reminder_id=id, owner_id=current_user.id)
     return reminder 
\ No newline at end of file
@@ -1,37 +1,61 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 
 from app import crud, models, schemas
 from app.api import deps
-from app.db.session import engine
+from app.api.etag import check_etag
+from app.crud.crud_item import ItemFilter
 
 router = APIRouter()
 
 
+def _check_stats_etag(
+    request: Request, response: Response, db: Session, owner_id: int
+) -> Optional[Response]:
+    # 统计依赖物品、类别、位置和提醒集合；到期提醒数随时间变化，ETag 按分钟失效
+    return check_etag(
+        request,
+        response,
+        owner_id,
+        crud.item.collection_version(db, owner_id=owner_id),
+        crud.category.collection_version(db, owner_id=owner_id),
+        crud.location.collection_version(db, owner_id=owner_id),
+        crud.reminder.collection_version(db, owner_id=owner_id),
+        datetime.utcnow().strftime("%Y%m%d%H%M"),
+    )
+
+
 @router.get("/dashboard", response_model=Dict[str, Any])
 def get_dashboard_stats(
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     获取仪表盘所需的统计数据
     """
-    # 获取物品、位置和提醒的基础数据
-    items = crud.item.get_multi_by_owner(db, owner_id=current_user.id)
+    not_modified = _check_stats_etag(request, response, db, current_user.id)
+    if not_modified:
+        return not_modified
+
+    # 获取物品、位置和提醒的基础数据；物品总数和分类统计由一条 GROUP BY 查询得到
+    facets = crud.item.get_facets(
+        db, filters=ItemFilter(), owner_id=current_user.id, now=datetime.utcnow()
+    )
     locations = crud.location.get_multi_by_owner(db, owner_id=current_user.id)
     due_reminders = crud.reminder.get_due_reminders(db, owner_id=current_user.id)
     upcoming_reminders = crud.reminder.get_upcoming_reminders(db, owner_id=current_user.id)
 
-    # 计算物品分类统计
-    categories = {}
-    for item in items:
-        category = item.category or "未分类"
-        categories[category] = categories.get(category, 0) + 1
-    
-    category_stats = [{"name": k, "value": v} for k, v in categories.items()]
+    category_stats = [
+        {"name": facet["name"] or "未分类", "value": facet["count"]}
+        for facet in facets["categories"]
+    ]
 
     # 使用SQL聚合查询直接获取热门位置统计
     popular_locations_query = (
@@ -55,7 +79,7 @@ def get_dashboard_stats(
     # 创建返回的统计数据
     stats = {
         "counts": {
-            "items": len(items),
+            "items": facets["total"],
             "locations": len(locations),
             "due_reminders": len(due_reminders),
             "upcoming_reminders": len(upcoming_reminders)
@@ -69,13 +93,25 @@ def get_dashboard_stats(
 
 @router.get("/popular-locations", response_model=List[Dict[str, Any]])
 def get_popular_locations(
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_principal),
     limit: int = 5
 ) -> Any:
     """
     获取热门位置统计（物品数量最多的位置）
     """
+    not_modified = check_etag(
+        request,
+        response,
+        current_user.id,
+        crud.item.collection_version(db, owner_id=current_user.id),
+        crud.location.collection_version(db, owner_id=current_user.id),
+    )
+    if not_modified:
+        return not_modified
+
     popular_locations_query = (
         db.query(
             models.Location.id,
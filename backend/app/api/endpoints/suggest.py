@@ -0,0 +1,33 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core.suggest import SuggestIndex, suggest_cache
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.Suggestions)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    输入联想：返回以 q 开头（或其中某个词以 q 开头）的物品名称、类别和位置，每类最多 limit 条。
+
+    每个用户的前缀索引在首次请求时用两次查询构建并缓存在进程内，之后的请求不访问数据库；
+    该用户提交任何写入后索引失效，下次请求时重建
+    """
+    key = suggest_cache.key(current_user.id, "index")
+    index = suggest_cache.get(key)
+    if index is None:
+        item_rows = await crud.item.aget_name_rows(db, owner_id=current_user.id)
+        location_rows = await crud.location.aget_name_rows(db, owner_id=current_user.id)
+        index = SuggestIndex(item_rows, location_rows)
+        suggest_cache.set(key, index)
+    return index.suggest(q, limit)
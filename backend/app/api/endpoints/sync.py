@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core.settings import settings
+from app.crud.pagination import Cursor, PaginationError, decode_sync_cursor, encode_sync_cursor
+
+router = APIRouter()
+
+# 参与同步的集合：游标中的名称 -> (CRUD 对象, 响应字段)
+SYNC_COLLECTIONS = {
+    "item": (crud.item, "items"),
+    "location": (crud.location, "locations"),
+    "reminder": (crud.reminder, "reminders"),
+    "category": (crud.category, "categories"),
+}
+
+
+def _advance(positions: Dict[str, Cursor], name: str, rows: List[Any], sort: str) -> None:
+    if rows:
+        last = rows[-1]
+        positions[name] = Cursor(sort=sort, value=getattr(last, sort), id=last.id)
+
+
+@router.get("/", response_model=schemas.SyncResponse)
+async def sync(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    since: Optional[str] = None,
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
+) -> Any:
+    """
+    增量同步：返回 since 游标之后新增或修改的物品、位置、提醒和类别，以及被删除记录的墓碑。
+    类别改名不修改物品，客户端按物品的 category_id 更新本地显示的类别名称
+
+    - **since**: 可选，上次同步返回的 next_cursor；省略时返回全部数据（首次同步）
+    - 响应中 has_more 为 True 时，应立即用 next_cursor 继续拉取，直到为 False
+    - since 之后的删除可能已超出墓碑保留期（TOMBSTONE_RETENTION_DAYS）被清理时返回 410，
+      客户端应丢弃本地数据并省略 since 重新全量同步
+    """
+    try:
+        positions, deleted_until = decode_sync_cursor(since) if since else ({}, None)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    expected = {name: "updated_at" for name in SYNC_COLLECTIONS}
+    expected["tombstone"] = "deleted_at"
+    if any(expected.get(name) != cursor.sort for name, cursor in positions.items()):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # 旧格式的游标无法确认删除下发到了哪里，同样需要全量同步
+    if since and (deleted_until is None or deleted_until < crud.tombstone.retention_cutoff()):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Full resync required")
+
+    # 只同步 settle 窗口之前的变更，避免漏掉时间戳较早但尚未提交的事务
+    until = datetime.utcnow() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    limit = settings.SYNC_PAGE_SIZE
+    result: Dict[str, Any] = {}
+    has_more = False
+
+    for name, (crud_obj, field) in SYNC_COLLECTIONS.items():
+        rows = await crud_obj.aget_changed_since(
+            db, owner_id=current_user.id, until=until, cursor=positions.get(name), limit=limit
+        )
+        result[field] = rows
+        has_more = has_more or len(rows) >= limit
+        _advance(positions, name, rows, "updated_at")
+
+    deleted = await crud.tombstone.aget_since(
+        db, owner_id=current_user.id, until=until, cursor=positions.get("tombstone"), limit=limit
+    )
+    has_more = has_more or len(deleted) >= limit
+    _advance(positions, "tombstone", deleted, "deleted_at")
+    # 本页取完了 until 之前的删除时推进到 until；首次同步的客户端没有本地数据，
+    # 不需要更早的删除。否则保持原值，剩余的删除在后续页中下发
+    if not since or len(deleted) < limit:
+        deleted_until = until
+
+    return {
+        **result,
+        "deleted": deleted,
+        "next_cursor": encode_sync_cursor(positions, deleted_until),
+        "has_more": has_more,
+    }
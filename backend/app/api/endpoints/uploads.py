@@ -5,9 +5,8 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException
-from sqlalchemy.orm import Session
 
-from app import models
+from app import schemas
 from app.api import deps
 from app.core.settings import settings
 
@@ -21,8 +20,7 @@ os.makedirs("uploads/images", exist_ok=True)
 async def upload_image(
     *,
     file: UploadFile = File(...),
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_async_active_principal),
 ) -> Any:
     """
     上传图片文件.
@@ -0,0 +1,42 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# 客户端每次都需要重新验证，但可以用 If-None-Match 得到 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    由版本信息生成弱 ETag
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    按弱比较规则判断 If-None-Match 是否命中
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == bare for candidate in if_none_match.split(",")
+    )
+
+
+def check_etag(request: Request, response: Response, *parts: Any) -> Optional[Response]:
+    """
+    为响应设置 ETag；请求的 If-None-Match 命中时返回 304 响应，调用方直接返回它而不再加载或序列化数据。
+    查询参数（筛选、分页、字段）参与计算，不同的查询得到不同的 ETag。
+    """
+    etag = make_etag(request.url.path, request.url.query, *parts)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
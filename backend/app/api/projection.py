@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+
+@lru_cache(maxsize=256)
+def partial_model(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    由完整的响应模型生成只包含 fields 的模型（按字段组合缓存）
+    """
+    definitions = {
+        name: (schema.model_fields[name].annotation, ...) for name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=256)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """
+    每个响应模型预先构建一个 List[schema] 的 TypeAdapter，避免每次请求重新生成校验器
+    """
+    return TypeAdapter(List[schema])
+
+
+def serialize_list(
+    rows: Sequence[Any],
+    schema: Type[BaseModel],
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> Response:
+    """
+    列表响应的快速序列化：ORM 对象只校验一次（from_attributes），再由 pydantic-core 直接编码为
+    JSON 字节，绕过 response_model 的二次校验和 jsonable_encoder。
+    指定 fields 时只序列化所选字段。已设置的响应头（如 X-Next-Cursor、ETag）会被保留。
+    """
+    adapter = list_adapter(partial_model(schema, fields) if fields else schema)
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
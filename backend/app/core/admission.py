@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Dict, Optional, Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.settings import settings
+
+
+class AdmissionController:
+    """
+    并发准入控制：最多同时处理 max_concurrency 个请求，超出的请求进入容量为
+    max_queue 的等待队列；队列已满或等待超时的请求直接返回 503。
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.waiting = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.queue_peak = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 信号量绑定到当前事件循环（测试中每个 TestClient 使用独立的事件循环）
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            self.active = 0
+            self.waiting = 0
+        return self._semaphore
+
+    async def acquire(self) -> bool:
+        """
+        尝试获取执行名额，成功返回 True，被拒绝返回 False
+        """
+        semaphore = self._get_semaphore()
+        if not semaphore.locked():
+            await semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self.rejected_queue_full += 1
+                return False
+            self.waiting += 1
+            self.queued += 1
+            self.queue_peak = max(self.queue_peak, self.waiting)
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected_timeout += 1
+                return False
+            finally:
+                self.waiting -= 1
+        self.active += 1
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "queue_peak": self.queue_peak,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI 中间件：在进入路由（以及数据库会话依赖）之前进行准入控制
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        controller: AdmissionController,
+        exempt_paths: Sequence[str] = (),
+    ) -> None:
+        self.app = app
+        self.controller = controller
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "服务繁忙，请稍后重试"},
+                headers={"Retry-After": str(self.controller.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+
+def max_db_concurrency() -> int:
+    """
+    准入并发上限：默认等于单个连接池可提供的最大连接数（pool_size + max_overflow）
+    """
+    if settings.ADMISSION_MAX_CONCURRENCY:
+        return settings.ADMISSION_MAX_CONCURRENCY
+    return settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0)
+
+
+admission_controller = AdmissionController(
+    max_concurrency=max_db_concurrency(),
+    max_queue=(
+        settings.ADMISSION_MAX_QUEUE
+        if settings.ADMISSION_MAX_QUEUE is not None
+        else max_db_concurrency()
+    ),
+    queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+    retry_after=settings.ADMISSION_RETRY_AFTER,
+)
@@ -0,0 +1,116 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, TypeVar
+
+from app.core.settings import settings
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    线程安全的进程内缓存：容量有上限（LRU 淘汰），条目在 ttl 秒后过期
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class UserScopedCache(Generic[V]):
+    """
+    按用户划分的缓存：invalidate(user_id) 使该用户的全部条目失效。
+    每个用户有一个代号并写进缓存键，失效时换一个新代号，旧条目不再命中，随后由 LRU 或过期淘汰
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.entries: TTLCache[V] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generations: Dict[int, int] = {}
+        self._counter = itertools.count(1)
+
+    def key(self, user_id: int, key: Hashable) -> Hashable:
+        """
+        在读取数据库之前取得缓存键：计算期间若有写入，结果会写在旧代号下，不会被之后的请求读到
+        """
+        return (user_id, self._generations.get(user_id, 0), key)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        return self.entries.get(key)
+
+    def set(self, key: Hashable, value: V) -> None:
+        self.entries.set(key, value)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            if len(self._generations) >= max(self.entries.maxsize, 1):
+                # 代号表过大时连同缓存条目一起清空，避免用户回到初始代号后命中旧条目
+                self._generations.clear()
+                self.entries.clear()
+            self._generations[user_id] = next(self._counter)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generations.clear()
+            self.entries.clear()
+
+
+# 认证用户快照缓存：令牌 sub（用户名）-> UserPrincipal（id、username、is_active）
+# 由 crud.user.update / remove 失效
+user_cache: TTLCache = TTLCache(
+    maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,18 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import UserScopedCache
+from app.core.settings import settings
+
+# 物品分面计数缓存：键为 (筛选条件, 分钟)，临期分组随时间变化，每分钟重新计算
+facet_cache: UserScopedCache = UserScopedCache(
+    maxsize=settings.FACET_CACHE_MAXSIZE, ttl=settings.FACET_CACHE_TTL_SECONDS
+)
+
+
+# insert=True：需要在 app.db.routing 清除 has_writes 标记之前执行
+@event.listens_for(Session, "after_commit", insert=True)
+def _invalidate_on_write(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None and session.info.get("has_writes"):
+        facet_cache.invalidate(user_id)
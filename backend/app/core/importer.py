@@ -0,0 +1,260 @@
+import csv
+import posixpath
+import threading
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.etree.ElementTree import Element, ParseError, iterparse, parse
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+
+# 导入时识别的列（表头不区分大小写），其余列（如导出文件中的 id、created_at）忽略。
+# location 为位置路径（"厨房 / 冰箱"，与导出一致）或位置名称
+IMPORT_COLUMNS = (
+    "name", "description", "category", "quantity", "price",
+    "purchase_date", "expiry_date", "image_url", "location", "location_id",
+)
+IMPORT_FORMATS = ("csv", "xlsx")
+_DATE_COLUMNS = ("purchase_date", "expiry_date")
+_TEXT_COLUMNS = ("name", "description", "category", "image_url", "location")
+# Excel 日期序列号的起点（1900 日期系统）
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+class ImportFileError(ValueError):
+    """
+    导入文件无法解析（格式错误、缺少必需的列等），整个导入任务失败
+    """
+
+
+def _iter_csv(path: str) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    逐行读取 CSV（UTF-8，可带 BOM），返回 (行号, 单元格列表)，行号从 1（表头）开始
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        try:
+            yield from enumerate(csv.reader(f), start=1)
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise ImportFileError(f"Invalid CSV file: {e}") from e
+
+
+def _first_sheet(archive: zipfile.ZipFile) -> str:
+    """
+    工作簿中第一个工作表的部件路径（通过 workbook.xml 及其关系文件定位）
+    """
+    with archive.open("xl/workbook.xml") as f:
+        sheet = parse(f).getroot().find(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet")
+    if sheet is None:
+        raise ImportFileError("Invalid XLSX file: workbook has no sheets")
+    rel_id = sheet.get(f"{_DOC_REL_NS}id")
+    with archive.open("xl/_rels/workbook.xml.rels") as f:
+        rels = parse(f).getroot()
+    for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    raise ImportFileError("Invalid XLSX file: worksheet not found")
+
+
+def _string_item_text(item: Element) -> str:
+    # 富文本由多个 <r><t> 片段组成；<rPh> 中的注音不属于单元格内容
+    texts = [t.text or "" for t in item.findall(f"{_MAIN_NS}t")]
+    texts += [t.text or "" for t in item.findall(f"{_MAIN_NS}r/{_MAIN_NS}t")]
+    return "".join(texts)
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    with archive.open("xl/sharedStrings.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{_MAIN_NS}si":
+                strings.append(_string_item_text(elem))
+                elem.clear()
+    return strings
+
+
+def _column_index(ref: str) -> int:
+    """
+    单元格引用中的列号（"C12" -> 2）
+    """
+    index = 0
+    for char in ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _number(text: str) -> Any:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _cell_value(cell: Element, strings: Sequence[str]) -> Any:
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        item = cell.find(f"{_MAIN_NS}is")
+        return _string_item_text(item) if item is not None else None
+    v = cell.find(f"{_MAIN_NS}v")
+    if v is None or v.text is None:
+        return None
+    if cell_type == "s":
+        return strings[int(v.text)]
+    if cell_type == "b":
+        return v.text == "1"
+    if cell_type == "n":
+        return _number(v.text)
+    return v.text
+
+
+def _iter_xlsx(path: str) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    用标准库逐行读取 XLSX 的第一个工作表（iterparse 流式解析，处理完的行即释放），
+    支持共享字符串和内联字符串；返回 (行号, 单元格列表)，空单元格为 None
+    """
+    try:
+        with zipfile.ZipFile(path) as archive:
+            strings = _shared_strings(archive)
+            with archive.open(_first_sheet(archive)) as f:
+                line = 0
+                for _, elem in iterparse(f):
+                    if elem.tag != f"{_MAIN_NS}row":
+                        continue
+                    line = int(elem.get("r", line + 1))
+                    values: List[Any] = []
+                    for cell in elem.iter(f"{_MAIN_NS}c"):
+                        ref = cell.get("r")
+                        index = _column_index(ref) if ref else len(values)
+                        values.extend([None] * (index - len(values)))
+                        values.append(_cell_value(cell, strings))
+                    elem.clear()
+                    yield line, values
+    except (zipfile.BadZipFile, KeyError, ParseError, IndexError, ValueError) as e:
+        if isinstance(e, ImportFileError):
+            raise
+        raise ImportFileError(f"Invalid XLSX file: {e}") from e
+
+
+def _normalize(column: str, value: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        if column in _DATE_COLUMNS and len(value) == 10:
+            # 只有日期的写法（2024-01-02）按当天零点处理
+            try:
+                return datetime.combine(date.fromisoformat(value), time())
+            except ValueError:
+                pass
+        return value or None
+    if column in _DATE_COLUMNS and isinstance(value, (int, float)) and not isinstance(value, bool):
+        # XLSX 中的日期单元格保存为序列号（天数）
+        return _EXCEL_EPOCH + timedelta(days=value)
+    if column in _TEXT_COLUMNS and value is not None:
+        # XLSX 中纯数字的名称、类别等保存为数值单元格
+        return str(value)
+    return value
+
+
+def read_rows(path: str, file_format: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    逐行读取导入文件，返回 (行号, {列名: 值})：第一行为表头，只保留 IMPORT_COLUMNS 中的列，
+    空白单元格视为未填写（不出现在字典中），整行为空的行跳过
+    """
+    rows = _iter_csv(path) if file_format == "csv" else _iter_xlsx(path)
+    header = next(rows, None)
+    if header is None:
+        raise ImportFileError("File is empty")
+    columns = [
+        str(name).strip().lower() if name is not None else "" for name in header[1]
+    ]
+    if "name" not in columns:
+        raise ImportFileError("Missing required column: name")
+    wanted = [(index, name) for index, name in enumerate(columns) if name in IMPORT_COLUMNS]
+    for line, values in rows:
+        row = {}
+        for index, name in wanted:
+            value = _normalize(name, values[index]) if index < len(values) else None
+            if value is not None:
+                row[name] = value
+        if row:
+            yield line, row
+
+
+@dataclass
+class ImportJob:
+    """
+    后台导入任务的进度：processed 为已处理的数据行数，imported / failed 为写入和出错的行数；
+    errors 按行号记录出错原因（最多 IMPORT_MAX_ERRORS 条），detail 为整个任务失败的原因
+    """
+
+    owner_id: int
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "pending"
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    detail: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def add_error(self, row: int, detail: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "detail": detail})
+
+    def finish(self, status: str, detail: Optional[str] = None) -> None:
+        self.status = status
+        self.detail = detail
+        self.finished_at = datetime.utcnow()
+
+
+class ImportJobRegistry:
+    """
+    导入任务登记表（进程内）：任务 id -> ImportJob。未结束的任务保存在不限容量的字典中，
+    运行再久也不会过期或被淘汰；结束后移入 TTLCache，IMPORT_JOB_TTL_SECONDS 秒内可以查询结果
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._lock = threading.Lock()
+        self._active: Dict[str, ImportJob] = {}
+        self._finished: TTLCache[ImportJob] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def start(self, job: ImportJob) -> None:
+        with self._lock:
+            self._active[job.id] = job
+
+    def finish(self, job: ImportJob) -> None:
+        """
+        任务结束后调用，从此开始计算保留时间
+        """
+        with self._lock:
+            self._active.pop(job.id, None)
+            self._finished.set(job.id, job)
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            job = self._active.get(job_id)
+        return job if job is not None else self._finished.get(job_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._active.clear()
+            self._finished.clear()
+
+
+import_jobs = ImportJobRegistry(
+    maxsize=settings.IMPORT_JOB_MAXSIZE, ttl=settings.IMPORT_JOB_TTL_SECONDS
+)
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+import anyio
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def run_maintenance(db: Session, *, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    清理过期数据，返回每类数据删除的行数
+    """
+    from app import crud
+
+    now = now or datetime.utcnow()
+    return {
+        "refresh_tokens": crud.refresh_token.prune(db, now=now),
+        "categories": crud.category.prune_orphans(db, now=now),
+        "tombstones": crud.tombstone.prune(db, now=now),
+    }
+
+
+def _run_once() -> Dict[str, int]:
+    with SessionLocal() as db:
+        return run_maintenance(db)
+
+
+async def maintenance_loop(interval: float) -> None:
+    """
+    每隔 interval 秒在线程池中执行一次清理；单次失败只记录日志，不影响下一次
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            deleted = await anyio.to_thread.run_sync(_run_once)
+            logger.info("Maintenance finished: %s", deleted)
+        except Exception:
+            logger.exception("Maintenance failed")
+
+
+_task: Optional[asyncio.Task] = None
+
+
+def start_maintenance() -> None:
+    global _task
+    if settings.MAINTENANCE_INTERVAL_SECONDS > 0 and _task is None:
+        _task = asyncio.get_running_loop().create_task(
+            maintenance_loop(settings.MAINTENANCE_INTERVAL_SECONDS)
+        )
+
+
+def stop_maintenance() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        _task = None
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from app.core.settings import settings
+
+
+class RevocationList:
+    """
+    进程内的令牌吊销与停用名单，供无状态认证使用。
+
+    - 修改密码等操作会吊销用户在此之前签发的全部令牌
+    - 停用用户后，其令牌即使声明为 active 也会被拒绝
+
+    条目只需保留一个令牌有效期：更早签发的令牌已经自然过期。
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # user_id -> (吊销时间点, 条目过期时间)
+        self._revoked_before: Dict[int, tuple] = {}
+        # user_id -> 条目过期时间
+        self._inactive: Dict[int, float] = {}
+
+    def revoke_tokens(self, user_id: int, before: Optional[float] = None) -> None:
+        """吊销用户在 before（默认为当前时间）之前签发的令牌"""
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            self._revoked_before[user_id] = (before or now, now + self.ttl)
+
+    def deactivate(self, user_id: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            self._inactive[user_id] = now + self.ttl
+
+    def activate(self, user_id: int) -> None:
+        with self._lock:
+            self._inactive.pop(user_id, None)
+
+    def is_revoked(self, user_id: int, issued_at: Optional[int]) -> bool:
+        entry = self._revoked_before.get(user_id)
+        if entry is None or issued_at is None:
+            return False
+        revoked_before, expires = entry
+        # iat 为整数秒，与吊销时间点按秒比较，吊销后同一秒内重新登录签发的令牌仍然有效
+        return expires > time.time() and issued_at < int(revoked_before)
+
+    def is_deactivated(self, user_id: int) -> bool:
+        expires = self._inactive.get(user_id)
+        return expires is not None and expires > time.time()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked_before.clear()
+            self._inactive.clear()
+
+    def _prune(self, now: float) -> None:
+        self._revoked_before = {
+            uid: entry for uid, entry in self._revoked_before.items() if entry[1] > now
+        }
+        self._inactive = {uid: expires for uid, expires in self._inactive.items() if expires > now}
+
+
+revocation_list = RevocationList(ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
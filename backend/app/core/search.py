@@ -0,0 +1,110 @@
+import re
+from typing import List, Optional, Tuple
+
+# 中日韩字符（统一表意文字、扩展A、兼容表意文字、假名、韩文音节）
+_CJK_RANGES = "぀-ヿ㐀-䶿一-鿿가-힯豈-﫿"
+_CJK_RE = re.compile(f"^[{_CJK_RANGES}]")
+_RUN_RE = re.compile(f"[{_CJK_RANGES}]+|[0-9a-z]+")
+
+# 名称列命中的相关度权重（描述列为 1）
+NAME_WEIGHT = 2.0
+
+
+def _runs(text: Optional[str]) -> List[str]:
+    return _RUN_RE.findall((text or "").lower())
+
+
+def is_cjk(run: str) -> bool:
+    return bool(_CJK_RE.match(run))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    索引分词：中日韩字符连续片段拆成单字和相邻二字组（"德国厨刀" -> 德 国 厨 刀 德国 国厨 厨刀），
+    英文和数字按单词切分并转为小写
+    """
+    tokens: List[str] = []
+    for run in _runs(text):
+        if is_cjk(run):
+            tokens.extend(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def search_tokens(text: Optional[str]) -> str:
+    """
+    生成检索词元串（空格分隔），写入 item.name_tokens / item.description_tokens 列
+    """
+    return " ".join(tokenize(text))
+
+
+def query_tokens(term: str) -> Tuple[List[str], Optional[str]]:
+    """
+    查询分词：中日韩片段只用二字组（单字片段用单字），所有词元都必须命中；
+    若查询以英文或数字结尾，最后一个单词按前缀匹配（输入 "kni" 可以找到 "knife"）。
+    返回 (精确匹配的词元, 前缀匹配的词元)
+    """
+    runs = _runs(term)
+    tokens: List[str] = []
+    prefix: Optional[str] = None
+    for index, run in enumerate(runs):
+        if is_cjk(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif index == len(runs) - 1:
+            prefix = run
+        else:
+            tokens.append(run)
+    # 去重并保持顺序
+    return list(dict.fromkeys(tokens)), prefix
+
+
+def tsquery_text(tokens: List[str], prefix: Optional[str]) -> str:
+    """
+    PostgreSQL to_tsquery 表达式，如 "'德国' & '国厨' & 'wmf':*"
+    （词元只含字母数字和中日韩字符，无需转义）
+    """
+    terms = [f"'{token}'" for token in tokens]
+    if prefix:
+        terms.append(f"'{prefix}':*")
+    return " & ".join(terms)
+
+
+def fts5_query_text(tokens: List[str], prefix: Optional[str]) -> str:
+    """
+    SQLite FTS5 MATCH 表达式，如 '"德国" AND "国厨" AND "wmf"*'
+    """
+    terms = [f'"{token}"' for token in tokens]
+    if prefix:
+        terms.append(f'"{prefix}"*')
+    return " AND ".join(terms)
+
+
+# SQLite（测试与本地开发）使用 FTS5 外部内容表索引物品的两个词元列，由触发器与 item 表保持同步；
+# 建表迁移和 metadata.create_all 共用这组语句
+SQLITE_FTS_CREATE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS item_fts USING fts5("
+    "name_tokens, description_tokens, content='item', content_rowid='id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS item_fts_ai AFTER INSERT ON item BEGIN "
+    "INSERT INTO item_fts(rowid, name_tokens, description_tokens) "
+    "VALUES (new.id, new.name_tokens, new.description_tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS item_fts_ad AFTER DELETE ON item BEGIN "
+    "INSERT INTO item_fts(item_fts, rowid, name_tokens, description_tokens) "
+    "VALUES ('delete', old.id, old.name_tokens, old.description_tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS item_fts_au "
+    "AFTER UPDATE OF name_tokens, description_tokens ON item BEGIN "
+    "INSERT INTO item_fts(item_fts, rowid, name_tokens, description_tokens) "
+    "VALUES ('delete', old.id, old.name_tokens, old.description_tokens); "
+    "INSERT INTO item_fts(rowid, name_tokens, description_tokens) "
+    "VALUES (new.id, new.name_tokens, new.description_tokens); END",
+)
+SQLITE_FTS_DROP = (
+    "DROP TRIGGER IF EXISTS item_fts_au",
+    "DROP TRIGGER IF EXISTS item_fts_ad",
+    "DROP TRIGGER IF EXISTS item_fts_ai",
+    "DROP TABLE IF EXISTS item_fts",
+)
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -7,19 +7,46 @@ from passlib.context import CryptContext
 from app.core.settings import settings
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 仍然可以校验的旧哈希方案；非默认方案的哈希在登录时会被透明地重新哈希
+SUPPORTED_HASH_SCHEMES = ["bcrypt", "pbkdf2_sha256"]
+
+
+def build_password_context(scheme: str, rounds: Optional[int] = None) -> CryptContext:
+    """
+    构造密码哈希上下文：scheme 为新哈希使用的方案，rounds 为其工作因子。
+    方案或工作因子与配置不一致的已存哈希会被 needs_update 判定为需要更新。
+    """
+    schemes: List[str] = [scheme] + [s for s in SUPPORTED_HASH_SCHEMES if s != scheme]
+    options = {}
+    if rounds is not None:
+        options[f"{scheme}__rounds"] = rounds
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+pwd_context = build_password_context(
+    settings.PASSWORD_HASH_SCHEME, settings.PASSWORD_HASH_ROUNDS
+)
 
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: timedelta = None
+    subject: Union[str, Any],
+    expires_delta: timedelta = None,
+    user_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
 ) -> str:
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
+        expire = now + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": expire, "iat": now, "sub": str(subject)}
+    # 无状态认证所需的声明：用户ID和激活状态
+    if user_id is not None:
+        to_encode["uid"] = user_id
+    if is_active is not None:
+        to_encode["act"] = is_active
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -28,5 +55,28 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+_dummy_hash: Optional[Tuple[CryptContext, str]] = None
+
+
+def dummy_verify_password(plain_password: str) -> None:
+    """
+    用户不存在时对一个固定哈希做同等代价的校验，使响应时间与用户存在时一致，
+    避免通过耗时枚举用户名
+    """
+    global _dummy_hash
+    if _dummy_hash is None or _dummy_hash[0] is not pwd_context:
+        _dummy_hash = (pwd_context, pwd_context.hash("dummy-password"))
+    pwd_context.verify(plain_password, _dummy_hash[1])
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    校验密码；若存储的哈希使用了过时的方案或工作因子，同时返回按当前配置生成的新哈希
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password) 
\ No newline at end of file
@@ -0,0 +1,113 @@
+from bisect import bisect_left
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import UserScopedCache
+from app.core.search import is_cjk
+from app.core.settings import settings
+
+V = TypeVar("V", bound=Hashable)
+
+
+def normalize(text: Optional[str]) -> str:
+    return " ".join((text or "").casefold().split())
+
+
+def _word_starts(key: str) -> List[int]:
+    """
+    词条内部可作为匹配起点的位置：每个中日韩字符，以及每个英文单词/数字的开头
+    """
+    starts = []
+    for i in range(1, len(key)):
+        char, prev = key[i], key[i - 1]
+        if is_cjk(char) or (char.isalnum() and (not prev.isalnum() or is_cjk(prev))):
+            starts.append(i)
+    return starts
+
+
+class PrefixIndex(Generic[V]):
+    """
+    有序数组前缀索引：词条按规范化（小写、合并空白）后的键排序，前缀查询用二分查找定位，
+    复杂度 O(log n + limit)。除整条词条外，词条内部每个词的开头也建立索引（"积木" 可以联想出
+    "儿童积木玩具"），整条前缀命中的结果排在前面。
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, V]]) -> None:
+        heads: List[Tuple[str, V]] = []
+        infixes: List[Tuple[str, V]] = []
+        for text, value in entries:
+            key = normalize(text)
+            if not key:
+                continue
+            heads.append((key, value))
+            infixes.extend((key[i:], value) for i in _word_starts(key))
+        heads.sort(key=lambda entry: entry[0])
+        infixes.sort(key=lambda entry: entry[0])
+        self._heads = ([key for key, _ in heads], [value for _, value in heads])
+        self._infixes = ([key for key, _ in infixes], [value for _, value in infixes])
+
+    def __len__(self) -> int:
+        return len(self._heads[0])
+
+    def lookup(self, prefix: str, limit: int = 10) -> List[V]:
+        key = normalize(prefix)
+        if not key or limit <= 0:
+            return []
+        results: List[V] = []
+        seen: Set[V] = set()
+        for keys, values in (self._heads, self._infixes):
+            i = bisect_left(keys, key)
+            while i < len(keys) and keys[i].startswith(key):
+                if values[i] not in seen:
+                    seen.add(values[i])
+                    results.append(values[i])
+                    if len(results) >= limit:
+                        return results
+                i += 1
+        return results
+
+
+class SuggestIndex:
+    """
+    单个用户的联想索引：物品名称、去重后的类别、位置（id, 名称）
+    """
+
+    def __init__(
+        self,
+        item_rows: Iterable[Tuple[Optional[str], Optional[str]]],
+        location_rows: Iterable[Tuple[int, Optional[str]]],
+    ) -> None:
+        item_rows = list(item_rows)
+        names = {name for name, _ in item_rows if name}
+        categories = {category for _, category in item_rows if category}
+        self.items: PrefixIndex[str] = PrefixIndex((name, name) for name in names)
+        self.categories: PrefixIndex[str] = PrefixIndex((name, name) for name in categories)
+        self.locations: PrefixIndex[Tuple[int, str]] = PrefixIndex(
+            (name, (id, name)) for id, name in location_rows if name
+        )
+
+    def suggest(self, q: str, limit: int = 10) -> Dict[str, Any]:
+        return {
+            "items": self.items.lookup(q, limit),
+            "categories": self.categories.lookup(q, limit),
+            "locations": [
+                {"id": id, "name": name} for id, name in self.locations.lookup(q, limit)
+            ],
+        }
+
+
+# 每个用户的 SuggestIndex，首次联想请求时构建；该用户的会话提交写入后失效。
+# 缓存键在读取数据库之前取得，构建期间提交的写入不会让旧索引在失效之后被写入缓存
+suggest_cache: UserScopedCache = UserScopedCache(
+    maxsize=settings.SUGGEST_CACHE_MAXSIZE, ttl=settings.SUGGEST_CACHE_TTL_SECONDS
+)
+
+
+# insert=True：需要在 app.db.routing 清除 has_writes 标记之前执行
+@event.listens_for(Session, "after_commit", insert=True)
+def _invalidate_on_write(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None and session.info.get("has_writes"):
+        suggest_cache.invalidate(user_id)
@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+from ipaddress import ip_address, ip_network
+from typing import Deque, Dict, Optional, Protocol, Sequence, Union
+
+from app.core.settings import settings
+
+
+class ThrottleStore(Protocol):
+    """
+    登录失败记录的存储后端：进程内（默认）或多实例共享（Redis）
+    """
+
+    def add_failure(self, key: str, now: float, window: float) -> int:
+        """记录一次失败并返回窗口内的失败次数"""
+
+    def get_blocked_until(self, key: str) -> float:
+        ...
+
+    def set_blocked_until(self, key: str, until: float) -> None:
+        ...
+
+    def reset(self, key: str) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class MemoryThrottleStore:
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._failures: Dict[str, Deque[float]] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+    def add_failure(self, key: str, now: float, window: float) -> int:
+        with self._lock:
+            if len(self._failures) >= self.max_keys:
+                self._prune(now, window)
+            failures = self._failures.setdefault(key, deque())
+            failures.append(now)
+            # 滑动窗口：丢弃窗口之外的失败记录
+            while failures and failures[0] <= now - window:
+                failures.popleft()
+            return len(failures)
+
+    def get_blocked_until(self, key: str) -> float:
+        return self._blocked_until.get(key, 0.0)
+
+    def set_blocked_until(self, key: str, until: float) -> None:
+        with self._lock:
+            self._blocked_until[key] = until
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+            self._blocked_until.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._blocked_until.clear()
+
+    def _prune(self, now: float, window: float) -> None:
+        self._failures = {
+            key: failures for key, failures in self._failures.items()
+            if failures and failures[-1] > now - window
+        }
+        self._blocked_until = {
+            key: until for key, until in self._blocked_until.items() if until > now
+        }
+
+
+class RedisThrottleStore:
+    """
+    基于 Redis 有序集合的共享存储，多个后端实例共用同一份限流状态（需要安装 redis 包）
+    """
+
+    def __init__(self, url: str, prefix: str = "login-throttle:") -> None:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("LOGIN_THROTTLE_REDIS_URL requires the 'redis' package") from e
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def add_failure(self, key: str, now: float, window: float) -> int:
+        redis_key = f"{self.prefix}fail:{key}"
+        pipe = self.client.pipeline()
+        pipe.zadd(redis_key, {repr(now): now})
+        pipe.zremrangebyscore(redis_key, 0, now - window)
+        pipe.zcard(redis_key)
+        pipe.expire(redis_key, int(window) + 1)
+        return int(pipe.execute()[2])
+
+    def get_blocked_until(self, key: str) -> float:
+        value = self.client.get(f"{self.prefix}block:{key}")
+        return float(value) if value is not None else 0.0
+
+    def set_blocked_until(self, key: str, until: float) -> None:
+        ttl = max(1, int(until - time.time()) + 1)
+        self.client.set(f"{self.prefix}block:{key}", repr(until), ex=ttl)
+
+    def reset(self, key: str) -> None:
+        self.client.delete(f"{self.prefix}fail:{key}", f"{self.prefix}block:{key}")
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class TrustedProxies:
+    """
+    可信反向代理的地址：IP、CIDR 网段，或按字面匹配的主机名（可传入逗号分隔的字符串）
+    """
+
+    def __init__(self, entries: Union[str, Sequence[str]]) -> None:
+        if isinstance(entries, str):
+            entries = entries.split(",")
+        self.networks = []
+        self.names = set()
+        for entry in (entry.strip() for entry in entries):
+            if not entry:
+                continue
+            try:
+                self.networks.append(ip_network(entry, strict=False))
+            except ValueError:
+                self.names.add(entry)
+
+    def __contains__(self, address: str) -> bool:
+        if address in self.names:
+            return True
+        try:
+            ip = ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.networks)
+
+
+def resolve_client_ip(
+    peer: Optional[str], forwarded_for: Optional[str], trusted: TrustedProxies
+) -> Optional[str]:
+    """
+    请求的真实客户端IP：只有直接连接的对端是可信代理时才读取 X-Forwarded-For，
+    从右向左跳过可信代理，取第一个不可信的地址（更左边的部分可由客户端伪造）
+    """
+    if peer is None or not forwarded_for or peer not in trusted:
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if hop not in trusted:
+            return hop
+    return hops[0] if hops else peer
+
+
+class LoginThrottle:
+    """
+    登录限流：按用户名和客户端IP分别统计滑动窗口内的失败次数，超过阈值后按指数退避封禁。
+    被封禁的请求在查询数据库和校验密码之前就被拒绝。
+    """
+
+    def __init__(
+        self,
+        store: ThrottleStore,
+        *,
+        max_attempts_per_username: int,
+        max_attempts_per_ip: int,
+        window: float,
+        backoff_base: float,
+        backoff_max: float,
+        trusted_proxies: Optional[TrustedProxies] = None,
+    ) -> None:
+        self.store = store
+        self.max_attempts_per_username = max_attempts_per_username
+        self.max_attempts_per_ip = max_attempts_per_ip
+        self.window = window
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.trusted_proxies = trusted_proxies or TrustedProxies(())
+
+    def client_ip(self, peer: Optional[str], forwarded_for: Optional[str]) -> Optional[str]:
+        """
+        按IP限流时使用的客户端地址：经可信代理转发的请求取 X-Forwarded-For 中的真实地址，
+        否则取直接连接的对端地址
+        """
+        return resolve_client_ip(peer, forwarded_for, self.trusted_proxies)
+
+    def _keys(self, username: str, ip: Optional[str]) -> Dict[str, int]:
+        keys = {f"user:{username.lower()}": self.max_attempts_per_username}
+        if ip:
+            keys[f"ip:{ip}"] = self.max_attempts_per_ip
+        return keys
+
+    def retry_after(self, username: str, ip: Optional[str]) -> Optional[float]:
+        """
+        若用户名或IP处于封禁期，返回需要等待的秒数，否则返回 None
+        """
+        now = time.time()
+        waits = [
+            self.store.get_blocked_until(key) - now for key in self._keys(username, ip)
+        ]
+        wait = max(waits)
+        return wait if wait > 0 else None
+
+    def record_failure(self, username: str, ip: Optional[str]) -> None:
+        now = time.time()
+        for key, max_attempts in self._keys(username, ip).items():
+            failures = self.store.add_failure(key, now, self.window)
+            if failures >= max_attempts:
+                # 指数退避：每多失败一次，封禁时间翻倍
+                backoff = min(
+                    self.backoff_max, self.backoff_base * 2 ** (failures - max_attempts)
+                )
+                self.store.set_blocked_until(key, now + backoff)
+
+    def record_success(self, username: str, ip: Optional[str]) -> None:
+        # 只重置用户名维度；IP 维度不因某个账号登录成功而清零
+        self.store.reset(f"user:{username.lower()}")
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+def _create_store() -> ThrottleStore:
+    if settings.LOGIN_THROTTLE_REDIS_URL:
+        return RedisThrottleStore(settings.LOGIN_THROTTLE_REDIS_URL)
+    return MemoryThrottleStore()
+
+
+login_throttle = LoginThrottle(
+    _create_store(),
+    max_attempts_per_username=settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME,
+    max_attempts_per_ip=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+    window=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+    backoff_base=settings.LOGIN_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.LOGIN_BACKOFF_MAX_SECONDS,
+    trusted_proxies=TrustedProxies(settings.TRUSTED_PROXIES),
+)
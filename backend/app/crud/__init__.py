@@ -1,4 +1,7 @@
 from app.crud.crud_user import user
+from app.crud.crud_category import category
 from app.crud.crud_item import item
 from app.crud.crud_location import location
-from app.crud.crud_reminder import reminder 
\ No newline at end of file
+from app.crud.crud_reminder import reminder
+from app.crud.crud_refresh_token import refresh_token
+from app.crud.crud_tombstone import tombstone
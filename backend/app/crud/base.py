@@ -1,11 +1,18 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import inspect, insert, select, update, delete
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
 
+from app.crud.crud_tombstone import tombstone
+from app.crud.pagination import Cursor, next_cursor, paginate, split_sort
 from app.db.base_class import Base
+from app.models.collection_version import CollectionVersion, bump_versions
 
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -13,20 +20,112 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def to_db_values(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将带时区的 datetime 统一转换为无时区的 UTC 时间，与模型中 datetime.utcnow 的默认值一致
+    （asyncpg 不接受将带时区的值写入 TIMESTAMP WITHOUT TIME ZONE 列）
+    """
+    return {
+        key: value.astimezone(timezone.utc).replace(tzinfo=None)
+        if isinstance(value, datetime) and value.tzinfo is not None
+        else value
+        for key, value in data.items()
+    }
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # 列表接口允许的排序字段（均以 id 作为第二排序键）
+    sortable_fields: Tuple[str, ...] = ("id",)
+    # 参与增量同步的模型在删除时写入该类型的墓碑
+    tombstone_type: Optional[str] = None
+
     def __init__(self, model: Type[ModelType]):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
         """
         self.model = model
 
+    def _page(
+        self,
+        stmt: Select,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        sort: Optional[str] = None,
+        default_sort: str = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Select:
+        """
+        为查询语句加上排序和分页：有游标时使用键集分页，否则使用 skip/limit。
+        指定 fields 时只加载这些列（以及 id 和排序列），其余列不会从数据库读取
+        """
+        sort = sort or default_sort
+        stmt = self._load_fields(stmt, fields, split_sort(sort)[0])
+        return paginate(stmt, self.model, sort=sort, skip=skip, limit=limit, cursor=cursor)
+
+    def _load_fields(
+        self, stmt: Select, fields: Optional[Sequence[str]], *required: str
+    ) -> Select:
+        if not fields:
+            return stmt
+        columns = {"id", *required, *fields}
+        return stmt.options(load_only(*(getattr(self.model, name) for name in sorted(columns))))
+
+    def _prepare_rows(
+        self, db: Session, rows: List[Dict[str, Any]], *, owner_id: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        批量 INSERT/UPDATE 前补充或转换派生列（Core 语句不会触发 ORM 事件），子类按需覆盖；
+        整批一起处理，需要查询时每批只查询一次
+        """
+        return rows
+
+    def _returning(self) -> Tuple[Any, ...]:
+        """
+        批量写入 RETURNING 的列，子类可以追加由其他表得到的列
+        """
+        return tuple(self.model.__table__.c)
+
+    @staticmethod
+    def next_cursor(
+        rows: List[ModelType], *, limit: int, sort: Optional[str] = None, default_sort: str = "id"
+    ) -> Optional[str]:
+        return next_cursor(rows, sort=sort or default_sort, limit=limit)
+
+    def _version_stmt(self, *, owner_id: int) -> Select:
+        return select(CollectionVersion.version).where(
+            CollectionVersion.owner_id == owner_id,
+            CollectionVersion.collection == self.model.__tablename__,
+        )
+
+    def collection_version(self, db: Session, *, owner_id: int) -> str:
+        """
+        用户集合的版本号：写入时在同一事务中加一（见 app.models.collection_version），
+        这里只按主键读取一行，与集合大小无关
+        """
+        return str(db.execute(self._version_stmt(owner_id=owner_id)).scalar() or 0)
+
+    def _bump_version(self, db: Session, owner_ids: Iterable[Optional[int]]) -> None:
+        """
+        Core 语句的批量写入不经过 flush，由写入方法在提交前调用
+        """
+        bump_versions(db.connection(), ((owner_id, self.model.__tablename__) for owner_id in owner_ids))
+
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
 
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        sort: Optional[str] = None,
     ) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+        stmt = self._page(select(self.model), skip=skip, limit=limit, cursor=cursor, sort=sort)
+        return list(db.execute(stmt).scalars().all())
 
     def create(self, db: Session, *, obj_in: CreateSchemaType, owner_id: Optional[int] = None) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
@@ -62,5 +161,217 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def remove(self, db: Session, *, id: int) -> ModelType:
         obj = db.query(self.model).get(id)
         db.delete(obj)
+        if self.tombstone_type:
+            tombstone.record(db, entity_type=self.tombstone_type, rows=[obj])
         db.commit()
-        return obj 
\ No newline at end of file
+        return obj
+
+    def exists(self, db: Session, *, id: Any) -> bool:
+        stmt = select(self.model.__table__.c.id).where(self.model.__table__.c.id == id)
+        return db.execute(stmt).first() is not None
+
+    # 按所有者限定的单条写入：一条 UPDATE/DELETE ... WHERE id = :id AND owner_id = :uid RETURNING，
+    # 不存在或不属于该用户时返回 None（调用方可再用 exists 区分 404 与 403）
+
+    def update_owned(
+        self,
+        db: Session,
+        *,
+        id: int,
+        owner_id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = True,
+    ) -> Optional[Row]:
+        rows = self.update_multi(db, ids=[id], owner_id=owner_id, obj_in=obj_in, commit=commit)
+        return rows[0] if rows else None
+
+    def remove_owned(
+        self, db: Session, *, id: int, owner_id: int, commit: bool = True
+    ) -> Optional[Row]:
+        rows = self.remove_multi(db, ids=[id], owner_id=owner_id, commit=commit)
+        return rows[0] if rows else None
+
+    # 批量写入：直接在表上执行 INSERT/UPDATE/DELETE ... RETURNING，
+    # 整批只提交一次；返回的 Row 可直接校验为响应模型，提交后不会再触发刷新查询
+
+    def get_owned_ids(self, db: Session, *, ids: Sequence[int], owner_id: int) -> Set[int]:
+        """
+        返回 ids 中属于该用户的记录ID
+        """
+        if not ids:
+            return set()
+        table = self.model.__table__
+        stmt = select(table.c.id).where(table.c.id.in_(set(ids)), table.c.owner_id == owner_id)
+        return set(db.execute(stmt).scalars().all())
+
+    def create_multi(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[CreateSchemaType],
+        owner_id: Optional[int] = None,
+        commit: bool = True,
+    ) -> List[Row]:
+        """
+        多行 INSERT ... RETURNING，返回结果与 objs_in 顺序一致
+        """
+        if not objs_in:
+            return []
+        rows = [to_db_values(obj_in.model_dump()) for obj_in in objs_in]
+        if owner_id is not None:
+            for row in rows:
+                row["owner_id"] = owner_id
+        rows = self._prepare_rows(db, rows, owner_id=owner_id)
+        table = self.model.__table__
+        stmt = insert(table).returning(*self._returning(), sort_by_parameter_order=True)
+        created = list(db.execute(stmt, rows).all())
+        self._bump_version(db, {row.owner_id for row in created})
+        if commit:
+            db.commit()
+        return created
+
+    def update_multi(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[int],
+        owner_id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = True,
+    ) -> List[Row]:
+        """
+        对该用户名下的多条记录执行同一组修改（UPDATE ... WHERE id IN (...) AND owner_id = ...），
+        只返回实际更新的行
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        table = self.model.__table__
+        if not ids:
+            return []
+        values = self._prepare_rows(db, [to_db_values(update_data)], owner_id=owner_id)[0]
+        values = {k: v for k, v in values.items() if k in table.c}
+        owned = (table.c.id.in_(set(ids)), table.c.owner_id == owner_id)
+        if values:
+            stmt = update(table).where(*owned).values(**values).returning(*self._returning())
+        else:
+            stmt = select(*self._returning()).where(*owned)
+        updated = list(db.execute(stmt).all())
+        if updated and values:
+            self._bump_version(db, [owner_id])
+        if commit:
+            db.commit()
+        return updated
+
+    def remove_multi(
+        self, db: Session, *, ids: Sequence[int], owner_id: int, commit: bool = True
+    ) -> List[Row]:
+        """
+        删除该用户名下的多条记录，返回被删除的行
+        """
+        if not ids:
+            return []
+        table = self.model.__table__
+        stmt = (
+            delete(table)
+            .where(table.c.id.in_(set(ids)), table.c.owner_id == owner_id)
+            .returning(*self._returning())
+        )
+        removed = list(db.execute(stmt).all())
+        if removed:
+            self._bump_version(db, [owner_id])
+        if self.tombstone_type:
+            tombstone.record(db, entity_type=self.tombstone_type, rows=removed)
+        if commit:
+            db.commit()
+        return removed
+
+    def _changed_since_stmt(
+        self, *, owner_id: int, until: datetime, cursor: Optional[Cursor], limit: int
+    ) -> Select:
+        stmt = select(self.model).where(
+            self.model.owner_id == owner_id, self.model.updated_at <= until
+        )
+        return paginate(stmt, self.model, sort="updated_at", limit=limit, cursor=cursor)
+
+    # 异步版本（AsyncSession），供 async def 端点使用
+
+    async def aget_changed_since(
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: int,
+        until: datetime,
+        cursor: Optional[Cursor] = None,
+        limit: int = 1000,
+    ) -> List[ModelType]:
+        """
+        增量同步：按 (updated_at, id) 顺序返回游标之后、until 之前新增或修改的记录
+        """
+        stmt = self._changed_since_stmt(owner_id=owner_id, until=until, cursor=cursor, limit=limit)
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def acollection_version(self, db: AsyncSession, *, owner_id: int) -> str:
+        result = await db.execute(self._version_stmt(owner_id=owner_id))
+        return str(result.scalar() or 0)
+
+    async def aget(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        result = await db.execute(select(self.model).where(self.model.id == id))
+        return result.scalars().first()
+
+    async def aget_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        sort: Optional[str] = None,
+    ) -> List[ModelType]:
+        stmt = self._page(select(self.model), skip=skip, limit=limit, cursor=cursor, sort=sort)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def acreate(
+        self, db: AsyncSession, *, obj_in: CreateSchemaType, owner_id: Optional[int] = None
+    ) -> ModelType:
+        obj_in_data = to_db_values(obj_in.model_dump())
+        if owner_id is not None:
+            db_obj = self.model(**obj_in_data, owner_id=owner_id)
+        else:
+            db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def aupdate(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        # 只读取列属性，避免 jsonable_encoder 在异步会话中触发关系的懒加载
+        columns = {attr.key for attr in inspect(self.model).column_attrs}
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = to_db_values(update_data)
+        for field in columns:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def aremove(self, db: AsyncSession, *, id: int) -> ModelType:
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        if self.tombstone_type:
+            await tombstone.arecord(db, entity_type=self.tombstone_type, rows=[obj])
+        await db.commit()
+        return obj
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import Collection, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from app.crud.base import CRUDBase
+from app.crud.crud_tombstone import tombstone
+from app.crud.pagination import Cursor
+from app.models.category import Category, resolve_category_ids
+from app.models.item import Item
+from app.schemas.category import CategoryCreate, CategoryUpdate
+
+# 没有物品引用的类别至少保留这么久才清理：类别在物品写入时创建，
+# 给仍未提交的物品写入留出余量
+ORPHAN_GRACE = timedelta(hours=1)
+
+
+class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
+    sortable_fields = ("id", "name", "created_at", "updated_at")
+    tombstone_type = "category"
+
+    @staticmethod
+    def _referenced() -> ColumnElement:
+        # 按 (owner_id, category_id) 索引查找引用该类别的物品
+        return exists().where(Item.owner_id == Category.owner_id, Item.category_id == Category.id)
+
+    def get_ids(self, db: Session, *, names: Collection[str], owner_id: int) -> Dict[str, int]:
+        """
+        类别名称 -> 类别ID，不存在的类别自动创建（不提交）
+        """
+        return resolve_category_ids(db.connection(), owner_id=owner_id, names=names)
+
+    def get_by_name(self, db: Session, *, name: str, owner_id: int) -> Optional[Category]:
+        stmt = select(Category).where(Category.owner_id == owner_id, Category.name == name)
+        return db.execute(stmt).scalar_one_or_none()
+
+    def prune_orphans(self, db: Session, *, now: Optional[datetime] = None) -> int:
+        """
+        删除已没有物品引用、且 ORPHAN_GRACE 内未修改的类别，写入墓碑并递增类别集合的版本号，
+        返回删除的行数
+        """
+        cutoff = (now or datetime.utcnow()) - ORPHAN_GRACE
+        stmt = (
+            delete(Category)
+            .where(Category.updated_at < cutoff, ~self._referenced())
+            .returning(*Category.__table__.c)
+        )
+        removed = list(db.execute(stmt).all())
+        if removed:
+            self._bump_version(db, {row.owner_id for row in removed})
+            tombstone.record(db, entity_type=self.tombstone_type, rows=removed)
+        db.commit()
+        return len(removed)
+
+    # 异步版本
+
+    async def aget_multi_by_owner(
+        self, db: AsyncSession, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Category]:
+        """
+        仍有物品引用的类别（没有引用的类别由定期清理任务删除）
+        """
+        stmt = self._page(
+            select(Category).where(Category.owner_id == owner_id, self._referenced()),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, default_sort="name", fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+
+category = CRUDCategory(Category)
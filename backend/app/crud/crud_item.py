@@ -1,82 +1,591 @@
-from typing import List, Optional
+import io
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy import (
+    String, case, column, func, insert, literal, literal_column, null, or_, select, table, union_all,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import ColumnElement, CompoundSelect, Select
 
-from app.crud.base import CRUDBase
-from app.models.item import Item
+from app.core.search import NAME_WEIGHT, fts5_query_text, query_tokens, search_tokens, tsquery_text
+from app.crud.base import CRUDBase, to_db_values
+from app.crud.crud_location import location_paths
+from app.crud.pagination import Cursor
+from app.db.routing import flag_writes
+from app.models.category import Category, resolve_category_ids
+from app.models.collection_version import bump_versions
+from app.models.item import SEARCH_TSCONFIG, Item, search_vector
+from app.models.location import Location
+from app.models.reminder import Reminder
 from app.schemas.item import ItemCreate, ItemUpdate
 
 
+# 临期分组：名称 -> 天数。expired 为已过期（expiry_date < now），
+# 其余为累计区间 now <= expiry_date < now + N 天（30d 包含 7d 中的物品）
+EXPIRY_BUCKETS: Dict[str, Optional[int]] = {"expired": None, "7d": 7, "30d": 30, "90d": 90}
+
+
+def _copy_field(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.isoformat(sep=" ")
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# 批量写入 RETURNING 中的类别名称（Core 的 INSERT/UPDATE/DELETE 不会关联 RETURNING 中的子查询，
+# 这里直接写出关联条件）
+_RETURNING_CATEGORY = literal_column(
+    "(SELECT category.name FROM category WHERE category.id = item.category_id)", String
+).label("category")
+
+
+def _facet_order(facet: Dict[str, Any]) -> Tuple[int, bool, str]:
+    return -facet["count"], facet["name"] is None, facet["name"] or ""
+
+
+@dataclass(frozen=True)
+class ItemFilter:
+    """
+    物品列表的组合筛选条件，未设置（None / 空）的条件不生效；价格和日期区间均包含端点
+    """
+
+    categories: Tuple[str, ...] = ()
+    location_id: Optional[int] = None
+    # 为 True 时同时匹配 location_id 的所有子位置
+    include_sublocations: bool = False
+    search: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    purchased_after: Optional[datetime] = None
+    purchased_before: Optional[datetime] = None
+    expires_after: Optional[datetime] = None
+    expires_before: Optional[datetime] = None
+
+
 class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
-    def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+    sortable_fields = (
+        "id", "name", "category", "quantity", "price",
+        "purchase_date", "expiry_date", "created_at", "updated_at",
+    )
+    tombstone_type = "item"
+
+    # 查询语句构造（同步与异步方法共用），排序和分页由 _page 统一添加
+
+    def _by_owner_stmt(self, *, owner_id: int) -> Select:
+        return select(self.model).where(Item.owner_id == owner_id)
+
+    def _by_location_stmt(self, *, location_id: int, owner_id: Optional[int]) -> Select:
+        stmt = select(self.model).where(Item.location_id == location_id)
+        if owner_id is not None:
+            stmt = stmt.where(Item.owner_id == owner_id)
+        return stmt
+
+    def _category_ids(self, *, categories: Sequence[str], owner_id: int) -> Select:
+        # 类别名称先在类别字典中换成ID，物品表上只比较整数
+        return select(Category.id).where(
+            Category.owner_id == owner_id, Category.name.in_(categories)
+        )
+
+    def _by_categories_stmt(self, *, categories: List[str], owner_id: int) -> Select:
+        # 使用 OR 条件组合多个类别查询
+        return select(self.model).where(
+            Item.owner_id == owner_id,
+            Item.category_id.in_(self._category_ids(categories=categories, owner_id=owner_id)),
+        )
+
+    def _search_stmt(
+        self, stmt: Select, *, name: str, dialect: str
+    ) -> Tuple[Select, Optional[ColumnElement]]:
+        """
+        为查询加上全文检索条件，返回语句及相关度得分：PostgreSQL 使用词元列上的 GIN 索引（ts_rank 排序），
+        SQLite 使用 FTS5 索引（bm25 排序），名称命中的权重高于描述。查询中没有可用词元或其他数据库时退回 ILIKE 匹配，得分为 None
+        """
+        tokens, prefix = query_tokens(name)
+        if tokens or prefix:
+            if dialect == "postgresql":
+                vector = search_vector(Item.name_tokens, Item.description_tokens)
+                query = func.to_tsquery(SEARCH_TSCONFIG, tsquery_text(tokens, prefix))
+                return stmt.where(vector.op("@@")(query)), func.ts_rank(vector, query)
+            if dialect == "sqlite":
+                fts = literal_column("item_fts")
+                matches = (
+                    select(column("rowid").label("id"), (-func.bm25(fts, NAME_WEIGHT, 1.0)).label("score"))
+                    .select_from(table("item_fts"))
+                    .where(fts.op("MATCH")(fts5_query_text(tokens, prefix)))
+                    .subquery()
+                )
+                return stmt.join(matches, matches.c.id == Item.id), matches.c.score
+
+        search_term = f"%{name.lower()}%"
+        stmt = stmt.where(
+            or_(
+                self.model.name.ilike(search_term),
+                self.model.description.ilike(search_term)
+            )
+        )
+        return stmt, None
+
+    def _filter_stmt(
+        self, *, filters: ItemFilter, owner_id: int, dialect: str
+    ) -> Tuple[Select, Optional[ColumnElement]]:
+        """
+        将所有筛选条件组合进同一条查询，返回语句及（有搜索词时的）相关度得分
+        """
+        stmt = select(self.model).where(Item.owner_id == owner_id)
+        if filters.categories:
+            stmt = stmt.where(Item.category_id.in_(
+                self._category_ids(categories=filters.categories, owner_id=owner_id)
+            ))
+        if filters.location_id is not None:
+            if filters.include_sublocations:
+                # 递归 CTE 展开该位置及其所有子位置
+                subtree = (
+                    select(Location.id)
+                    .where(Location.id == filters.location_id, Location.owner_id == owner_id)
+                    .cte("location_subtree", recursive=True)
+                )
+                subtree = subtree.union_all(
+                    select(Location.id).where(
+                        Location.parent_id == subtree.c.id, Location.owner_id == owner_id
+                    )
+                )
+                stmt = stmt.where(Item.location_id.in_(select(subtree.c.id)))
+            else:
+                stmt = stmt.where(Item.location_id == filters.location_id)
+        bounds = to_db_values({
+            "purchased_after": filters.purchased_after,
+            "purchased_before": filters.purchased_before,
+            "expires_after": filters.expires_after,
+            "expires_before": filters.expires_before,
+        })
+        for column_, lower, upper in (
+            (Item.price, filters.min_price, filters.max_price),
+            (Item.purchase_date, bounds["purchased_after"], bounds["purchased_before"]),
+            (Item.expiry_date, bounds["expires_after"], bounds["expires_before"]),
+        ):
+            if lower is not None:
+                stmt = stmt.where(column_ >= lower)
+            if upper is not None:
+                stmt = stmt.where(column_ <= upper)
+        if filters.search:
+            return self._search_stmt(stmt, name=filters.search, dialect=dialect)
+        return stmt, None
+
+    def _filtered(
+        self, *, filters: ItemFilter, owner_id: int, dialect: str, skip: int, limit: int,
+        cursor: Optional[Cursor], sort: Optional[str], fields: Optional[Sequence[str]]
+    ) -> Select:
+        # 有搜索词且未指定排序（或游标）时按相关度从高到低返回，相关度相同按 id 排列
+        stmt, score = self._filter_stmt(filters=filters, owner_id=owner_id, dialect=dialect)
+        if score is None or sort or cursor:
+            return self._page(stmt, skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields)
+        stmt = self._load_fields(stmt, fields)
+        return stmt.order_by(score.desc(), Item.id).offset(skip).limit(limit)
+
+    def get_filtered(
+        self, db: Session, *, filters: ItemFilter, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Item]:
+        """
+        按组合筛选条件查询物品，所有条件在同一条 SQL 中完成
+        """
+        stmt = self._filtered(
+            filters=filters, owner_id=owner_id, dialect=db.get_bind().dialect.name,
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list(db.execute(stmt).scalars().all())
+
+    def get_facets(
+        self, db: Session, *, filters: ItemFilter, owner_id: int, now: datetime
+    ) -> Dict[str, Any]:
+        """
+        符合筛选条件的物品总数，以及按类别、按位置和按临期分组的数量（一条 SQL）
+        """
+        stmt = self._facets_stmt(
+            filters=filters, owner_id=owner_id, dialect=db.get_bind().dialect.name, now=now
+        )
+        return self._facet_result(db.execute(stmt).all())
+
+    def _expiry_condition(self, bucket: str, now: datetime) -> ColumnElement:
+        days = EXPIRY_BUCKETS[bucket]
+        if days is None:
+            return Item.expiry_date < now
+        return (Item.expiry_date >= now) & (Item.expiry_date < now + timedelta(days=days))
+
+    def _expiring_stmt(self, *, owner_id: int, bucket: str, now: datetime) -> Select:
+        return select(self.model).where(
+            Item.owner_id == owner_id, self._expiry_condition(bucket, now)
+        )
+
+    def _expiry_counts_stmt(self, *, owner_id: int, now: datetime) -> Select:
+        """
+        一条聚合查询返回所有分组的数量；WHERE 只取最大分组上限之前的物品，
+        可以在 (owner_id, expiry_date) 索引上做范围扫描
+        """
+        horizon = now + timedelta(days=max(days for days in EXPIRY_BUCKETS.values() if days))
+        return select(*(
+            func.count(case((self._expiry_condition(bucket, now), 1))).label(bucket)
+            for bucket in EXPIRY_BUCKETS
+        )).where(Item.owner_id == owner_id, Item.expiry_date < horizon)
+
+    def _facets_stmt(
+        self, *, filters: ItemFilter, owner_id: int, dialect: str, now: datetime
+    ) -> CompoundSelect:
+        """
+        分面计数：筛选结果作为 CTE（每行带上所属的临期区间），再把按类别、按位置、按临期区间的
+        GROUP BY 用 UNION ALL 合成一条语句，一次往返返回 (facet, key, location_id, count) 各行
+        """
+        stmt, _ = self._filter_stmt(filters=filters, owner_id=owner_id, dialect=dialect)
+        # 不相交的临期区间，累计分组的数量在 _facet_result 中求和得到
+        expiry_range = case(
+            (Item.expiry_date < now, "expired"),
+            *(
+                (Item.expiry_date < now + timedelta(days=days), bucket)
+                for bucket, days in EXPIRY_BUCKETS.items() if days
+            ),
+        )
+        base = stmt.with_only_columns(
+            Item.category_id, Item.location_id, expiry_range.label("expiry_range")
+        ).cte("faceted_item")
+        count = func.count().label("count")
+        return union_all(
+            select(literal("category").label("facet"), Category.name.label("key"),
+                   null().label("location_id"), count)
+            .select_from(base.outerjoin(Category, Category.id == base.c.category_id))
+            .group_by(base.c.category_id, Category.name),
+            select(literal("location"), Location.name, base.c.location_id, count)
+            .select_from(base.outerjoin(Location, Location.id == base.c.location_id))
+            .group_by(base.c.location_id, Location.name),
+            select(literal("expiry"), base.c.expiry_range, null(), count)
+            .where(base.c.expiry_range.is_not(None))
+            .group_by(base.c.expiry_range),
+        )
+
+    @staticmethod
+    def _facet_result(rows: Sequence[Row]) -> Dict[str, Any]:
+        """
+        分面计数行整理为结果：类别和位置按数量从多到少（相同时按名称）排列，临期分组为累计数量
+        """
+        categories, locations, ranges = [], [], {}
+        for row in rows:
+            if row.facet == "category":
+                categories.append({"name": row.key, "count": row.count})
+            elif row.facet == "location":
+                locations.append({"id": row.location_id, "name": row.key, "count": row.count})
+            else:
+                ranges[row.key] = row.count
+        expiry, running = {}, 0
+        for bucket, days in EXPIRY_BUCKETS.items():
+            if days is None:
+                expiry[bucket] = ranges.get(bucket, 0)
+            else:
+                running += ranges.get(bucket, 0)
+                expiry[bucket] = running
+        return {
+            "total": sum(facet["count"] for facet in categories),
+            "categories": sorted(categories, key=_facet_order),
+            "locations": sorted(locations, key=_facet_order),
+            "expiry": expiry,
+        }
+
+    def _export_stmt(self, *, owner_id: int) -> Select:
+        """
+        导出查询：按 id 顺序返回物品各列，位置通过递归 CTE 拼接为完整路径（如 "厨房 / 冰箱"）
+        """
+        paths = location_paths(owner_id)
         return (
-            db.query(self.model)
-            .filter(Item.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+            select(
+                Item.id, Item.name, Item.description, Category.name.label("category"),
+                Item.quantity, Item.price, Item.purchase_date, Item.expiry_date,
+                paths.c.path.label("location"), Item.created_at, Item.updated_at,
+            )
+            .outerjoin(Category, Category.id == Item.category_id)
+            .outerjoin(paths, paths.c.id == Item.location_id)
+            .where(Item.owner_id == owner_id)
+            .order_by(Item.id)
+        )
+
+    def get_multi_by_owner(
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def get_by_location(
-        self, db: Session, *, location_id: int, skip: int = 0, limit: int = 100, owner_id: Optional[int] = None
+        self, db: Session, *, location_id: int, skip: int = 0, limit: int = 100, owner_id: Optional[int] = None,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Item]:
-        query = db.query(self.model).filter(Item.location_id == location_id)
-        
-        if owner_id is not None:
-            query = query.filter(Item.owner_id == owner_id)
-            
-        return query.offset(skip).limit(limit).all()
-    
+        stmt = self._page(
+            self._by_location_stmt(location_id=location_id, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list(db.execute(stmt).scalars().all())
+
     def get_by_category(
-        self, db: Session, *, category: str, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, category: str, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Item]:
-        return (
-            db.query(self.model)
-            .filter(Item.category == category, Item.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self.get_by_categories(
+            db, categories=[category], owner_id=owner_id, skip=skip, limit=limit,
+            cursor=cursor, sort=sort, fields=fields
         )
-    
+
     def get_by_categories(
-        self, db: Session, *, categories: List[str], owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, categories: List[str], owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Item]:
         """
         获取属于多个类别之一的物品
         """
-        # 使用 OR 条件组合多个类别查询
-        category_filters = [Item.category == category for category in categories]
-        return (
-            db.query(self.model)
-            .filter(or_(*category_filters), Item.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = self._page(
+            self._by_categories_stmt(categories=categories, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def search_by_name(
-        self, db: Session, *, name: str, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, name: str, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Item]:
         """
-        通过名称或描述搜索物品
+        通过名称或描述搜索物品，默认按相关度排序
         """
-        search_term = f"%{name.lower()}%"
-        return (
-            db.query(self.model)
-            .filter(
-                or_(
-                    self.model.name.ilike(search_term),
-                    self.model.description.ilike(search_term)
-                ),
-                self.model.owner_id == owner_id
+        return self.get_filtered(
+            db, filters=ItemFilter(search=name), owner_id=owner_id,
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+
+    def _prepare_rows(
+        self, db: Session, rows: List[Dict[str, Any]], *, owner_id: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        # 与 ORM 写入事件一致：名称或描述随同一条语句写入对应的检索词元；
+        # 类别名称换成类别ID，整批只查询（必要时创建）一次类别
+        names = {row["category"] for row in rows if row.get("category")}
+        category_ids = (
+            resolve_category_ids(db.connection(), owner_id=owner_id, names=names) if names else {}
+        )
+        for row in rows:
+            if "name" in row:
+                row["name_tokens"] = search_tokens(row["name"])
+            if "description" in row:
+                row["description_tokens"] = search_tokens(row["description"])
+            if "category" in row:
+                category = row.pop("category")
+                row["category_id"] = category_ids[category] if category else None
+        return rows
+
+    def _returning(self) -> Tuple[Any, ...]:
+        return (*super()._returning(), _RETURNING_CATEGORY)
+
+    def load_multi(
+        self, db: Session, *, objs_in: Sequence[ItemCreate], owner_id: int, commit: bool = True
+    ) -> int:
+        """
+        大批量写入物品（用于导入），不返回新行：PostgreSQL（psycopg2）上使用 COPY，
+        其他数据库使用 executemany 的 INSERT。返回写入的行数
+        """
+        if not objs_in:
+            return 0
+        now = datetime.utcnow()
+        rows = []
+        for obj_in in objs_in:
+            values = to_db_values(obj_in.model_dump())
+            values.update(owner_id=owner_id, created_at=now, updated_at=now)
+            rows.append(values)
+        rows = self._prepare_rows(db, rows, owner_id=owner_id)
+        bind = db.get_bind()
+        if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+            self._copy_rows(db, rows)
+        else:
+            db.execute(insert(Item.__table__), rows)
+        self._bump_version(db, [owner_id])
+        if commit:
+            db.commit()
+        return len(rows)
+
+    @staticmethod
+    def _copy_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+        """
+        COPY item FROM STDIN（CSV 格式）：未加引号的空字段为 NULL，其余值都加引号
+        """
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_copy_field(row[name]) for name in columns) + "\n")
+        buffer.seek(0)
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Item.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
             )
-            .offset(skip)
-            .limit(limit)
-            .all()
+        finally:
+            cursor.close()
+        # COPY 直接在 DBAPI 连接上执行，不经过 ORM 的写入事件
+        flag_writes(db)
+
+    def remove_multi(
+        self, db: Session, *, ids: Sequence[int], owner_id: int, commit: bool = True
+    ) -> List[Row]:
+        """
+        批量删除物品；与逐条删除一致，先解除关联提醒对这些物品的引用
+        """
+        if not ids:
+            return []
+        owned_ids = (
+            select(Item.id)
+            .where(Item.id.in_(set(ids)), Item.owner_id == owner_id)
+            .scalar_subquery()
+        )
+        unlinked = db.execute(
+            update(Reminder.__table__)
+            .where(Reminder.__table__.c.item_id.in_(owned_ids))
+            .values(item_id=None)
+        )
+        if unlinked.rowcount:
+            bump_versions(db.connection(), [(owner_id, Reminder.__tablename__)])
+        return super().remove_multi(db, ids=ids, owner_id=owner_id, commit=commit)
+
+    # 异步版本
+
+    async def aget(self, db: AsyncSession, id: Any) -> Optional[Item]:
+        """
+        单个物品，同时读出所属类别的修改时间（单个物品的 ETag 需要它）
+        """
+        stmt = select(Item).where(Item.id == id).options(undefer(Item.category_updated_at))
+        return (await db.execute(stmt)).scalars().first()
+
+    async def aget_multi_by_owner(
+        self, db: AsyncSession, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_by_location(
+        self, db: AsyncSession, *, location_id: int, skip: int = 0, limit: int = 100, owner_id: Optional[int] = None,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        stmt = self._page(
+            self._by_location_stmt(location_id=location_id, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_by_category(
+        self, db: AsyncSession, *, category: str, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        return await self.aget_by_categories(
+            db, categories=[category], owner_id=owner_id, skip=skip, limit=limit,
+            cursor=cursor, sort=sort, fields=fields
+        )
+
+    async def aget_by_categories(
+        self, db: AsyncSession, *, categories: List[str], owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        stmt = self._page(
+            self._by_categories_stmt(categories=categories, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_filtered(
+        self, db: AsyncSession, *, filters: ItemFilter, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        stmt = self._filtered(
+            filters=filters, owner_id=owner_id, dialect=db.get_bind().dialect.name,
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def asearch_by_name(
+        self, db: AsyncSession, *, name: str, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        return await self.aget_filtered(
+            db, filters=ItemFilter(search=name), owner_id=owner_id,
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+
+    async def aget_facets(
+        self, db: AsyncSession, *, filters: ItemFilter, owner_id: int, now: datetime
+    ) -> Dict[str, Any]:
+        stmt = self._facets_stmt(
+            filters=filters, owner_id=owner_id, dialect=db.get_bind().dialect.name, now=now
+        )
+        return self._facet_result((await db.execute(stmt)).all())
+
+    async def aget_expiry_counts(
+        self, db: AsyncSession, *, owner_id: int, now: datetime
+    ) -> Dict[str, int]:
+        row = (await db.execute(self._expiry_counts_stmt(owner_id=owner_id, now=now))).one()
+        return dict(row._mapping)
+
+    async def aget_expiring(
+        self, db: AsyncSession, *, owner_id: int, bucket: str, now: datetime,
+        skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None,
+        sort: Optional[str] = None, fields: Optional[Sequence[str]] = None
+    ) -> List[Item]:
+        """
+        某个临期分组中的物品，默认按过期时间从早到晚排列
+        """
+        stmt = self._page(
+            self._expiring_stmt(owner_id=owner_id, bucket=bucket, now=now),
+            skip=skip, limit=limit, cursor=cursor, sort=sort,
+            default_sort="expiry_date", fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def astream_export(
+        self, db: AsyncSession, *, owner_id: int, batch_size: int = 1000
+    ) -> AsyncIterator[List[Row]]:
+        """
+        以服务端游标（yield_per）分批读取导出数据，每次只在内存中保留一批
+        """
+        stmt = self._export_stmt(owner_id=owner_id).execution_options(yield_per=batch_size)
+        result = await db.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def aget_name_rows(self, db: AsyncSession, *, owner_id: int) -> List[Row]:
+        """
+        用户物品中去重后的 (name, category)，用于构建输入联想索引
+        """
+        stmt = (
+            select(Item.name, Category.name)
+            .outerjoin(Category, Category.id == Item.category_id)
+            .where(Item.owner_id == owner_id)
+            .distinct()
         )
+        return list((await db.execute(stmt)).all())
 
 
-item = CRUDItem(Item) 
\ No newline at end of file
+item = CRUDItem(Item)
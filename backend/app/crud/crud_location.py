@@ -1,67 +1,206 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Collection, Sequence, Set
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, literal, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import CTE
 
+from app.core.export import LOCATION_PATH_SEPARATOR
 from app.crud.base import CRUDBase
+from app.crud.crud_tombstone import tombstone
+from app.crud.pagination import Cursor
+from app.models.item import Item
 from app.models.location import Location
-from app.schemas.location import LocationCreate, LocationUpdate, LocationTree
+from app.schemas.location import LocationCreate, LocationUpdate, LocationTree, Location as LocationSchema
+
+
+def location_paths(owner_id: int) -> CTE:
+    """
+    递归 CTE location_path(id, name, path)：该用户每个位置从根位置起的完整路径（如 "厨房 / 冰箱"）
+    """
+    paths = (
+        select(Location.id, Location.name, Location.name.label("path"))
+        .where(Location.owner_id == owner_id, Location.parent_id.is_(None))
+        .cte("location_path", recursive=True)
+    )
+    return paths.union_all(
+        select(
+            Location.id, Location.name,
+            paths.c.path + literal(LOCATION_PATH_SEPARATOR) + Location.name,
+        )
+        .where(Location.parent_id == paths.c.id, Location.owner_id == owner_id)
+    )
 
 
 class CRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
+    sortable_fields = ("id", "name", "created_at", "updated_at")
+    tombstone_type = "location"
+
+    # 查询语句构造（同步与异步方法共用）
+
+    def _by_owner_stmt(self, *, owner_id: int) -> Select:
+        return select(self.model).where(Location.owner_id == owner_id)
+
+    def _by_parent_stmt(self, *, parent_id: Optional[int], owner_id: int) -> Select:
+        if parent_id is None:
+            # Get root locations (without parent)
+            parent_filter = Location.parent_id.is_(None)
+        else:
+            parent_filter = Location.parent_id == parent_id
+        return select(self.model).where(parent_filter, Location.owner_id == owner_id)
+
     def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Location]:
-        return (
-            db.query(self.model)
-            .filter(Location.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def get_multi_by_parent(
         self, db: Session, *, parent_id: Optional[int], owner_id: int
     ) -> List[Location]:
-        if parent_id is None:
-            # Get root locations (without parent)
-            return (
-                db.query(self.model)
-                .filter(Location.parent_id.is_(None), Location.owner_id == owner_id)
-                .all()
-            )
-        else:
-            return (
-                db.query(self.model)
-                .filter(Location.parent_id == parent_id, Location.owner_id == owner_id)
-                .all()
-            )
-    
+        stmt = self._by_parent_stmt(parent_id=parent_id, owner_id=owner_id)
+        return list(db.execute(stmt).scalars().all())
+
     def get_location_tree(
         self, db: Session, *, owner_id: int
     ) -> List[LocationTree]:
         # Get root locations
         root_locations = self.get_multi_by_parent(db, parent_id=None, owner_id=owner_id)
         result = []
-        
+
         for location in root_locations:
             location_tree = LocationTree.model_validate(location)
             location_tree.children = self._get_children_recursive(db, location.id, owner_id)
             result.append(location_tree)
-        
+
         return result
-    
+
     def _get_children_recursive(
         self, db: Session, parent_id: int, owner_id: int
     ) -> List[LocationTree]:
         children = self.get_multi_by_parent(db, parent_id=parent_id, owner_id=owner_id)
         result = []
-        
+
         for child in children:
             child_tree = LocationTree.model_validate(child)
             child_tree.children = self._get_children_recursive(db, child.id, owner_id)
             result.append(child_tree)
-        
+
         return result
 
+    @staticmethod
+    def build_tree(locations: List[Location]) -> List[LocationTree]:
+        """
+        用一次查询得到的全部位置在内存中组装位置树
+        """
+        nodes: Dict[int, LocationTree] = {
+            loc.id: LocationTree(**LocationSchema.model_validate(loc).model_dump())
+            for loc in locations
+        }
+        roots: List[LocationTree] = []
+        for loc in locations:
+            node = nodes[loc.id]
+            parent = nodes.get(loc.parent_id) if loc.parent_id is not None else None
+            if parent is not None:
+                parent.children.append(node)
+            elif loc.parent_id is None:
+                roots.append(node)
+        return roots
+
+    def remove_empty_owned(
+        self, db: Session, *, id: int, owner_id: int, commit: bool = True
+    ) -> Optional[Row]:
+        """
+        删除该用户名下没有物品和子位置的位置：检查与删除在同一条 DELETE ... RETURNING 中完成，
+        条件不满足时返回 None
+        """
+        table = Location.__table__
+        children = Location.__table__.alias("child")
+        stmt = (
+            delete(table)
+            .where(
+                table.c.id == id,
+                table.c.owner_id == owner_id,
+                ~exists().where(Item.__table__.c.location_id == id),
+                ~exists().where(children.c.parent_id == id),
+            )
+            .returning(*table.c)
+        )
+        removed = db.execute(stmt).first()
+        if removed is not None:
+            self._bump_version(db, [owner_id])
+            tombstone.record(db, entity_type=self.tombstone_type, rows=[removed])
+        if commit:
+            db.commit()
+        return removed
+
+    def resolve_paths(
+        self, db: Session, *, names: Collection[str], owner_id: int
+    ) -> Dict[str, Optional[int]]:
+        """
+        一次查询把位置路径或名称解析为位置ID：完整路径优先；只给名称时需唯一匹配，
+        同名位置有多个时对应 None；找不到的名称不出现在结果中
+        """
+        if not names:
+            return {}
+        paths = location_paths(owner_id)
+        rows = db.execute(
+            select(paths.c.id, paths.c.name, paths.c.path)
+            .where(or_(paths.c.path.in_(names), paths.c.name.in_(names)))
+        ).all()
+        by_path: Dict[str, int] = {}
+        by_name: Dict[str, Set[int]] = {}
+        for row in rows:
+            by_path[row.path] = row.id
+            by_name.setdefault(row.name, set()).add(row.id)
+        resolved: Dict[str, Optional[int]] = {}
+        for name in names:
+            if name in by_path:
+                resolved[name] = by_path[name]
+            elif name in by_name:
+                ids = by_name[name]
+                resolved[name] = next(iter(ids)) if len(ids) == 1 else None
+        return resolved
+
+    # 异步版本
+
+    async def aget_multi_by_owner(
+        self, db: AsyncSession, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Location]:
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_multi_by_parent(
+        self, db: AsyncSession, *, parent_id: Optional[int], owner_id: int
+    ) -> List[Location]:
+        stmt = self._by_parent_stmt(parent_id=parent_id, owner_id=owner_id)
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_location_tree(
+        self, db: AsyncSession, *, owner_id: int
+    ) -> List[LocationTree]:
+        stmt = select(self.model).where(Location.owner_id == owner_id).order_by(Location.id)
+        locations = (await db.execute(stmt)).scalars().all()
+        return self.build_tree(list(locations))
+
+    async def aget_name_rows(self, db: AsyncSession, *, owner_id: int) -> List[Row]:
+        """
+        用户所有位置的 (id, name)，用于构建输入联想索引
+        """
+        stmt = select(Location.id, Location.name).where(Location.owner_id == owner_id)
+        return list((await db.execute(stmt)).all())
+
 
-location = CRUDLocation(Location) 
\ No newline at end of file
+location = CRUDLocation(Location)
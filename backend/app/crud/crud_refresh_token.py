@@ -0,0 +1,107 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.refresh_token import RefreshToken
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class CRUDRefreshToken:
+    """
+    刷新令牌：每次刷新都轮换出新令牌，旧令牌作废；
+    已使用过的令牌再次出现视为泄露，吊销整个令牌族。
+    """
+
+    def issue(
+        self, db: Session, *, user_id: int, family_id: Optional[str] = None, commit: bool = True
+    ) -> str:
+        token = secrets.token_urlsafe(48)
+        db_obj = RefreshToken(
+            token_hash=hash_token(token),
+            family_id=family_id or secrets.token_hex(16),
+            user_id=user_id,
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        db.add(db_obj)
+        if commit:
+            db.commit()
+        return token
+
+    def get_by_token(self, db: Session, *, token: str) -> Optional[RefreshToken]:
+        return (
+            db.query(RefreshToken)
+            .filter(RefreshToken.token_hash == hash_token(token))
+            .first()
+        )
+
+    def rotate(self, db: Session, *, token: str) -> Optional[Tuple[Row, str]]:
+        """
+        校验并轮换刷新令牌，成功返回 (旧令牌的 user_id / family_id, 新令牌)，失败返回 None。
+        消费旧令牌是一条带条件的 UPDATE：并发使用同一令牌时只有一个请求能更新成功，
+        其余请求按重用处理
+        """
+        now = datetime.utcnow()
+        consumed = db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_token(token),
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked == False,
+                RefreshToken.expires_at > now,
+            )
+            .values(used_at=now)
+            .returning(RefreshToken.user_id, RefreshToken.family_id)
+        ).first()
+        if consumed is None:
+            db_obj = self.get_by_token(db, token=token)
+            if db_obj is not None and (db_obj.used_at is not None or db_obj.revoked):
+                # 重用检测：令牌已被轮换过，说明可能泄露，吊销整个令牌族
+                self.revoke_family(db, family_id=db_obj.family_id)
+            else:
+                db.rollback()
+            return None
+        new_token = self.issue(
+            db, user_id=consumed.user_id, family_id=consumed.family_id, commit=False
+        )
+        db.commit()
+        return consumed, new_token
+
+    def revoke_family(self, db: Session, *, family_id: str) -> None:
+        db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id)
+            .values(revoked=True)
+        )
+        db.commit()
+
+    def revoke_all_for_user(self, db: Session, *, user_id: int, commit: bool = True) -> None:
+        db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
+            .values(revoked=True)
+        )
+        if commit:
+            db.commit()
+
+    def prune(self, db: Session, *, now: Optional[datetime] = None) -> int:
+        """
+        删除已过期的令牌（包括已使用和已吊销的），返回删除的行数。
+        过期令牌本身已无法刷新，重用检测只需要保留有效期内的记录
+        """
+        result = db.execute(
+            delete(RefreshToken).where(RefreshToken.expires_at <= (now or datetime.utcnow()))
+        )
+        db.commit()
+        return result.rowcount
+
+
+refresh_token = CRUDRefreshToken()
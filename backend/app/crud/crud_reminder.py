@@ -1,14 +1,21 @@
-from typing import List, Optional
-from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence
+from datetime import datetime, timedelta
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.sql import Select
 
 from app.crud.base import CRUDBase
+from app.crud.pagination import Cursor
 from app.models.reminder import Reminder
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
 
 
 class CRUDReminder(CRUDBase[Reminder, ReminderCreate, ReminderUpdate]):
+    sortable_fields = ("id", "title", "due_date", "created_at", "updated_at")
+    tombstone_type = "reminder"
+
     def create_with_owner(
         self, db: Session, *, obj_in: ReminderCreate, owner_id: int
     ) -> Reminder:
@@ -22,87 +29,176 @@ class CRUDReminder(CRUDBase[Reminder, ReminderCreate, ReminderUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    # 查询语句构造（同步与异步方法共用），排序和分页由 _page 统一添加
+
+    def _by_owner_stmt(self, *, owner_id: int) -> Select:
+        return select(self.model).where(Reminder.owner_id == owner_id)
+
+    def _by_item_stmt(self, *, item_id: int, owner_id: Optional[int]) -> Select:
+        stmt = select(self.model).where(Reminder.item_id == item_id)
+        if owner_id is not None:
+            stmt = stmt.where(Reminder.owner_id == owner_id)
+        return stmt
+
+    def _due_stmt(self, *, owner_id: int) -> Select:
+        # 数据库中的时间为无时区的 UTC 时间
+        now = datetime.utcnow()
+        return (
+            select(self.model)
+            .where(Reminder.owner_id == owner_id)
+            .where(Reminder.due_date <= now)
+            .where(Reminder.is_completed == False)
+        )
+
+    def _upcoming_stmt(self, *, owner_id: int, days: int) -> Select:
+        now = datetime.utcnow()
+        future = now + timedelta(days=days)
+        return (
+            select(self.model)
+            .where(Reminder.owner_id == owner_id)
+            .where(Reminder.due_date > now)
+            .where(Reminder.due_date <= future)
+            .where(Reminder.is_completed == False)
+        )
+
+    def _owned_stmt(self, *, reminder_id: int, owner_id: int) -> Select:
+        return select(self.model).where(
+            Reminder.id == reminder_id,
+            Reminder.owner_id == owner_id
+        )
+
     def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Reminder]:
         """
         获取特定用户的所有提醒
         """
-        return (
-            db.query(self.model)
-            .filter(Reminder.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def get_multi_by_item(
-        self, db: Session, *, item_id: int, owner_id: Optional[int] = None, skip: int = 0, limit: int = 100
+        self, db: Session, *, item_id: int, owner_id: Optional[int] = None, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Reminder]:
         """
         根据物品ID获取提醒列表
         """
-        query = db.query(self.model).filter(Reminder.item_id == item_id)
-        if owner_id is not None:
-            query = query.filter(Reminder.owner_id == owner_id)
-        return query.offset(skip).limit(limit).all()
-    
+        stmt = self._page(
+            self._by_item_stmt(item_id=item_id, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list(db.execute(stmt).scalars().all())
+
     def get_due_reminders(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Reminder]:
         """
         获取当前已到期但未完成的提醒
         """
-        now = datetime.now(timezone.utc)
-        return (
-            db.query(self.model)
-            .filter(Reminder.owner_id == owner_id)
-            .filter(Reminder.due_date <= now)
-            .filter(Reminder.is_completed == False)
-            .order_by(Reminder.due_date)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = self._page(
+            self._due_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields, default_sort="due_date"
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def get_upcoming_reminders(
-        self, db: Session, *, owner_id: int, days: int = 7, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, days: int = 7, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Reminder]:
         """
         获取即将到期的提醒（未来n天内到期且未完成）
         """
-        now = datetime.now(timezone.utc)
-        future = now + timedelta(days=days)
-        return (
-            db.query(self.model)
-            .filter(Reminder.owner_id == owner_id)
-            .filter(Reminder.due_date > now)
-            .filter(Reminder.due_date <= future)
-            .filter(Reminder.is_completed == False)
-            .order_by(Reminder.due_date)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = self._page(
+            self._upcoming_stmt(owner_id=owner_id, days=days),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields, default_sort="due_date"
         )
-    
+        return list(db.execute(stmt).scalars().all())
+
     def mark_completed(
         self, db: Session, *, reminder_id: int, owner_id: int
     ) -> Reminder:
         """
         将提醒标记为已完成
         """
-        reminder = db.query(self.model).filter(
-            Reminder.id == reminder_id,
-            Reminder.owner_id == owner_id
-        ).first()
-        
+        stmt = self._owned_stmt(reminder_id=reminder_id, owner_id=owner_id)
+        reminder = db.execute(stmt).scalars().first()
+
         if reminder:
             reminder.is_completed = True
             db.add(reminder)
             db.commit()
             db.refresh(reminder)
-        
+
+        return reminder
+
+    # 异步版本
+
+    async def aget_multi_by_owner(
+        self, db: AsyncSession, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Reminder]:
+        stmt = self._page(
+            self._by_owner_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_multi_by_item(
+        self, db: AsyncSession, *, item_id: int, owner_id: Optional[int] = None, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Reminder]:
+        stmt = self._page(
+            self._by_item_stmt(item_id=item_id, owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_due_reminders(
+        self, db: AsyncSession, *, owner_id: int, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Reminder]:
+        stmt = self._page(
+            self._due_stmt(owner_id=owner_id),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields, default_sort="due_date"
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def aget_upcoming_reminders(
+        self, db: AsyncSession, *, owner_id: int, days: int = 7, skip: int = 0, limit: int = 100,
+        cursor: Optional[Cursor] = None, sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Reminder]:
+        stmt = self._page(
+            self._upcoming_stmt(owner_id=owner_id, days=days),
+            skip=skip, limit=limit, cursor=cursor, sort=sort, fields=fields, default_sort="due_date"
+        )
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def amark_completed(
+        self, db: AsyncSession, *, reminder_id: int, owner_id: int
+    ) -> Optional[Reminder]:
+        stmt = self._owned_stmt(reminder_id=reminder_id, owner_id=owner_id)
+        reminder = (await db.execute(stmt)).scalars().first()
+
+        if reminder:
+            reminder.is_completed = True
+            db.add(reminder)
+            await db.commit()
+            await db.refresh(reminder)
+
         return reminder
 
 
-reminder = CRUDReminder(Reminder) 
\ No newline at end of file
+reminder = CRUDReminder(Reminder)
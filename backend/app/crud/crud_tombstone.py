@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert, Select
+
+from app.core.settings import settings
+from app.crud.pagination import Cursor, paginate
+from app.models.tombstone import Tombstone
+
+
+class CRUDTombstone:
+    """
+    删除墓碑：删除物品、位置、提醒时在同一事务中写入，增量同步据此下发删除
+    """
+
+    def _record_stmt(self, *, entity_type: str, rows: Iterable) -> Optional[Insert]:
+        now = datetime.utcnow()
+        values = [
+            {"entity_type": entity_type, "entity_id": row.id, "owner_id": row.owner_id, "deleted_at": now}
+            for row in rows
+            if row.owner_id is not None
+        ]
+        if not values:
+            return None
+        return insert(Tombstone.__table__).values(values)
+
+    def record(self, db: Session, *, entity_type: str, rows: Iterable) -> None:
+        """
+        为被删除的记录（需要 id 和 owner_id 属性）写入墓碑，不提交
+        """
+        stmt = self._record_stmt(entity_type=entity_type, rows=rows)
+        if stmt is not None:
+            db.execute(stmt)
+
+    async def arecord(self, db: AsyncSession, *, entity_type: str, rows: Iterable) -> None:
+        stmt = self._record_stmt(entity_type=entity_type, rows=rows)
+        if stmt is not None:
+            await db.execute(stmt)
+
+    def _since_stmt(
+        self, *, owner_id: int, until: datetime, cursor: Optional[Cursor], limit: int
+    ) -> Select:
+        stmt = select(Tombstone).where(Tombstone.owner_id == owner_id, Tombstone.deleted_at <= until)
+        return paginate(stmt, Tombstone, sort="deleted_at", limit=limit, cursor=cursor)
+
+    @staticmethod
+    def retention_cutoff(now: Optional[datetime] = None) -> datetime:
+        """
+        墓碑保留窗口的起点：早于它的墓碑可能已被清理
+        """
+        return (now or datetime.utcnow()) - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+
+    def prune(self, db: Session, *, now: Optional[datetime] = None) -> int:
+        """
+        删除超过保留期的墓碑，返回删除的行数
+        """
+        result = db.execute(
+            delete(Tombstone).where(Tombstone.deleted_at < self.retention_cutoff(now))
+        )
+        db.commit()
+        return result.rowcount
+
+    async def aget_since(
+        self, db: AsyncSession, *, owner_id: int, until: datetime, cursor: Optional[Cursor], limit: int
+    ) -> List[Tombstone]:
+        stmt = self._since_stmt(owner_id=owner_id, until=until, cursor=cursor, limit=limit)
+        return list((await db.execute(stmt)).scalars().all())
+
+
+tombstone = CRUDTombstone()
@@ -1,9 +1,18 @@
 from typing import Any, Dict, Optional, Union
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import user_cache
+from app.core.revocation import revocation_list
+from app.core.security import (
+    dummy_verify_password,
+    get_password_hash,
+    verify_and_update_password,
+)
 from app.crud.base import CRUDBase
+from app.crud.crud_refresh_token import refresh_token
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -55,22 +64,57 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             update_data["last_name"] = name_parts[1] if len(name_parts) > 1 else ""
             del update_data["full_name"]
             
-        if update_data.get("password"):
+        # 用户名可能被修改，先失效旧用户名对应的缓存
+        user_cache.invalidate(db_obj.username)
+        password_changed = bool(update_data.get("password"))
+        if password_changed:
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+            # 改密后已签发的刷新令牌全部作废，与用户更新在同一事务中提交
+            refresh_token.revoke_all_for_user(db, user_id=db_obj.id, commit=False)
+        user = super().update(db, db_obj=db_obj, obj_in=update_data)
+        user_cache.invalidate(user.username)
+
+        # 让无状态令牌尽快感知停用和改密
+        if password_changed:
+            revocation_list.revoke_tokens(user.id)
+        if "is_active" in update_data:
+            if user.is_active:
+                revocation_list.activate(user.id)
+            else:
+                revocation_list.deactivate(user.id)
+        return user
+
+    def remove(self, db: Session, *, id: int) -> User:
+        user = super().remove(db, id=id)
+        user_cache.invalidate(user.username)
+        revocation_list.deactivate(user.id)
+        return user
 
     def authenticate(self, db: Session, *, username: str, password: str) -> Optional[User]:
         user = self.get_by_username(db, username=username)
         if not user:
+            dummy_verify_password(password)
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            # 哈希参数已过时，借登录时拿到的明文密码按当前配置重新哈希
+            user.hashed_password = new_hash
+            db.add(user)
+            db.commit()
         return user
 
     def is_active(self, user: User) -> bool:
         return user.is_active
 
+    # 异步版本
+
+    async def aget_by_username(self, db: AsyncSession, *, username: str) -> Optional[User]:
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
+
 
 user = CRUDUser(User) 
\ No newline at end of file
@@ -0,0 +1,240 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime, and_, or_
+from sqlalchemy.sql import Select
+
+
+class PaginationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    游标：上一页最后一行的排序键值和 id，sort 为生成游标时使用的排序（如 "-name"）
+    """
+
+    sort: str
+    value: Any
+    id: int
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """
+    列表接口的分页参数。提供 cursor 时使用键集分页并忽略 skip；
+    sort 为 None 时使用查询自身的默认排序
+    """
+
+    skip: int = 0
+    limit: int = 100
+    cursor: Optional[Cursor] = None
+    sort: Optional[str] = None
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        return {"skip": self.skip, "limit": self.limit, "cursor": self.cursor, "sort": self.sort}
+
+
+def split_sort(sort: str) -> Tuple[str, bool]:
+    """
+    "name" -> ("name", False)，"-name" -> ("name", True)
+    """
+    if sort.startswith("-"):
+        return sort[1:], True
+    return sort, False
+
+
+def parse_sort(sort: Optional[str], allowed: Sequence[str], default: str = "id") -> str:
+    if not sort:
+        return default
+    field, _ = split_sort(sort)
+    if field not in allowed:
+        raise PaginationError(
+            f"Invalid sort field '{field}', allowed: {', '.join(allowed)}"
+        )
+    return sort
+
+
+def resolve_page(
+    *,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    sort: Optional[str],
+    allowed: Sequence[str],
+    model: Any = None,
+) -> PageParams:
+    """
+    解析并校验请求中的分页参数；游标自带排序方式，省略 sort 时沿用游标中的排序。
+    提供 model 时按排序列的类型还原并校验游标中的值，构造查询时不会再遇到无效的游标
+    """
+    decoded = decode_cursor(cursor) if cursor else None
+    if decoded is not None:
+        if sort and sort != decoded.sort:
+            raise PaginationError("Cursor does not match the requested sort")
+        sort = decoded.sort
+    if sort:
+        sort = parse_sort(sort, allowed)
+    if decoded is not None and model is not None:
+        field, _ = split_sort(decoded.sort)
+        if field != "id" and decoded.value is not None:
+            value = _check_value(getattr(model, field), decoded.value)
+            decoded = Cursor(sort=decoded.sort, value=value, id=decoded.id)
+    return PageParams(skip=skip, limit=limit, cursor=decoded, sort=sort or None)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column: Any, value: Any) -> Any:
+    # 游标中的时间以 ISO 字符串保存，按列类型还原
+    if isinstance(value, str) and isinstance(column.type, (DateTime, Date)):
+        python_type = datetime if isinstance(column.type, DateTime) else date
+        try:
+            return python_type.fromisoformat(value)
+        except ValueError as e:
+            raise PaginationError("Invalid cursor") from e
+    return value
+
+
+def _check_value(column: Any, value: Any) -> Any:
+    """
+    游标中的值必须与排序列的类型一致：时间为 ISO 字符串，数值列为数字，其余列为字符串
+    """
+    value = _decode_value(column, value)
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is float:
+        python_type = (int, float)
+    if (isinstance(value, bool) and python_type is not bool) or not isinstance(value, python_type):
+        raise PaginationError("Invalid cursor")
+    return value
+
+
+def encode_cursor(sort: str, value: Any, id: int) -> str:
+    payload = json.dumps(
+        {"s": sort, "v": _encode_value(value), "i": id},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort, value, id = payload["s"], payload["v"], payload["i"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise PaginationError("Invalid cursor") from e
+    # 排序值只能是标量，id 只能是整数，否则会原样传给数据库驱动
+    if (
+        not isinstance(sort, str)
+        or not isinstance(value, (str, int, float, bool, type(None)))
+        or not isinstance(id, int)
+        or isinstance(id, bool)
+    ):
+        raise PaginationError("Invalid cursor")
+    return Cursor(sort=sort, value=value, id=id)
+
+
+def paginate(
+    stmt: Select,
+    model: Any,
+    *,
+    sort: str,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+) -> Select:
+    """
+    按 (排序键, id) 排序并分页：提供游标时使用键集分页（WHERE (key, id) > (上一页末行)），
+    否则沿用 OFFSET 分页以兼容旧的 skip/limit 参数。排序键为 NULL 的行排在最后。
+    """
+    if cursor is not None and cursor.sort != sort:
+        raise PaginationError("Cursor does not match the requested sort")
+    field, descending = split_sort(sort)
+    pk = model.id
+    if field == "id":
+        order_by = [pk.desc() if descending else pk.asc()]
+        if cursor is not None:
+            stmt = stmt.where(pk < cursor.id if descending else pk > cursor.id)
+    else:
+        column = getattr(model, field)
+        order_by = [
+            (column.desc() if descending else column.asc()).nulls_last(),
+            pk.desc() if descending else pk.asc(),
+        ]
+        if cursor is not None:
+            after_id = pk < cursor.id if descending else pk > cursor.id
+            if cursor.value is None:
+                stmt = stmt.where(column.is_(None), after_id)
+            else:
+                value = _decode_value(column, cursor.value)
+                beyond = column < value if descending else column > value
+                stmt = stmt.where(
+                    or_(beyond, and_(column == value, after_id), column.is_(None))
+                )
+
+    if cursor is None:
+        stmt = stmt.offset(skip)
+    return stmt.order_by(*order_by).limit(limit)
+
+
+def next_cursor(rows: List[Any], *, sort: str, limit: int) -> Optional[str]:
+    """
+    本页已满时返回指向下一页的游标，否则返回 None
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    field, _ = split_sort(sort)
+    return encode_cursor(sort, getattr(last, field), last.id)
+
+
+# 同步游标中记录删除已全部下发到的时间点的键（不是某类数据的位置）
+_DELETED_UNTIL = "deleted_until"
+
+
+def encode_sync_cursor(
+    positions: Dict[str, Cursor], deleted_until: Optional[datetime] = None
+) -> str:
+    """
+    增量同步游标：记录每类数据已同步到的 (时间, id) 位置，
+    以及该时间点之前的删除已全部下发（用于判断游标是否超出墓碑保留期）
+    """
+    payload: Dict[str, Any] = {
+        name: [cursor.sort, _encode_value(cursor.value), cursor.id]
+        for name, cursor in positions.items()
+    }
+    if deleted_until is not None:
+        payload[_DELETED_UNTIL] = _encode_value(deleted_until)
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(token: str) -> Tuple[Dict[str, Cursor], Optional[datetime]]:
+    """
+    返回 (各类数据的位置, 删除已下发到的时间点)；旧格式的游标没有后者，为 None
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        deleted_until = payload.pop(_DELETED_UNTIL, None)
+        positions = {
+            str(name): Cursor(sort=str(sort), value=value, id=int(id))
+            for name, (sort, value, id) in payload.items()
+        }
+        return positions, datetime.fromisoformat(deleted_until) if deleted_until else None
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise PaginationError("Invalid cursor") from e
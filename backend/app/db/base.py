@@ -2,6 +2,10 @@
 # imported by Alembic
 from app.db.base_class import Base  # noqa
 from app.models.user import User  # noqa
+from app.models.category import Category  # noqa
 from app.models.item import Item  # noqa
 from app.models.location import Location  # noqa
-from app.models.reminder import Reminder  # noqa 
\ No newline at end of file
+from app.models.reminder import Reminder  # noqa
+from app.models.refresh_token import RefreshToken  # noqa
+from app.models.tombstone import Tombstone  # noqa
+from app.models.collection_version import CollectionVersion  # noqa
@@ -0,0 +1,81 @@
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, ORMExecuteState
+
+from app.core.settings import settings
+
+
+class RecentWriteTracker:
+    """
+    记录用户最近一次写入主库的时间。在粘滞窗口内，该用户的读请求仍然走主库，
+    避免从库复制延迟导致读不到刚写入的数据。
+    """
+
+    def __init__(self, window: float, max_entries: int = 10000) -> None:
+        self.window = window
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._expires: Dict[int, float] = {}
+
+    def mark(self, user_id: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._expires) >= self.max_entries:
+                self._expires = {
+                    uid: expires for uid, expires in self._expires.items() if expires > now
+                }
+            self._expires[user_id] = now + self.window
+
+    def is_sticky(self, user_id: int) -> bool:
+        expires = self._expires.get(user_id)
+        return expires is not None and expires > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+
+
+recent_writes = RecentWriteTracker(window=settings.REPLICA_STICKINESS_SECONDS)
+
+
+def bind_user(session: Union[Session, AsyncSession], user_id: Optional[int]) -> None:
+    """
+    将当前用户记录到会话上，该会话提交写操作时会标记用户进入粘滞窗口
+    """
+    session.info["user_id"] = user_id
+
+
+def flag_writes(session: Session) -> None:
+    """
+    标记会话中有未提交的写入；用于不经过 ORM 执行的写操作（如 COPY）
+    """
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush_writes(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    # 直接执行的 INSERT/UPDATE/DELETE 语句不经过 flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_user_write(session: Session) -> None:
+    has_writes = session.info.pop("has_writes", False)
+    user_id = session.info.get("user_id")
+    if has_writes and user_id is not None:
+        recent_writes.mark(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_writes(session: Session) -> None:
+    session.info.pop("has_writes", None)
@@ -1,17 +1,96 @@
+from typing import AsyncGenerator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.settings import settings
+from app.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    pool_options,
+)
+from app.db import routing  # noqa: F401  注册写操作跟踪的会话事件
+
+
+# 同步驱动与异步驱动的对应关系
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    将同步数据库URL转换为对应的异步驱动URL，已是异步驱动的URL原样返回
+    """
+    sa_url = make_url(url)
+    driver = ASYNC_DRIVERS.get(sa_url.drivername)
+    if driver is None:
+        return url
+    return sa_url.set(drivername=driver).render_as_string(hide_password=False)
 
-# 同步引擎和会话
-engine = create_engine(str(settings.DATABASE_URL))
+
+# 同步引擎和会话（Alembic、seed_db.py 以及尚未迁移的端点使用）
+engine = create_engine(
+    str(settings.DATABASE_URL), poolclass=InstrumentedQueuePool, **pool_options()
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# 移除异步部分，只保留同步部分
+# 异步引擎和会话（asyncpg），供 async def 端点使用，避免占用线程池线程
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or to_async_url(str(settings.DATABASE_URL)),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **pool_options(),
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# 只读从库引擎和会话；未配置从库时直接复用主库引擎
+replica_enabled = settings.REPLICA_DATABASE_URL is not None
+if replica_enabled:
+    replica_engine = create_engine(
+        settings.REPLICA_DATABASE_URL, poolclass=InstrumentedQueuePool, **pool_options()
+    )
+    async_replica_engine = create_async_engine(
+        settings.ASYNC_REPLICA_DATABASE_URL or to_async_url(settings.REPLICA_DATABASE_URL),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **pool_options(),
+    )
+else:
+    replica_engine = engine
+    async_replica_engine = async_engine
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+AsyncReplicaSessionLocal = async_sessionmaker(
+    bind=async_replica_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_replica_db():
+    db = ReplicaSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_replica_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncReplicaSessionLocal() as db:
+        yield db
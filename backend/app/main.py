@@ -1,3 +1,4 @@
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -5,12 +6,26 @@ import os
 from starlette.responses import RedirectResponse
 
 from app.api.api import api_router
+from app.core.admission import AdmissionControlMiddleware, admission_controller
+from app.core.maintenance import start_maintenance, stop_maintenance
 from app.core.settings import settings
 
 app = FastAPI(
     title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json"
 )
 
+# 准入控制：并发请求数与数据库连接池容量匹配，超出等待队列的请求快速返回503。
+# 先于 CORS 注册，由 CORS 包在外层，503 响应同样带有 CORS 头，浏览器才能读到 Retry-After
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        exempt_paths=("/health", f"{settings.API_V1_STR}/health", "/uploads"),
+    )
+
+# 浏览器脚本可以读取的响应头：分页游标、条件请求的 ETag、限流和准入控制的 Retry-After
+CORS_EXPOSE_HEADERS = ["X-Next-Cursor", "ETag", "Retry-After"]
+
 # Set all CORS enabled origins
 if settings.BACKEND_CORS_ORIGINS or getattr(settings, "ALLOW_ALL_ORIGINS", False):
     if getattr(settings, "ALLOW_ALL_ORIGINS", False):
@@ -22,6 +37,7 @@ if settings.BACKEND_CORS_ORIGINS or getattr(settings, "ALLOW_ALL_ORIGINS", False
             allow_credentials=False,  # 使用通配符时必须为False
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=CORS_EXPOSE_HEADERS,
         )
     else:
         # 使用指定的源列表
@@ -31,6 +47,7 @@ if settings.BACKEND_CORS_ORIGINS or getattr(settings, "ALLOW_ALL_ORIGINS", False
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=CORS_EXPOSE_HEADERS,
         )
 else:
     # 如果没有具体配置，允许所有源（仅用于开发环境）
@@ -40,8 +57,29 @@ else:
         allow_credentials=False,  # 使用通配符时必须为False
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=CORS_EXPOSE_HEADERS,
     )
 
+
+@app.on_event("startup")
+def limit_threadpool():
+    """将同步端点使用的线程池大小与准入并发上限对齐，避免多余线程阻塞在 get_db 上"""
+    if settings.ADMISSION_CONTROL_ENABLED:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = admission_controller.max_concurrency
+
+
+@app.on_event("startup")
+async def schedule_maintenance():
+    """在事件循环中启动定期清理任务（间隔为 0 时不启动）"""
+    start_maintenance()
+
+
+@app.on_event("shutdown")
+async def cancel_maintenance():
+    stop_maintenance()
+
+
 # 添加uploads目录的静态文件服务
 os.makedirs("uploads/images", exist_ok=True)
 # 将静态文件服务挂载到API路径之前，确保在容器环境中正确访问
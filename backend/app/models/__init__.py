@@ -1,4 +1,8 @@
 from app.models.user import User
+from app.models.category import Category
 from app.models.item import Item
 from app.models.location import Location
-from app.models.reminder import Reminder, RepeatType 
\ No newline at end of file
+from app.models.reminder import Reminder, RepeatType
+from app.models.refresh_token import RefreshToken
+from app.models.tombstone import Tombstone
+from app.models.collection_version import CollectionVersion
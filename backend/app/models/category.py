@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Collection, Dict, Optional
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+from app.models.collection_version import bump_versions
+
+
+class Category(Base):
+    """
+    类别字典：每个用户的类别名称只保存一份，物品通过 category_id 引用
+    """
+
+    __tablename__ = "category"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    owner_id = Column(Integer, ForeignKey("user.id"))
+
+    owner = relationship("User", back_populates="categories")
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 同一用户的类别名称唯一，按名称查找类别ID走该索引；增量同步按 (owner_id, updated_at) 扫描变更
+    __table_args__ = (
+        UniqueConstraint("owner_id", "name", name="uq_category_owner_id_name"),
+        Index("ix_category_owner_id_updated_at", "owner_id", "updated_at"),
+    )
+
+
+def _insert_missing(connection: Connection, rows: list) -> None:
+    # 并发写入同一新类别时，由唯一约束去重
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        connection.execute(insert(Category.__table__), rows)
+        return
+    connection.execute(
+        dialect_insert(Category.__table__).on_conflict_do_nothing(index_elements=["owner_id", "name"]),
+        rows,
+    )
+
+
+def resolve_category_ids(
+    connection: Connection, *, owner_id: Optional[int], names: Collection[str]
+) -> Dict[str, int]:
+    """
+    类别名称 -> 类别ID，不存在的类别自动创建（一次查询已有类别，必要时一次批量插入后再查询）
+    """
+    names = set(names)
+    if not names:
+        return {}
+    table = Category.__table__
+    lookup = select(table.c.name, table.c.id).where(table.c.owner_id == owner_id)
+    ids = dict(connection.execute(lookup.where(table.c.name.in_(names))).all())
+    missing = names - ids.keys()
+    if missing:
+        now = datetime.utcnow()
+        _insert_missing(connection, [
+            {"owner_id": owner_id, "name": name, "created_at": now, "updated_at": now}
+            for name in sorted(missing)
+        ])
+        ids.update(connection.execute(lookup.where(table.c.name.in_(missing))).all())
+        bump_versions(connection, [(owner_id, Category.__tablename__)])
+    return ids
@@ -0,0 +1,81 @@
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import Column, ForeignKey, Integer, String, event, insert, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db.base_class import Base
+
+# 维护版本号的集合（表名），列表接口的 ETag 依赖这些集合
+VERSIONED_COLLECTIONS = ("item", "location", "reminder", "category")
+# 删除物品时，引用它的提醒的 item_id 会被置空，提醒集合也随之变化
+_DEPENDENT_ON_DELETE = {"item": ("reminder",)}
+
+
+class CollectionVersion(Base):
+    """
+    用户集合的版本号：集合有写入时在同一事务中加一，条件请求只需按主键读取一行
+    """
+
+    __tablename__ = "collection_version"
+
+    owner_id = Column(Integer, ForeignKey("user.id"), primary_key=True)
+    collection = Column(String(16), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def bump_versions(connection: Connection, keys: Iterable[Tuple[Optional[int], str]]) -> None:
+    """
+    将 (owner_id, 集合) 对应的版本号加一，不存在时创建；按主键顺序写入，
+    并发事务以相同顺序加锁，不会互相死锁
+    """
+    rows = [
+        {"owner_id": owner_id, "collection": collection, "version": 1}
+        for owner_id, collection in sorted(set(keys))
+        if owner_id is not None
+    ]
+    if not rows:
+        return
+    table = CollectionVersion.__table__
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        for row in rows:
+            bumped = connection.execute(
+                update(table)
+                .where(table.c.owner_id == row["owner_id"], table.c.collection == row["collection"])
+                .values(version=table.c.version + 1)
+            )
+            if not bumped.rowcount:
+                connection.execute(insert(table), row)
+        return
+    stmt = dialect_insert(table)
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["owner_id", "collection"],
+            set_={"version": table.c.version + 1},
+        ),
+        rows,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_versions(session: Session, flush_context) -> None:
+    # 经过 ORM 的新增、修改和删除；Core 语句的批量写入由 CRUD 方法自行调用 bump_versions
+    keys = set()
+    # after_flush 时 new / dirty / deleted 和属性的修改历史仍是 flush 前的状态
+    dirty = [obj for obj in session.dirty if session.is_modified(obj)]
+    for objects, deleted in ((session.new, False), (dirty, False), (session.deleted, True)):
+        for obj in objects:
+            collection = getattr(obj, "__tablename__", None)
+            if collection not in VERSIONED_COLLECTIONS:
+                continue
+            owner_id = getattr(obj, "owner_id", None)
+            keys.add((owner_id, collection))
+            if deleted:
+                keys.update((owner_id, dependent) for dependent in _DEPENDENT_ON_DELETE.get(collection, ()))
+    if keys:
+        bump_versions(session.connection(), keys)
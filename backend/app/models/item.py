@@ -1,8 +1,15 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from typing import Any
 
+from sqlalchemy import (
+    DDL, Column, Index, Integer, String, Float, DateTime, ForeignKey, Text, event, func, inspect,
+    literal_column, select,
+)
+from sqlalchemy.orm import column_property, deferred, relationship
+
+from app.core.search import SQLITE_FTS_CREATE, SQLITE_FTS_DROP, search_tokens
 from app.db.base_class import Base
+from app.models.category import Category, resolve_category_ids
 
 
 class Item(Base):
@@ -11,21 +18,106 @@ class Item(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     description = Column(Text, nullable=True)
-    category = Column(String, nullable=True, index=True)
     quantity = Column(Integer, default=1)
     price = Column(Float, nullable=True)
     purchase_date = Column(DateTime, nullable=True)
     expiry_date = Column(DateTime, nullable=True)
     image_url = Column(String, nullable=True)
+    # 名称和描述的检索词元（见 app.core.search），写入时自动维护；列表查询默认不加载
+    name_tokens = deferred(Column(Text, nullable=False, default="", server_default=""))
+    description_tokens = deferred(Column(Text, nullable=False, default="", server_default=""))
     
     # Foreign keys
     owner_id = Column(Integer, ForeignKey("user.id"))
     location_id = Column(Integer, ForeignKey("location.id"), nullable=True)
-    
+    category_id = Column(Integer, ForeignKey("category.id"), nullable=True)
+
+    # 类别名称：随物品查询一起读出；写入名称时由 before_insert / before_update 事件转换为 category_id
+    category = column_property(
+        select(Category.name)
+        .where(Category.id == category_id)
+        .correlate_except(Category)
+        .scalar_subquery()
+    )
+    # 类别的最近修改时间：参与单个物品的 ETag（类别改名不修改物品行），默认不加载
+    category_updated_at = column_property(
+        select(Category.updated_at)
+        .where(Category.id == category_id)
+        .correlate_except(Category)
+        .scalar_subquery(),
+        deferred=True,
+    )
+
     # Relationships
     owner = relationship("User", back_populates="items")
     location = relationship("Location", back_populates="items")
     reminders = relationship("Reminder", back_populates="item")
     
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 增量同步按 (owner_id, updated_at) 扫描变更；列表筛选按所有者加类别或位置定位
+    __table_args__ = (
+        Index("ix_item_owner_id_updated_at", "owner_id", "updated_at"),
+        Index("ix_item_owner_id_category_id", "owner_id", "category_id"),
+        Index("ix_item_owner_id_location_id", "owner_id", "location_id"),
+        # 临期物品的分组计数和列表按 (owner_id, expiry_date) 范围扫描
+        Index("ix_item_owner_id_expiry_date", "owner_id", "expiry_date"),
+    )
+
+
+# to_tsvector 的配置写成 regconfig 常量，查询时使用同一表达式才能命中该函数索引
+SEARCH_TSCONFIG = literal_column("'simple'::regconfig")
+
+
+def search_vector(name_tokens: Any, description_tokens: Any) -> Any:
+    """
+    PostgreSQL 检索向量：名称词元权重 A、描述词元权重 B（ts_rank 默认权重 1.0 / 0.4）
+    """
+    return func.setweight(func.to_tsvector(SEARCH_TSCONFIG, name_tokens), "A").op("||")(
+        func.setweight(func.to_tsvector(SEARCH_TSCONFIG, description_tokens), "B")
+    )
+
+
+Item.__table__.append_constraint(
+    Index(
+        "ix_item_search_vector",
+        search_vector(Item.__table__.c.name_tokens, Item.__table__.c.description_tokens),
+        postgresql_using="gin",
+    ).ddl_if(dialect="postgresql")
+)
+
+for _statement in SQLITE_FTS_CREATE:
+    event.listen(Item.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in SQLITE_FTS_DROP:
+    event.listen(Item.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+def _set_category_id(connection, target: Item) -> None:
+    # 只在设置了类别名称时转换；直接设置 category_id 的写入保持不变
+    if not inspect(target).attrs.category.history.added:
+        return
+    name = target.category
+    if name:
+        ids = resolve_category_ids(connection, owner_id=target.owner_id, names=[name])
+        target.category_id = ids[name]
+    else:
+        target.category_id = None
+
+
+@event.listens_for(Item, "before_insert")
+def _set_search_tokens_on_insert(mapper, connection, target: Item) -> None:
+    target.name_tokens = search_tokens(target.name)
+    target.description_tokens = search_tokens(target.description)
+    _set_category_id(connection, target)
+
+
+@event.listens_for(Item, "before_update")
+def _set_search_tokens_on_update(mapper, connection, target: Item) -> None:
+    # 只重写发生变化的列，避免无关修改触发索引更新
+    state = inspect(target)
+    if state.attrs.name.history.has_changes():
+        target.name_tokens = search_tokens(target.name)
+    if state.attrs.description.history.has_changes():
+        target.description_tokens = search_tokens(target.description)
+    _set_category_id(connection, target)
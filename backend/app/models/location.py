@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Index, Integer, String, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -24,4 +24,10 @@ class Location(Base):
     items = relationship("Item", back_populates="location")
     
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 增量同步按 (owner_id, updated_at) 扫描变更；按父位置列出子位置
+    __table_args__ = (
+        Index("ix_location_owner_id_updated_at", "owner_id", "updated_at"),
+        Index("ix_location_owner_id_parent_id", "owner_id", "parent_id"),
+    )
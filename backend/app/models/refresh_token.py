@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_token"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # 只保存令牌的 SHA-256 摘要，不保存明文
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    # 同一次登录轮换出的令牌属于同一个 family，检测到重用时整族吊销
+    family_id = Column(String(32), index=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    used_at = Column(DateTime, nullable=True)
+    revoked = Column(Boolean, default=False, nullable=False)
+
+    # Foreign keys
+    user_id = Column(Integer, ForeignKey("user.id"), index=True, nullable=False)
+
+    # Relationships
+    user = relationship("User")
+
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Enum
+from sqlalchemy import Column, Index, Integer, String, DateTime, ForeignKey, Text, Boolean, Enum, false
 from sqlalchemy.orm import relationship
 import enum
 
@@ -26,11 +26,22 @@ class Reminder(Base):
     
     # Foreign keys
     owner_id = Column(Integer, ForeignKey("user.id"))
-    item_id = Column(Integer, ForeignKey("item.id"), nullable=True)
+    item_id = Column(Integer, ForeignKey("item.id"), nullable=True, index=True)
     
     # Relationships
     owner = relationship("User", back_populates="reminders")
     item = relationship("Item", back_populates="reminders")
     
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 增量同步按 (owner_id, updated_at) 扫描变更；到期/即将到期查询只关心未完成的提醒，
+    # 部分索引的条件与 crud_reminder 中的 is_completed == False 保持一致
+    __table_args__ = (
+        Index("ix_reminder_owner_id_updated_at", "owner_id", "updated_at"),
+        Index(
+            "ix_reminder_owner_id_due_date_open", "owner_id", "due_date",
+            postgresql_where=is_completed == false(),
+            sqlite_where=is_completed == false(),
+        ),
+    )
@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.db.base_class import Base
+
+
+class Tombstone(Base):
+    """
+    删除记录：物品、位置、提醒被删除时留下一条墓碑，供增量同步通知客户端删除本地数据
+    """
+
+    __tablename__ = "tombstone"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # 被删除记录的类型（item / location / reminder）和原ID
+    entity_type = Column(String(16), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+
+    # Foreign keys
+    owner_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_tombstone_owner_id_deleted_at", "owner_id", "deleted_at"),
+    )
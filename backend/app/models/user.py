@@ -21,4 +21,5 @@ class User(Base):
     # Relationships
     items = relationship("Item", back_populates="owner")
     locations = relationship("Location", back_populates="owner")
-    reminders = relationship("Reminder", back_populates="owner") 
\ No newline at end of file
+    reminders = relationship("Reminder", back_populates="owner")
+    categories = relationship("Category", back_populates="owner") 
\ No newline at end of file
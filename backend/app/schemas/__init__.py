@@ -1,5 +1,12 @@
-from app.schemas.user import User, UserCreate, UserUpdate, UserInDB
-from app.schemas.item import Item, ItemCreate, ItemUpdate, ItemInDB
+from app.schemas.user import User, UserCreate, UserUpdate, UserInDB, UserPrincipal
+from app.schemas.item import (
+    Item, ItemCreate, ItemUpdate, ItemInDB,
+    ItemBulkCreate, ItemBulkUpdate, ItemBulkDelete, ItemBulkResult, BulkError, ExpiringItems,
+    CategoryFacet, LocationFacet, ItemFacets, ImportRowError, ItemImportJob,
+)
 from app.schemas.location import Location, LocationCreate, LocationUpdate, LocationInDB, LocationTree
 from app.schemas.reminder import Reminder, ReminderCreate, ReminderUpdate, ReminderInDB
-from app.schemas.token import Token, TokenPayload 
\ No newline at end of file
+from app.schemas.token import Token, TokenPayload, RefreshTokenRequest
+from app.schemas.sync import Tombstone, SyncResponse
+from app.schemas.suggest import LocationSuggestion, Suggestions
+from app.schemas.category import Category, CategoryCreate, CategoryUpdate
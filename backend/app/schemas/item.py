@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# 单次批量请求允许的最大条数
+MAX_BULK_ITEMS = 500
 
 
 # Shared properties
@@ -31,11 +34,12 @@ class ItemUpdate(ItemBase):
 class ItemInDBBase(ItemBase):
     id: int
     owner_id: int
+    # 类别名称由 category_id 对应的类别得到；增量同步中类别改名通过它应用到物品
+    category_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 
 # Properties to return to client
@@ -45,4 +49,79 @@ class Item(ItemInDBBase):
 
 # Properties stored in DB
 class ItemInDB(ItemInDBBase):
-    pass 
\ No newline at end of file
+    pass
+
+
+# 批量操作
+class ItemBulkCreate(BaseModel):
+    items: List[ItemCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class ItemBulkUpdate(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+    changes: ItemUpdate
+
+
+class ItemBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+
+class ItemBulkResult(BaseModel):
+    items: List[Item] = []
+    errors: List[BulkError] = []
+
+
+# 临期物品：各分组的数量（expired、7d、30d、90d）和所选分组的一页物品
+class ExpiringItems(BaseModel):
+    counts: Dict[str, int]
+    bucket: str
+    items: List[Item] = []
+    # 下一页游标，作为 cursor 参数传入；没有下一页时为 None
+    next_cursor: Optional[str] = None
+
+
+# 分面计数：类别和位置按物品数从多到少排列，未分类 / 没有位置的物品对应 name（和 id）为 None；
+# expiry 为各临期分组（expired、7d、30d、90d）的数量
+class CategoryFacet(BaseModel):
+    name: Optional[str] = None
+    count: int
+
+
+class LocationFacet(BaseModel):
+    id: Optional[int] = None
+    name: Optional[str] = None
+    count: int
+
+
+class ItemFacets(BaseModel):
+    total: int
+    categories: List[CategoryFacet] = []
+    locations: List[LocationFacet] = []
+    expiry: Dict[str, int]
+
+
+# 导入任务：status 为 pending / running / completed / failed，errors 按文件行号给出出错原因
+class ImportRowError(BaseModel):
+    row: int
+    detail: str
+
+
+class ItemImportJob(BaseModel):
+    id: str
+    status: str
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    # 整个任务失败（如文件无法解析）时的原因
+    detail: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -34,8 +34,7 @@ class ReminderInDBBase(ReminderBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 
 # Properties to return to client
@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class LocationSuggestion(BaseModel):
+    id: int
+    name: str
+
+
+class Suggestions(BaseModel):
+    items: List[str] = []
+    categories: List[str] = []
+    locations: List[LocationSuggestion] = []
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.category import Category
+from app.schemas.item import Item
+from app.schemas.location import Location
+from app.schemas.reminder import Reminder
+
+
+class Tombstone(BaseModel):
+    entity_type: str
+    entity_id: int
+    deleted_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class SyncResponse(BaseModel):
+    items: List[Item] = []
+    locations: List[Location] = []
+    reminders: List[Reminder] = []
+    categories: List[Category] = []
+    deleted: List[Tombstone] = []
+    # 下次同步时作为 since 传入
+    next_cursor: str
+    # 某类数据超过一页时为 True，客户端应立即用 next_cursor 继续拉取
+    has_more: bool = False
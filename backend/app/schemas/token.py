@@ -6,7 +6,15 @@ from pydantic import BaseModel
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 
 class TokenPayload(BaseModel):
-    sub: Optional[str] = None 
\ No newline at end of file
+    sub: Optional[str] = None
+    uid: Optional[int] = None
+    act: Optional[bool] = None
+    iat: Optional[int] = None 
\ No newline at end of file
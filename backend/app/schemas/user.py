@@ -48,4 +48,13 @@ class User(UserInDBBase):
 
 # Additional properties stored in DB but not returned
 class UserInDB(UserInDBBase):
-    hashed_password: str 
\ No newline at end of file
+    hashed_password: str
+
+
+# Lightweight authenticated principal built from the token or a cached lookup
+class UserPrincipal(BaseModel):
+    id: int
+    username: str
+    is_active: bool = True
+
+    model_config = ConfigDict(from_attributes=True)
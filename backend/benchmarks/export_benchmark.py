@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# 家庭物品管理系统 - 物品导出内存基准测试
+# 在临时 SQLite 数据库中写入不同数量的物品，测量流式导出（CSV/XLSX）过程中的 Python 内存峰值，
+# 用于确认内存占用不随物品数量增长。
+#
+# 用法:
+#   python benchmarks/export_benchmark.py
+#   python benchmarks/export_benchmark.py --rows 100 10000 100000 --format xlsx
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+# 确保能导入app包
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.export import iter_csv, iter_xlsx
+from app.crud.crud_item import item as crud_item
+from app.db.base import Base
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+
+
+def seed(url: str, rows: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "username": "bench", "email": "bench@example.com",
+                                     "hashed_password": "x", "is_active": True}])
+        conn.execute(insert(Location), [{"id": 1, "name": "厨房", "owner_id": 1},
+                                        {"id": 2, "name": "冰箱", "parent_id": 1, "owner_id": 1}])
+        for start in range(0, rows, 10000):
+            conn.execute(insert(Item.__table__), [
+                {"name": f"物品 {i}", "description": "描述" * 10, "category": "食品", "quantity": 1,
+                 "price": 9.9, "location_id": 2, "owner_id": 1, "name_tokens": "", "description_tokens": "",
+                 "created_at": now, "updated_at": now}
+                for i in range(start, min(rows, start + 10000))
+            ])
+    engine.dispose()
+
+
+async def export(url: str, fmt: str, batch_size: int) -> Dict[str, float]:
+    engine = create_async_engine(url)
+    async with AsyncSession(engine) as db:
+        batches = crud_item.astream_export(db, owner_id=1, batch_size=batch_size)
+        body = iter_csv(batches) if fmt == "csv" else iter_xlsx(batches)
+        size = 0
+        tracemalloc.start()
+        started = time.perf_counter()
+        async for chunk in body:
+            size += len(chunk)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    await engine.dispose()
+    return {"seconds": elapsed, "peak_mb": peak / 2 ** 20, "output_mb": size / 2 ** 20}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="流式导出内存基准测试")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10000, 100000])
+    parser.add_argument("--format", choices=["csv", "xlsx"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"format={args.format} batch_size={args.batch_size}")
+    print(f"{'rows':>10} {'seconds':>9} {'peak MB':>9} {'output MB':>10}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            seed(f"sqlite:///{tmp}/bench.db", rows)
+            result = asyncio.run(export(f"sqlite+aiosqlite:///{tmp}/bench.db", args.format, args.batch_size))
+        print(f"{rows:>10} {result['seconds']:>9.2f} {result['peak_mb']:>9.2f} {result['output_mb']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# 家庭物品管理系统 - 登录基准测试
+# 在单个进程（单核）内测量不同密码哈希参数下的登录吞吐量与延迟分位数，
+# 用于在满足安全策略的前提下选择工作因子。
+#
+# 用法:
+#   python benchmarks/login_benchmark.py
+#   python benchmarks/login_benchmark.py --scheme bcrypt --rounds 10 11 12 13 -n 50
+#   python benchmarks/login_benchmark.py --scheme pbkdf2_sha256 --rounds 29000 100000 600000
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 确保能导入app包
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import security
+from app.crud.crud_user import user as crud_user
+from app.db.base import Base
+from app.models.user import User
+
+DEFAULT_ROUNDS = {
+    "bcrypt": [10, 11, 12, 13],
+    "pbkdf2_sha256": [29000, 100000, 600000],
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def bench_setting(scheme: str, rounds: Optional[int], iterations: int) -> Dict[str, float]:
+    """
+    在临时 SQLite 数据库上执行完整的 crud.user.authenticate（查询用户 + 校验密码）
+    """
+    security.pwd_context = security.build_password_context(scheme, rounds)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine)
+        db = SessionLocal()
+        try:
+            db.add(User(
+                username="bench",
+                email="bench@example.com",
+                hashed_password=security.get_password_hash("benchpassword"),
+                is_active=True,
+            ))
+            db.commit()
+
+            # 预热
+            crud_user.authenticate(db, username="bench", password="benchpassword")
+
+            samples = []
+            started = time.perf_counter()
+            for _ in range(iterations):
+                t0 = time.perf_counter()
+                assert crud_user.authenticate(db, username="bench", password="benchpassword")
+                samples.append(time.perf_counter() - t0)
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+            engine.dispose()
+
+    return {
+        "logins_per_sec": iterations / elapsed,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="登录吞吐量/延迟基准测试（单核）")
+    parser.add_argument("--scheme", default="bcrypt", choices=security.SUPPORTED_HASH_SCHEMES)
+    parser.add_argument("--rounds", type=int, nargs="+", help="要测试的工作因子列表")
+    parser.add_argument("-n", "--iterations", type=int, default=30, help="每个设置的登录次数")
+    args = parser.parse_args()
+
+    rounds_list = args.rounds or DEFAULT_ROUNDS[args.scheme]
+    print(f"scheme={args.scheme} iterations={args.iterations} (单进程 = 单核)")
+    print(f"{'rounds':>10} {'logins/s/core':>14} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for rounds in rounds_list:
+        result = bench_setting(args.scheme, rounds, args.iterations)
+        print(
+            f"{rounds:>10} {result['logins_per_sec']:>14.1f} {result['p50_ms']:>9.1f} "
+            f"{result['p99_ms']:>9.1f} {result['max_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
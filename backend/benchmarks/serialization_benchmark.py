@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# 家庭物品管理系统 - 列表响应序列化基准测试
+# 比较列表接口两种序列化方式的每行耗时：
+#   before: FastAPI response_model（serialize_response 校验 + jsonable_encoder + JSONResponse）
+#   after:  预构建的 TypeAdapter 校验一次后由 pydantic-core 直接编码（app.api.projection.serialize_list）
+#
+# 用法:
+#   python benchmarks/serialization_benchmark.py
+#   python benchmarks/serialization_benchmark.py --rows 100 1000 10000 -n 5
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+# 确保能导入app包
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app import schemas
+from app.api.projection import serialize_list
+from app.models.item import Item
+
+
+def make_items(count: int) -> List[Item]:
+    """
+    构造未绑定会话的 ORM 对象，模拟查询返回的结果
+    """
+    now = datetime.utcnow()
+    return [
+        Item(
+            id=i,
+            name=f"物品 {i}",
+            description="这是一段用于测试的物品描述" * 5,
+            category="厨房用品",
+            quantity=i % 10,
+            price=9.9 + i,
+            purchase_date=now - timedelta(days=i % 365),
+            expiry_date=now + timedelta(days=i % 30),
+            image_url=f"/uploads/{i}.jpg",
+            location_id=i % 20,
+            owner_id=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+response_field = create_response_field(name="Response_read_items", type_=List[schemas.Item])
+
+
+def before(rows: List[Item]) -> bytes:
+    content = asyncio.run(serialize_response(field=response_field, response_content=rows))
+    return JSONResponse(content=content).body
+
+
+def after(rows: List[Item]) -> bytes:
+    return serialize_list(rows, schemas.Item, Response()).body
+
+
+def bench(func: Callable[[List[Item]], bytes], rows: List[Item], repeat: int) -> float:
+    func(rows)  # 预热
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="列表响应序列化基准测试")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="每个设置的重复次数（取最优）")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'before us/row':>14} {'after us/row':>13} {'speedup':>8} {'bytes':>10}")
+    for count in args.rows:
+        rows = make_items(count)
+        assert len(before(rows)) == len(after(rows))
+        t_before = bench(before, rows, args.repeat)
+        t_after = bench(after, rows, args.repeat)
+        print(
+            f"{count:>8} {t_before / count * 1e6:>14.2f} {t_after / count * 1e6:>13.2f} "
+            f"{t_before / t_after:>7.1f}x {len(after(rows)):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.maintenance import run_maintenance
+from app.core.settings import settings
+from app.crud.crud_category import ORPHAN_GRACE
+from app.models.item import Item
+from app.models.user import User
+
+
+class TestCategoriesEndpoints:
+    def _create_items(self, client: TestClient) -> None:
+        for name, category in [("牛奶", "食品"), ("面包", "食品"), ("钢笔", "文具")]:
+            response = client.post("/api/v1/items/", json={"name": name, "category": category})
+            assert response.status_code == 200
+
+    def test_read_categories(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试类别列表只包含当前用户的类别，按名称排列"""
+        self._create_items(authenticated_client)
+        db.add(Item(name="别人的物品", category="药品", owner_id=test_user.id + 1))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/categories/")
+        assert response.status_code == 200
+        assert sorted(c["name"] for c in response.json()) == ["文具", "食品"]
+        assert [c["name"] for c in response.json()] == sorted(c["name"] for c in response.json())
+        assert all(c["owner_id"] == test_user.id for c in response.json())
+
+    def test_rename_category(self, authenticated_client: TestClient):
+        """测试类别改名后物品、筛选、分面计数和列表 ETag 都随之更新"""
+        self._create_items(authenticated_client)
+        listed = authenticated_client.get("/api/v1/items/")
+        etag = listed.headers["ETag"]
+        facets = authenticated_client.get("/api/v1/items/facets").json()
+        assert facets["categories"][0] == {"name": "食品", "count": 2}
+        food = next(
+            c for c in authenticated_client.get("/api/v1/categories/").json() if c["name"] == "食品"
+        )
+
+        response = authenticated_client.put(f"/api/v1/categories/{food['id']}", json={"name": "吃的"})
+        assert response.status_code == 200
+        assert response.json()["name"] == "吃的"
+
+        response = authenticated_client.get("/api/v1/items/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert sorted(item["category"] for item in response.json()) == ["吃的", "吃的", "文具"]
+        filtered = authenticated_client.get("/api/v1/items/", params={"category": "吃的"}).json()
+        assert {item["name"] for item in filtered} == {"牛奶", "面包"}
+        facets = authenticated_client.get("/api/v1/items/facets").json()
+        assert facets["categories"][0] == {"name": "吃的", "count": 2}
+
+        # 再次写入旧名称时创建新的类别
+        authenticated_client.post("/api/v1/items/", json={"name": "苹果", "category": "食品"})
+        names = [c["name"] for c in authenticated_client.get("/api/v1/categories/").json()]
+        assert set(names) == {"吃的", "文具", "食品"}
+
+    def test_rename_category_conflict(self, authenticated_client: TestClient):
+        """测试改为已存在的类别名称返回 409"""
+        self._create_items(authenticated_client)
+        food = next(
+            c for c in authenticated_client.get("/api/v1/categories/").json() if c["name"] == "食品"
+        )
+        response = authenticated_client.put(f"/api/v1/categories/{food['id']}", json={"name": "文具"})
+        assert response.status_code == 409
+
+    def test_rename_category_not_owned(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试修改别人的类别返回 403，不存在的类别返回 404"""
+        other = Item(name="别人的物品", category="药品", owner_id=test_user.id + 1)
+        db.add(other)
+        db.commit()
+        response = authenticated_client.put(f"/api/v1/categories/{other.category_id}", json={"name": "x"})
+        assert response.status_code == 403
+        response = authenticated_client.put("/api/v1/categories/99999", json={"name": "x"})
+        assert response.status_code == 404
+
+    def test_rename_category_refreshes_item_and_sync(
+        self, authenticated_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """测试类别改名不修改物品行：单个物品和物品列表的 ETag 失效，增量同步只返回改名的类别"""
+        monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", -1)
+        self._create_items(authenticated_client)
+        items = {item["name"]: item for item in authenticated_client.get("/api/v1/items/").json()}
+        detail = authenticated_client.get(f"/api/v1/items/{items['牛奶']['id']}")
+        listed = authenticated_client.get("/api/v1/items/")
+        cursor = authenticated_client.get("/api/v1/sync/").json()["next_cursor"]
+        food = next(
+            c for c in authenticated_client.get("/api/v1/categories/").json() if c["name"] == "食品"
+        )
+
+        authenticated_client.put(f"/api/v1/categories/{food['id']}", json={"name": "吃的"})
+
+        response = authenticated_client.get(
+            f"/api/v1/items/{items['牛奶']['id']}", headers={"If-None-Match": detail.headers["ETag"]}
+        )
+        assert response.status_code == 200
+        assert response.json()["category"] == "吃的"
+        assert response.json()["updated_at"] == items["牛奶"]["updated_at"]
+        response = authenticated_client.get("/api/v1/items/", headers={"If-None-Match": listed.headers["ETag"]})
+        assert response.status_code == 200
+        data = authenticated_client.get("/api/v1/sync/", params={"since": cursor}).json()
+        assert data["items"] == []
+        assert [(c["id"], c["name"]) for c in data["categories"]] == [(food["id"], "吃的")]
+        assert items["牛奶"]["category_id"] == food["id"]
+
+    def test_orphan_categories(
+        self, authenticated_client: TestClient, db: Session, test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """测试没有物品引用的类别不出现在列表中，定期清理删除后通过增量同步下发墓碑"""
+        monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", -1)
+        self._create_items(authenticated_client)
+        pen = next(item for item in authenticated_client.get("/api/v1/items/").json() if item["name"] == "钢笔")
+        listed = authenticated_client.get("/api/v1/categories/")
+        cursor = authenticated_client.get("/api/v1/sync/").json()["next_cursor"]
+
+        authenticated_client.put(f"/api/v1/items/{pen['id']}", json={"category": "办公"})
+        response = authenticated_client.get("/api/v1/categories/", headers={"If-None-Match": listed.headers["ETag"]})
+        assert response.status_code == 200
+        assert sorted(c["name"] for c in response.json()) == ["办公", "食品"]
+
+        later = datetime.utcnow() + ORPHAN_GRACE + timedelta(minutes=1)
+        assert run_maintenance(db, now=later)["categories"] == 1
+        data = authenticated_client.get("/api/v1/sync/", params={"since": cursor}).json()
+        assert [(t["entity_type"], t["entity_id"]) for t in data["deleted"]] == [
+            ("category", pen["category_id"]),
+        ]
@@ -27,4 +27,18 @@ class TestHealthEndpoints:
         assert "status" in data
         assert "message" in data
         assert "database" in data
-        assert "timestamp" in data 
\ No newline at end of file
+        assert "timestamp" in data
+
+    def test_db_pool_status(self, client: TestClient):
+        """测试连接池状态端点"""
+        response = client.get("/api/v1/health/db/pool")
+
+        assert response.status_code == 200
+        data = response.json()
+        for engine_name in ("sync", "async"):
+            pool = data[engine_name]
+            assert "size" in pool
+            assert "checked_out" in pool
+            assert "checkouts" in pool
+            assert "timeouts" in pool
+            assert "wait_avg_ms" in pool
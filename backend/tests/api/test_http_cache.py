@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.etag import etag_matches, make_etag
+from app.models.item import Item
+from app.models.location import Location
+
+
+def test_etag_matches():
+    """测试 If-None-Match 的弱比较"""
+    etag = make_etag("items", 1)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+class TestConditionalGet:
+    def test_items_list_not_modified(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试列表未变化时返回304，修改后ETag改变"""
+        item = Item(name="Lamp", owner_id=test_user.id)
+        db.add(item)
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/")
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = authenticated_client.get("/api/v1/items/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        # 不同的查询参数得到不同的ETag
+        response = authenticated_client.get(
+            "/api/v1/items/", params={"limit": 1}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        response = authenticated_client.put(f"/api/v1/items/{item.id}", json={"name": "Desk lamp"})
+        assert response.status_code == 200
+        response = authenticated_client.get("/api/v1/items/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()[0]["name"] == "Desk lamp"
+        assert response.headers["ETag"] != etag
+
+    def test_delete_changes_etag(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试删除记录后ETag改变"""
+        items = [Item(name=f"Item {i}", owner_id=test_user.id) for i in range(2)]
+        db.add_all(items)
+        db.commit()
+
+        etag = authenticated_client.get("/api/v1/items/").headers["ETag"]
+        authenticated_client.delete(f"/api/v1/items/{items[0].id}")
+        response = authenticated_client.get("/api/v1/items/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_entity_and_tree(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试单个实体和位置树的条件请求"""
+        location = Location(name="Attic", owner_id=test_user.id)
+        db.add(location)
+        db.commit()
+
+        for url in (f"/api/v1/locations/{location.id}", "/api/v1/locations/tree"):
+            etag = authenticated_client.get(url).headers["ETag"]
+            response = authenticated_client.get(url, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    def test_stats_not_modified(self, authenticated_client: TestClient):
+        """测试仪表盘统计的条件请求"""
+        etag = authenticated_client.get("/api/v1/stats/dashboard").headers["ETag"]
+        response = authenticated_client.get(
+            "/api/v1/stats/dashboard", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
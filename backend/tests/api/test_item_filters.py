@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.crud.crud_item import ItemFilter, item as crud_item
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+
+
+@pytest.fixture(scope="function")
+def house(db: Session, test_user: User) -> dict:
+    """厨房 > 冰箱 > 冷冻层，另有书房"""
+    kitchen = Location(name="厨房", owner_id=test_user.id)
+    db.add(kitchen)
+    db.commit()
+    fridge = Location(name="冰箱", parent_id=kitchen.id, owner_id=test_user.id)
+    study = Location(name="书房", owner_id=test_user.id)
+    db.add_all([fridge, study])
+    db.commit()
+    freezer = Location(name="冷冻层", parent_id=fridge.id, owner_id=test_user.id)
+    db.add(freezer)
+    db.commit()
+
+    now = datetime.utcnow()
+    db.add_all([
+        Item(name="牛奶", category="食品", price=12, expiry_date=now + timedelta(days=3),
+             purchase_date=now - timedelta(days=2), location_id=fridge.id, owner_id=test_user.id),
+        Item(name="速冻饺子", category="食品", price=25, expiry_date=now + timedelta(days=90),
+             purchase_date=now - timedelta(days=30), location_id=freezer.id, owner_id=test_user.id),
+        Item(name="酱油", category="调料", price=15, expiry_date=now + timedelta(days=300),
+             location_id=kitchen.id, owner_id=test_user.id),
+        Item(name="感冒药", category="药品", price=30, expiry_date=now - timedelta(days=1),
+             location_id=study.id, owner_id=test_user.id),
+        Item(name="小说", category="书籍", price=45, location_id=study.id, owner_id=test_user.id),
+    ])
+    db.commit()
+    return {"kitchen": kitchen, "fridge": fridge, "freezer": freezer, "study": study, "now": now}
+
+
+def names(response) -> List[str]:
+    assert response.status_code == 200, response.text
+    return sorted(item["name"] for item in response.json())
+
+
+class TestItemFilters:
+    def test_combined_filters(self, authenticated_client: TestClient, house: dict):
+        """测试类别、价格区间、过期日期区间同时生效"""
+        now = house["now"]
+        params = {
+            "categories": "食品,药品,书籍",
+            "min_price": 20,
+            "max_price": 40,
+        }
+        assert names(authenticated_client.get("/api/v1/items/", params=params)) == ["感冒药", "速冻饺子"]
+
+        params["expires_after"] = now.isoformat()
+        assert names(authenticated_client.get("/api/v1/items/", params=params)) == ["速冻饺子"]
+
+        params = {"purchased_after": (now - timedelta(days=7)).isoformat(), "category": "食品"}
+        assert names(authenticated_client.get("/api/v1/items/", params=params)) == ["牛奶"]
+
+    def test_location_subtree(self, authenticated_client: TestClient, house: dict):
+        """测试按位置筛选，可选包含所有子位置"""
+        kitchen_id = house["kitchen"].id
+        response = authenticated_client.get("/api/v1/items/", params={"location_id": kitchen_id})
+        assert names(response) == ["酱油"]
+
+        response = authenticated_client.get(
+            "/api/v1/items/", params={"location_id": kitchen_id, "include_sublocations": True}
+        )
+        assert names(response) == ["牛奶", "速冻饺子", "酱油"]
+
+        response = authenticated_client.get(
+            "/api/v1/items/",
+            params={"location_id": kitchen_id, "include_sublocations": True, "categories": "食品",
+                    "sort": "-price"},
+        )
+        assert [item["name"] for item in response.json()] == ["速冻饺子", "牛奶"]
+
+    def test_search_with_filters(self, authenticated_client: TestClient, house: dict):
+        """测试搜索与其他条件组合"""
+        response = authenticated_client.get("/api/v1/items/", params={"search": "饺子", "category": "食品"})
+        assert names(response) == ["速冻饺子"]
+        response = authenticated_client.get("/api/v1/items/", params={"search": "饺子", "category": "调料"})
+        assert names(response) == []
+
+    def test_subtree_scoped_to_owner(self, db: Session, house: dict, test_user: User):
+        """测试子位置展开不会越过其他用户的位置"""
+        filters = ItemFilter(location_id=house["kitchen"].id, include_sublocations=True)
+        items = crud_item.get_filtered(db, filters=filters, owner_id=test_user.id + 1)
+        assert items == []
+        items = crud_item.get_filtered(db, filters=filters, owner_id=test_user.id)
+        assert len(items) == 3
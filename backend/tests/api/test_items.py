@@ -286,4 +286,15 @@ class TestItemsEndpoints:
         assert len(data) == 2  # 包含"Laptop Computer"和"Wireless Mouse"
         names = [item["name"] for item in data]
         assert "Laptop Computer" in names
-        assert "Wireless Mouse" in names 
\ No newline at end of file
+        assert "Wireless Mouse" in names
+
+    def test_search_items_chinese(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试中文搜索按相关度排序且不返回游标"""
+        for name, description in [("收纳盒", "放厨刀"), ("德国厨刀", None), ("厨刀磨刀石", None)]:
+            db.add(Item(name=name, description=description, owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/", params={"search": "厨刀", "limit": 2})
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["德国厨刀", "厨刀磨刀石"]
+        assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.models.item import Item
+from app.models.location import Location
+from app.models.reminder import Reminder
+from app.models.user import User
+
+
+class TestItemsBulkEndpoints:
+    def test_bulk_create(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试批量创建物品，无效位置的行按下标报错"""
+        location = Location(name="Kitchen", owner_id=test_user.id)
+        db.add(location)
+        db.commit()
+
+        payload = {
+            "items": [
+                {"name": "Plate", "location_id": location.id, "purchase_date": "2024-01-01T00:00:00Z"},
+                {"name": "Ghost", "location_id": 999999},
+                {"name": "Cup", "quantity": 6},
+            ]
+        }
+        response = authenticated_client.post("/api/v1/items/bulk", json=payload)
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Plate", "Cup"]
+        assert all(item["owner_id"] == test_user.id for item in data["items"])
+        assert data["items"][1]["quantity"] == 6
+        assert data["errors"] == [{"index": 1, "id": None, "detail": "Location not found"}]
+        assert db.query(Item).filter(Item.owner_id == test_user.id).count() == 2
+
+    def test_bulk_create_validates_size(self, authenticated_client: TestClient):
+        """测试空批次被拒绝"""
+        response = authenticated_client.post("/api/v1/items/bulk", json={"items": []})
+        assert response.status_code == 422
+
+    def test_bulk_update(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试批量修改只影响当前用户的物品"""
+        other = User(
+            username="other", email="other@example.com",
+            hashed_password=get_password_hash("password"), is_active=True,
+        )
+        db.add(other)
+        db.commit()
+        mine = [Item(name=f"Item {i}", category="old", owner_id=test_user.id) for i in range(3)]
+        theirs = Item(name="Theirs", category="old", owner_id=other.id)
+        db.add_all(mine + [theirs])
+        db.commit()
+
+        ids = [item.id for item in mine] + [theirs.id]
+        response = authenticated_client.patch(
+            "/api/v1/items/bulk", json={"ids": ids, "changes": {"category": "new"}}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(item["id"] for item in data["items"]) == sorted(item.id for item in mine)
+        assert all(item["category"] == "new" for item in data["items"])
+        assert data["errors"] == [{"index": 3, "id": theirs.id, "detail": "Item not found"}]
+
+        db.expire_all()
+        assert db.get(Item, theirs.id).category == "old"
+
+    def test_bulk_update_foreign_location(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试批量移动到不存在的位置返回404"""
+        item = Item(name="Item", owner_id=test_user.id)
+        db.add(item)
+        db.commit()
+
+        response = authenticated_client.patch(
+            "/api/v1/items/bulk", json={"ids": [item.id], "changes": {"location_id": 999999}}
+        )
+        assert response.status_code == 404
+
+    def test_bulk_delete(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试批量删除物品并解除提醒的关联"""
+        items = [Item(name=f"Item {i}", owner_id=test_user.id) for i in range(3)]
+        db.add_all(items)
+        db.commit()
+        reminder = Reminder(
+            title="Check", due_date=datetime.utcnow(), owner_id=test_user.id, item_id=items[0].id
+        )
+        db.add(reminder)
+        db.commit()
+
+        ids = [items[0].id, items[1].id, 999999]
+        response = authenticated_client.request("DELETE", "/api/v1/items/bulk", json={"ids": ids})
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(item["id"] for item in data["items"]) == sorted(ids[:2])
+        assert data["errors"] == [{"index": 2, "id": 999999, "detail": "Item not found"}]
+
+        db.expire_all()
+        assert db.query(Item).filter(Item.owner_id == test_user.id).count() == 1
+        assert db.get(Reminder, reminder.id).item_id is None
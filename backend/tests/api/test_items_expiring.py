@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.item import Item
+from app.models.user import User
+
+
+class TestExpiringItems:
+    def test_bucket_counts_and_list(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试各临期分组的数量与列表"""
+        now = datetime.utcnow()
+        for name, days in [("过期牛奶", -3), ("面包", 2), ("鸡蛋", 6), ("酸奶", 20),
+                           ("感冒药", 60), ("罐头", 400), ("剪刀", None)]:
+            expiry = now + timedelta(days=days) if days is not None else None
+            db.add(Item(name=name, expiry_date=expiry, owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/expiring")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["counts"] == {"expired": 1, "7d": 2, "30d": 3, "90d": 4}
+        assert data["bucket"] == "7d"
+        assert [item["name"] for item in data["items"]] == ["面包", "鸡蛋"]
+        assert data["next_cursor"] is None
+
+        data = authenticated_client.get("/api/v1/items/expiring", params={"bucket": "expired"}).json()
+        assert [item["name"] for item in data["items"]] == ["过期牛奶"]
+
+        data = authenticated_client.get(
+            "/api/v1/items/expiring", params={"bucket": "90d", "limit": 3}
+        ).json()
+        assert [item["name"] for item in data["items"]] == ["面包", "鸡蛋", "酸奶"]
+        data = authenticated_client.get(
+            "/api/v1/items/expiring", params={"bucket": "90d", "limit": 3, "cursor": data["next_cursor"]}
+        ).json()
+        assert [item["name"] for item in data["items"]] == ["感冒药"]
+
+        response = authenticated_client.get("/api/v1/items/expiring", params={"bucket": "1y"})
+        assert response.status_code == 422
+
+    def test_etag(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试未变化时返回304，新增物品后ETag变化"""
+        response = authenticated_client.get("/api/v1/items/expiring")
+        etag = response.headers["ETag"]
+        response = authenticated_client.get("/api/v1/items/expiring", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        authenticated_client.post("/api/v1/items/", json={"name": "牛奶"})
+        response = authenticated_client.get("/api/v1/items/expiring", headers={"If-None-Match": etag})
+        assert response.status_code == 200
@@ -0,0 +1,50 @@
+import csv
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+
+
+class TestItemsExport:
+    def test_export_csv(self, authenticated_client: TestClient, db: Session, test_user: User, monkeypatch):
+        """测试 CSV 导出包含全部物品和完整位置路径"""
+        monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+        kitchen = Location(name="厨房", owner_id=test_user.id)
+        db.add(kitchen)
+        db.commit()
+        fridge = Location(name="冰箱", parent_id=kitchen.id, owner_id=test_user.id)
+        db.add(fridge)
+        db.commit()
+        db.add_all([Item(name=f"物品{i}", quantity=i, location_id=fridge.id, owner_id=test_user.id) for i in range(5)])
+        db.add(Item(name="无位置", owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig"))))
+        assert [row["name"] for row in rows] == [f"物品{i}" for i in range(5)] + ["无位置"]
+        assert rows[0]["location"] == "厨房 / 冰箱"
+        assert rows[3]["quantity"] == "3"
+        assert rows[-1]["location"] == ""
+
+    def test_export_xlsx(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试 XLSX 导出"""
+        db.add(Item(name="德国厨刀", price=99.5, owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/export", params={"format": "xlsx"})
+        assert response.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        assert "德国厨刀" in sheet and "<v>99.5</v>" in sheet
+
+        response = authenticated_client.get("/api/v1/items/export", params={"format": "pdf"})
+        assert response.status_code == 422
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+from tests.conftest import test_async_engine
+
+
+class TestItemFacets:
+    def test_facet_counts(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试按类别、位置和临期分组计数，并与物品列表使用相同的筛选条件"""
+        kitchen = Location(name="厨房", owner_id=test_user.id)
+        study = Location(name="书房", owner_id=test_user.id)
+        db.add_all([kitchen, study])
+        db.commit()
+        now = datetime.utcnow()
+        db.add_all([
+            Item(name="过期牛奶", category="食品", price=5, location_id=kitchen.id,
+                 expiry_date=now - timedelta(days=3), owner_id=test_user.id),
+            Item(name="面包", category="食品", price=8, location_id=kitchen.id,
+                 expiry_date=now + timedelta(days=2), owner_id=test_user.id),
+            Item(name="酸奶", category="食品", price=6, location_id=kitchen.id,
+                 expiry_date=now + timedelta(days=20), owner_id=test_user.id),
+            Item(name="德国厨刀", category="厨具", price=99, location_id=kitchen.id, owner_id=test_user.id),
+            Item(name="钢笔", category="文具", price=30, location_id=study.id, owner_id=test_user.id),
+            Item(name="剪刀", price=12, owner_id=test_user.id),
+        ])
+        db.add(Item(name="别人的物品", category="食品", owner_id=test_user.id + 1))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/facets")
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 6,
+            "categories": [
+                {"name": "食品", "count": 3},
+                {"name": "厨具", "count": 1},
+                {"name": "文具", "count": 1},
+                {"name": None, "count": 1},
+            ],
+            "locations": [
+                {"id": kitchen.id, "name": "厨房", "count": 4},
+                {"id": study.id, "name": "书房", "count": 1},
+                {"id": None, "name": None, "count": 1},
+            ],
+            "expiry": {"expired": 1, "7d": 1, "30d": 2, "90d": 2},
+        }
+
+        params = {"location_id": kitchen.id, "max_price": 10}
+        data = authenticated_client.get("/api/v1/items/facets", params=params).json()
+        listed = authenticated_client.get("/api/v1/items/", params=params).json()
+        assert data["total"] == len(listed) == 3
+        assert data["categories"] == [{"name": "食品", "count": 3}]
+
+        data = authenticated_client.get("/api/v1/items/facets", params={"search": "厨刀"}).json()
+        assert data["total"] == 1
+        assert data["locations"] == [{"id": kitchen.id, "name": "厨房", "count": 1}]
+        assert data["expiry"] == {"expired": 0, "7d": 0, "30d": 0, "90d": 0}
+
+    def test_facets_cached_until_write(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试分面计数按用户缓存，用户写入物品后失效"""
+        db.add(Item(name="面包", category="食品", owner_id=test_user.id))
+        db.commit()
+        statements = []
+
+        def count_facet_queries(conn, cursor, statement, *args):
+            if "faceted_item" in statement:
+                statements.append(statement)
+
+        engine = test_async_engine.sync_engine
+        event.listen(engine, "before_cursor_execute", count_facet_queries)
+        try:
+            assert authenticated_client.get("/api/v1/items/facets").json()["total"] == 1
+            assert authenticated_client.get("/api/v1/items/facets").json()["total"] == 1
+            assert len(statements) == 1
+            # 不同的筛选条件单独缓存
+            authenticated_client.get("/api/v1/items/facets", params={"category": "食品"})
+            assert len(statements) == 2
+
+            response = authenticated_client.post(
+                "/api/v1/items/", json={"name": "牛奶", "category": "食品"}
+            )
+            assert response.status_code == 200
+            data = authenticated_client.get("/api/v1/items/facets").json()
+            assert len(statements) == 3
+            assert data["total"] == 2
+            assert data["categories"] == [{"name": "食品", "count": 2}]
+        finally:
+            event.remove(engine, "before_cursor_execute", count_facet_queries)
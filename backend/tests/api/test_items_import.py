@@ -0,0 +1,122 @@
+import tempfile
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.importer import ImportJob, import_jobs
+from app.core.settings import settings
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+
+XLSX_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def run_import(client: TestClient, filename: str, content: bytes, content_type: str = "text/csv") -> dict:
+    response = client.post(
+        "/api/v1/items/import", files={"file": (filename, content, content_type)}
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+    # TestClient 在返回响应前已执行完后台任务
+    response = client.get(f"/api/v1/items/import/{response.json()['id']}")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestItemsImport:
+    def test_import_csv(self, authenticated_client: TestClient, db: Session, test_user: User, monkeypatch):
+        """测试分批导入 CSV：位置按路径或唯一名称解析，出错的行按行号报告，其余行正常写入"""
+        monkeypatch.setattr(settings, "IMPORT_CHUNK_SIZE", 2)
+        kitchen = Location(name="厨房", owner_id=test_user.id)
+        study = Location(name="书房", owner_id=test_user.id)
+        db.add_all([kitchen, study])
+        db.commit()
+        db.add_all([
+            Location(name="抽屉", parent_id=kitchen.id, owner_id=test_user.id),
+            Location(name="抽屉", parent_id=study.id, owner_id=test_user.id),
+            Location(name="冰箱", parent_id=kitchen.id, owner_id=test_user.id),
+        ])
+        db.commit()
+        fridge = db.execute(select(Location).where(Location.name == "冰箱")).scalar_one()
+
+        content = (
+            "name,category,quantity,price,expiry_date,location\n"
+            "德国厨刀,厨具,1,99.5,,厨房 / 抽屉\n"
+            "牛奶,食品,2,,2024-01-02,冰箱\n"
+            ",食品,1,,,\n"
+            "剪刀,,x,,,\n"
+            "钢笔,文具,1,,,抽屉\n"
+            "台灯,,1,,,阁楼\n"
+            "书,书籍,3,,,\n"
+        ).encode("utf-8")
+        job = run_import(authenticated_client, "items.csv", content)
+
+        assert job["status"] == "completed"
+        assert (job["processed"], job["imported"], job["failed"]) == (7, 3, 4)
+        assert [error["row"] for error in job["errors"]] == [4, 5, 6, 7]
+        assert job["errors"][1]["detail"].startswith("quantity:")
+        assert job["errors"][2]["detail"].startswith("Ambiguous location")
+        assert job["errors"][3]["detail"] == "Location not found"
+        assert job["finished_at"] is not None
+
+        items = {item.name: item for item in db.execute(select(Item)).scalars()}
+        assert set(items) == {"德国厨刀", "牛奶", "书"}
+        assert items["牛奶"].location_id == fridge.id
+        assert items["牛奶"].expiry_date.year == 2024
+        assert items["德国厨刀"].price == 99.5 and items["德国厨刀"].owner_id == test_user.id
+        assert items["书"].quantity == 3 and items["书"].created_at is not None
+
+        # 导入的物品可以被搜索到（检索词元随写入生成）
+        response = authenticated_client.get("/api/v1/items/", params={"search": "厨刀"})
+        assert [item["name"] for item in response.json()] == ["德国厨刀"]
+
+    def test_import_export_round_trip(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试导出的 XLSX 可以直接导入"""
+        kitchen = Location(name="厨房", owner_id=test_user.id)
+        db.add(kitchen)
+        db.commit()
+        db.add(Item(name="德国厨刀", price=99.5, quantity=2, location_id=kitchen.id, owner_id=test_user.id))
+        db.commit()
+        exported = authenticated_client.get("/api/v1/items/export", params={"format": "xlsx"}).content
+
+        job = run_import(authenticated_client, "items.xlsx", exported, XLSX_TYPE)
+        assert job["status"] == "completed" and job["imported"] == 1
+        items = db.execute(select(Item).order_by(Item.id)).scalars().all()
+        assert len(items) == 2
+        assert (items[1].name, items[1].price, items[1].quantity, items[1].location_id) == (
+            "德国厨刀", 99.5, 2, kitchen.id
+        )
+
+    def test_import_invalid_file(self, authenticated_client: TestClient):
+        """测试不支持的文件类型和无法解析的文件"""
+        response = authenticated_client.post(
+            "/api/v1/items/import", files={"file": ("items.pdf", b"%PDF", "application/pdf")}
+        )
+        assert response.status_code == 400
+
+        job = run_import(authenticated_client, "items.xlsx", b"not a zip", XLSX_TYPE)
+        assert job["status"] == "failed"
+        assert job["detail"].startswith("Invalid XLSX file")
+
+    def test_import_too_large(self, authenticated_client: TestClient, db: Session, monkeypatch, tmp_path):
+        """测试超过大小上限的导入文件返回413，不创建任务，临时文件被删除"""
+        monkeypatch.setattr(settings, "IMPORT_MAX_BYTES", 64)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        content = "name\n" + "".join(f"Item {i}\n" for i in range(20))
+        response = authenticated_client.post(
+            "/api/v1/items/import", files={"file": ("items.csv", content.encode(), "text/csv")}
+        )
+        assert response.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+        assert db.execute(select(Item)).first() is None
+
+    def test_import_job_of_other_user(self, authenticated_client: TestClient, test_user: User):
+        """测试不能查询其他用户的导入任务"""
+        job = ImportJob(owner_id=test_user.id + 1)
+        import_jobs.start(job)
+        response = authenticated_client.get(f"/api/v1/items/import/{job.id}")
+        assert response.status_code == 404
+        response = authenticated_client.get("/api/v1/items/import/missing")
+        assert response.status_code == 404
@@ -0,0 +1,65 @@
+from fastapi.testclient import TestClient
+
+from app.core import security
+from app.core.settings import settings
+from app.core.throttle import TrustedProxies, login_throttle
+from app.crud.crud_user import CRUDUser
+from app.models.user import User
+
+
+class TestLoginThrottle:
+    def test_rejects_before_hashing(self, client: TestClient, test_user: User, monkeypatch):
+        """测试超过失败次数后在校验密码之前返回429"""
+        for _ in range(settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME):
+            response = client.post(
+                "/api/v1/auth/login", data={"username": "testuser", "password": "wrong"}
+            )
+            assert response.status_code == 400
+
+        def fail(*args, **kwargs):
+            raise AssertionError("throttled login must not authenticate")
+
+        monkeypatch.setattr(CRUDUser, "authenticate", fail)
+        response = client.post(
+            "/api/v1/auth/login", data={"username": "testuser", "password": "testpassword"}
+        )
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_unknown_username_runs_dummy_hash(self, client: TestClient, test_user: User, monkeypatch):
+        """测试未知用户名同样执行一次密码校验，使耗时一致"""
+        calls = []
+        original = security.dummy_verify_password
+        monkeypatch.setattr(
+            "app.crud.crud_user.dummy_verify_password",
+            lambda password: calls.append(password) or original(password),
+        )
+        response = client.post(
+            "/api/v1/auth/login", data={"username": "nobody", "password": "whatever"}
+        )
+        assert response.status_code == 400
+        assert calls == ["whatever"]
+
+    def _fail_login(self, client: TestClient, username: str, forwarded_for: str) -> int:
+        response = client.post(
+            "/api/v1/auth/login",
+            data={"username": username, "password": "wrong"},
+            headers={"X-Forwarded-For": forwarded_for},
+        )
+        return response.status_code
+
+    def test_clients_behind_proxy_counted_separately(self, client: TestClient, monkeypatch):
+        """测试经可信代理转发的不同客户端按各自的IP计数，一个客户端被封禁不影响其他客户端"""
+        monkeypatch.setattr(login_throttle, "trusted_proxies", TrustedProxies("testclient"))
+        monkeypatch.setattr(login_throttle, "max_attempts_per_ip", 3)
+        for i in range(3):
+            assert self._fail_login(client, f"user{i}", "1.1.1.1") == 400
+        assert self._fail_login(client, "user9", "1.1.1.1") == 429
+        assert self._fail_login(client, "user10", "2.2.2.2") == 400
+
+    def test_forwarded_for_ignored_without_trusted_proxy(self, client: TestClient, monkeypatch):
+        """测试对端不是可信代理时伪造的 X-Forwarded-For 不会绕过按IP限流"""
+        monkeypatch.setattr(login_throttle, "max_attempts_per_ip", 3)
+        for i in range(3):
+            assert self._fail_login(client, f"user{i}", f"1.1.1.{i}") == 400
+        assert self._fail_login(client, "user9", "2.2.2.2") == 429
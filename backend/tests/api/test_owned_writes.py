@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.models.item import Item
+from app.models.location import Location
+from app.models.reminder import Reminder
+from app.models.user import User
+from tests.conftest import test_engine
+
+
+@pytest.fixture(scope="function")
+def statements() -> List[str]:
+    """记录测试期间执行的SQL语句"""
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="function")
+def other_user(db: Session) -> User:
+    user = User(
+        username="other", email="other@example.com",
+        hashed_password=get_password_hash("password"), is_active=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _touching(statements: List[str], table: str) -> List[str]:
+    return [s for s in statements if f"FROM {table}" in s or f"UPDATE {table}" in s]
+
+
+class TestOwnedWrites:
+    def test_update_item_single_statement(
+        self, authenticated_client: TestClient, db: Session, test_user: User, statements: List[str]
+    ):
+        """测试更新物品只执行一条 UPDATE ... RETURNING"""
+        item = Item(name="Old", owner_id=test_user.id)
+        db.add(item)
+        db.commit()
+        statements.clear()
+
+        response = authenticated_client.put(f"/api/v1/items/{item.id}", json={"name": "New"})
+        assert response.status_code == 200
+        assert response.json()["name"] == "New"
+        item_statements = _touching(statements, "item")
+        assert len(item_statements) == 1
+        assert item_statements[0].startswith("UPDATE item")
+
+    def test_write_other_users_item(
+        self, authenticated_client: TestClient, db: Session, other_user: User
+    ):
+        """测试修改/删除他人的物品返回403，不存在的物品返回404"""
+        item = Item(name="Theirs", owner_id=other_user.id)
+        db.add(item)
+        db.commit()
+
+        response = authenticated_client.put(f"/api/v1/items/{item.id}", json={"name": "Mine"})
+        assert response.status_code == 403
+        response = authenticated_client.delete(f"/api/v1/items/{item.id}")
+        assert response.status_code == 403
+        response = authenticated_client.delete("/api/v1/items/999999")
+        assert response.status_code == 404
+
+        db.expire_all()
+        assert db.get(Item, item.id).name == "Theirs"
+
+    def test_delete_item_unlinks_reminders(
+        self, authenticated_client: TestClient, db: Session, test_user: User
+    ):
+        """测试删除物品后关联提醒的 item_id 被清空"""
+        item = Item(name="Item", owner_id=test_user.id)
+        db.add(item)
+        db.commit()
+        reminder = Reminder(title="R", due_date=datetime.utcnow(), owner_id=test_user.id, item_id=item.id)
+        db.add(reminder)
+        db.commit()
+
+        response = authenticated_client.delete(f"/api/v1/items/{item.id}")
+        assert response.status_code == 200
+        db.expire_all()
+        assert db.get(Reminder, reminder.id).item_id is None
+
+    def test_complete_reminder(
+        self, authenticated_client: TestClient, db: Session, test_user: User, other_user: User
+    ):
+        """测试完成提醒，他人的提醒返回403"""
+        mine = Reminder(title="Mine", due_date=datetime.utcnow(), owner_id=test_user.id)
+        theirs = Reminder(title="Theirs", due_date=datetime.utcnow(), owner_id=other_user.id)
+        db.add_all([mine, theirs])
+        db.commit()
+
+        response = authenticated_client.post(f"/api/v1/reminders/{mine.id}/complete")
+        assert response.status_code == 200
+        assert response.json()["is_completed"] is True
+        response = authenticated_client.post(f"/api/v1/reminders/{theirs.id}/complete")
+        assert response.status_code == 403
+
+    def test_delete_location_guards(
+        self, authenticated_client: TestClient, db: Session, test_user: User
+    ):
+        """测试有物品或子位置的位置不能删除"""
+        parent = Location(name="Parent", owner_id=test_user.id)
+        with_items = Location(name="With items", owner_id=test_user.id)
+        db.add_all([parent, with_items])
+        db.commit()
+        db.add_all([
+            Location(name="Child", parent_id=parent.id, owner_id=test_user.id),
+            Item(name="Item", location_id=with_items.id, owner_id=test_user.id),
+        ])
+        db.commit()
+
+        response = authenticated_client.delete(f"/api/v1/locations/{parent.id}")
+        assert response.status_code == 400
+        assert "sub-locations" in response.json()["detail"]
+        response = authenticated_client.delete(f"/api/v1/locations/{with_items.id}")
+        assert response.status_code == 400
+        assert "items" in response.json()["detail"]
+        response = authenticated_client.delete("/api/v1/locations/999999")
+        assert response.status_code == 404
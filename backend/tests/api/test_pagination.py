@@ -0,0 +1,136 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.item import Item
+from app.models.location import Location
+from app.models.reminder import Reminder
+from app.models.user import User
+
+
+def _raw_cursor(payload: dict) -> str:
+    """按游标格式编码任意内容，模拟被篡改的游标"""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _collect(client: TestClient, url: str, params: dict) -> list:
+    """沿着 X-Next-Cursor 翻页，返回所有页的结果"""
+    rows = []
+    params = dict(params)
+    while True:
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        rows.extend(response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            return rows
+        params = {"limit": params["limit"], "cursor": next_cursor}
+
+
+class TestCursorPagination:
+    def test_items_cursor_by_id(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试按 id 游标翻页可以不重不漏地取完所有物品"""
+        db.add_all([Item(name=f"Item {i}", owner_id=test_user.id) for i in range(7)])
+        db.commit()
+
+        rows = _collect(authenticated_client, "/api/v1/items/", {"limit": 3})
+        ids = [row["id"] for row in rows]
+        assert len(ids) == 7
+        assert ids == sorted(ids)
+
+    def test_items_cursor_with_sort_and_nulls(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试按含重复值和 NULL 的字段降序翻页"""
+        prices = [5.0, 10.0, None, 10.0, 1.0, None, 7.5]
+        db.add_all([
+            Item(name=f"Item {i}", price=price, owner_id=test_user.id)
+            for i, price in enumerate(prices)
+        ])
+        db.commit()
+
+        rows = _collect(authenticated_client, "/api/v1/items/", {"limit": 2, "sort": "-price"})
+        assert len({row["id"] for row in rows}) == len(prices)
+        assert [row["price"] for row in rows] == [10.0, 10.0, 7.5, 5.0, 1.0, None, None]
+
+    def test_items_cursor_with_filter(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试游标分页与类别筛选组合使用"""
+        db.add_all([
+            Item(name=f"Item {i}", category="A" if i % 2 else "B", owner_id=test_user.id)
+            for i in range(8)
+        ])
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/", params={"category": "A", "limit": 3})
+        first_page = response.json()
+        response = authenticated_client.get(
+            "/api/v1/items/",
+            params={"category": "A", "limit": 3, "cursor": response.headers["X-Next-Cursor"]},
+        )
+        second_page = response.json()
+        assert len(first_page) == 3
+        assert len(second_page) == 1
+        assert "X-Next-Cursor" not in response.headers
+        assert all(row["category"] == "A" for row in first_page + second_page)
+
+    def test_skip_limit_still_supported(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试旧的 skip/limit 参数仍然可用"""
+        db.add_all([Item(name=f"Item {i}", owner_id=test_user.id) for i in range(5)])
+        db.commit()
+
+        all_ids = [row["id"] for row in authenticated_client.get("/api/v1/items/").json()]
+        response = authenticated_client.get("/api/v1/items/", params={"skip": 2, "limit": 2})
+        assert [row["id"] for row in response.json()] == all_ids[2:4]
+
+    def test_invalid_cursor_and_sort(self, authenticated_client: TestClient):
+        """测试无效游标和排序字段返回400"""
+        response = authenticated_client.get("/api/v1/items/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        response = authenticated_client.get("/api/v1/items/", params={"sort": "owner_id"})
+        assert response.status_code == 400
+
+    def test_cursor_sort_mismatch(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试游标与排序参数不一致时返回400"""
+        db.add_all([Item(name=f"Item {i}", owner_id=test_user.id) for i in range(3)])
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/", params={"limit": 2, "sort": "name"})
+        cursor = response.headers["X-Next-Cursor"]
+        response = authenticated_client.get("/api/v1/items/", params={"cursor": cursor, "sort": "-name"})
+        assert response.status_code == 400
+
+    def test_locations_cursor(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试位置列表的游标分页"""
+        db.add_all([Location(name=f"Location {i}", owner_id=test_user.id) for i in range(5)])
+        db.commit()
+
+        rows = _collect(authenticated_client, "/api/v1/locations/", {"limit": 2, "sort": "-name"})
+        assert [row["name"] for row in rows] == [f"Location {i}" for i in reversed(range(5))]
+
+    def test_reminders_cursor_by_due_date(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试到期提醒按 due_date 游标翻页"""
+        now = datetime.utcnow()
+        db.add_all([
+            Reminder(title=f"Reminder {i}", due_date=now - timedelta(hours=i), owner_id=test_user.id)
+            for i in range(5)
+        ])
+        db.commit()
+
+        rows = _collect(authenticated_client, "/api/v1/reminders/", {"limit": 2, "due": True})
+        assert [row["title"] for row in rows] == [f"Reminder {i}" for i in reversed(range(5))]
+
+    def test_malformed_cursor_values(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试游标中的值与排序列类型不符或不是标量时返回400，而不是在查询时出错"""
+        db.add(Item(name="Lamp", owner_id=test_user.id))
+        db.commit()
+        cursors = [
+            {"s": "-created_at", "v": "garbage", "i": 1},
+            {"s": "name", "v": {"a": 1}, "i": 1},
+            {"s": "name", "v": "a", "i": {"a": 1}},
+            {"s": "name", "v": 5, "i": 1},
+        ]
+        for url in ("/api/v1/items/", "/api/v1/locations/", "/api/v1/reminders/", "/api/v1/categories/"):
+            for payload in cursors:
+                response = authenticated_client.get(url, params={"cursor": _raw_cursor(payload)})
+                assert response.status_code == 400, (url, payload)
@@ -0,0 +1,68 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core import security
+from app.crud.crud_user import user as crud_user
+from app.models.user import User
+
+
+class TestRefreshToken:
+    @pytest.fixture(scope="function")
+    def tokens(self, client: TestClient, test_user: User) -> dict:
+        response = client.post(
+            "/api/v1/auth/login", data={"username": "testuser", "password": "testpassword"}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_login_returns_refresh_token(self, tokens: dict):
+        """测试登录同时返回刷新令牌"""
+        assert tokens["refresh_token"]
+        assert tokens["token_type"] == "bearer"
+
+    def test_refresh_rotates_without_password_hash(self, client: TestClient, tokens: dict, monkeypatch):
+        """测试刷新令牌换取新令牌，且不进行密码哈希"""
+        def fail(*args, **kwargs):
+            raise AssertionError("refresh must not verify passwords")
+
+        monkeypatch.setattr(security.pwd_context, "verify", fail)
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["refresh_token"] != tokens["refresh_token"]
+
+        me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {data['access_token']}"})
+        assert me.status_code == 200
+        assert me.json()["username"] == "testuser"
+
+    def test_reuse_revokes_family(self, client: TestClient, tokens: dict):
+        """测试重用已轮换的刷新令牌会吊销整个令牌族"""
+        first = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        rotated = first.json()["refresh_token"]
+
+        reused = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert reused.status_code == 403
+
+        # 轮换出的新令牌也随之失效
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": rotated})
+        assert response.status_code == 403
+
+    def test_invalid_refresh_token(self, client: TestClient, test_user: User):
+        """测试无效刷新令牌"""
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": "not-a-token"})
+        assert response.status_code == 403
+
+    def test_password_change_revokes_refresh_tokens(self, client: TestClient, db: Session, test_user: User, tokens: dict):
+        """测试修改密码后刷新令牌失效"""
+        crud_user.update(db, db_obj=test_user, obj_in={"password": "newpassword"})
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 403
+
+    def test_inactive_user_cannot_refresh(self, client: TestClient, db: Session, test_user: User, tokens: dict):
+        """测试停用用户无法刷新"""
+        crud_user.update(db, db_obj=test_user, obj_in={"is_active": False})
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 400
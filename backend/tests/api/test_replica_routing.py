@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.main import app
+from app.api.deps import get_replica_db, get_async_replica_db
+from app.db import session as db_session
+from app.db.base import Base
+from app.db.routing import recent_writes
+from app.models.item import Item
+from app.models.user import User
+
+
+class TestReplicaRouting:
+    @pytest.fixture(scope="function")
+    def replica(self, tmp_path, monkeypatch):
+        """用一个空的 SQLite 文件模拟尚未复制到数据的从库"""
+        url = f"sqlite:///{tmp_path / 'replica.db'}"
+        engine = create_engine(url, poolclass=NullPool)
+        Base.metadata.create_all(bind=engine)
+        async_engine = create_async_engine(db_session.to_async_url(url), poolclass=NullPool)
+        ReplicaSession = sessionmaker(bind=engine)
+        AsyncReplicaSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        def override_replica_db():
+            db = ReplicaSession()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def override_async_replica_db():
+            async with AsyncReplicaSession() as db:
+                yield db
+
+        previous = {
+            get_replica_db: app.dependency_overrides.get(get_replica_db),
+            get_async_replica_db: app.dependency_overrides.get(get_async_replica_db),
+        }
+        app.dependency_overrides[get_replica_db] = override_replica_db
+        app.dependency_overrides[get_async_replica_db] = override_async_replica_db
+        monkeypatch.setattr(db_session, "replica_enabled", True)
+        recent_writes.clear()
+        yield
+        recent_writes.clear()
+        app.dependency_overrides.update(previous)
+        engine.dispose()
+
+    def test_reads_go_to_replica(self, replica, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试无近期写入时读请求走从库"""
+        db.add(Item(name="Primary Only", owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 200
+        assert response.json() == []
+
+        response = authenticated_client.get("/api/v1/stats/dashboard")
+        assert response.status_code == 200
+        assert response.json()["counts"]["items"] == 0
+
+    def test_reads_stick_to_primary_after_write(self, replica, authenticated_client: TestClient, test_user: User):
+        """测试用户写入后在粘滞窗口内读主库"""
+        response = authenticated_client.post("/api/v1/items/", json={"name": "Fresh Item"})
+        assert response.status_code == 200
+        assert recent_writes.is_sticky(test_user.id)
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert [item["name"] for item in response.json()] == ["Fresh Item"]
+
+        # 粘滞窗口结束后重新读取从库
+        recent_writes.clear()
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.json() == []
+
+    def test_reads_without_writes_do_not_stick(self, replica, authenticated_client: TestClient, test_user: User):
+        """测试只读请求不会让用户进入粘滞窗口"""
+        authenticated_client.get("/api/v1/items/")
+        authenticated_client.get("/api/v1/auth/me")
+        assert not recent_writes.is_sticky(test_user.id)
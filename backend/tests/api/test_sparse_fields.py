@@ -0,0 +1,69 @@
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.item import Item
+from app.models.location import Location
+from tests.conftest import test_async_engine
+
+
+@pytest.fixture(scope="function")
+def async_statements() -> List[str]:
+    """记录列表接口（异步引擎）执行的SQL语句"""
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_async_engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestSparseFields:
+    def test_items_fields(
+        self, authenticated_client: TestClient, db: Session, test_user, async_statements: List[str]
+    ):
+        """测试只返回并只查询所选字段"""
+        db.add(Item(name="Mug", description="x" * 1000, category="Kitchen", quantity=2, owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/", params={"fields": "name,category,quantity"})
+        assert response.status_code == 200
+        assert response.json() == [
+            {"name": "Mug", "category": "Kitchen", "quantity": 2, "id": response.json()[0]["id"]}
+        ]
+        select_items = [s for s in async_statements if "FROM item" in s]
+        assert select_items
+        assert "description" not in select_items[-1]
+
+    def test_fields_with_cursor(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试字段选择与游标分页组合使用"""
+        db.add_all([Item(name=f"Item {i}", price=float(i), owner_id=test_user.id) for i in range(3)])
+        db.commit()
+
+        response = authenticated_client.get(
+            "/api/v1/items/", params={"fields": "name", "sort": "-price", "limit": 2}
+        )
+        assert [set(row) for row in response.json()] == [{"id", "name"}, {"id", "name"}]
+        cursor = response.headers["X-Next-Cursor"]
+        response = authenticated_client.get(
+            "/api/v1/items/", params={"fields": "name", "cursor": cursor, "limit": 2}
+        )
+        assert [row["name"] for row in response.json()] == ["Item 0"]
+
+    def test_locations_fields(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试位置列表的字段选择"""
+        db.add(Location(name="Garage", description="Cold", owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/locations/", params={"fields": "name"})
+        assert [set(row) for row in response.json()] == [{"id", "name"}]
+
+    def test_unknown_field(self, authenticated_client: TestClient):
+        """测试未知字段返回400"""
+        response = authenticated_client.get("/api/v1/reminders/", params={"fields": "title,password"})
+        assert response.status_code == 400
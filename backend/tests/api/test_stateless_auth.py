@@ -0,0 +1,59 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.revocation import revocation_list
+from app.core.settings import settings
+from app.crud.crud_user import user as crud_user
+from app.models.user import User
+
+
+class TestStatelessAuth:
+    @pytest.fixture(scope="function")
+    def stateless(self, monkeypatch):
+        monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+
+    def test_principal_built_from_token(self, stateless, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试无状态模式下认证不查询用户表"""
+        # 直接修改用户名：数据库查询模式下将找不到用户，令牌模式不受影响
+        test_user.username = "renamed"
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 200
+
+    def test_db_mode_still_loads_user(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试默认模式下仍然通过数据库加载用户"""
+        test_user.username = "renamed"
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 404
+
+    def test_deactivation_takes_effect(self, stateless, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试停用用户后令牌立即失效"""
+        crud_user.update(db, db_obj=test_user, obj_in={"is_active": False})
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+
+        crud_user.update(db, db_obj=test_user, obj_in={"is_active": True})
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 200
+
+    def test_password_change_revokes_tokens(self, db: Session, test_user: User):
+        """测试修改密码会吊销之前签发的令牌"""
+        issued_before = int(time.time()) - 1
+        crud_user.update(db, db_obj=test_user, obj_in={"password": "newpassword"})
+        assert revocation_list.is_revoked(test_user.id, issued_before)
+        assert not revocation_list.is_revoked(test_user.id, int(time.time()))
+
+    def test_revoked_token_rejected(self, stateless, authenticated_client: TestClient, test_user: User):
+        """测试被吊销的令牌无法访问接口"""
+        revocation_list.revoke_tokens(test_user.id, before=time.time() + 1)
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 403
@@ -0,0 +1,103 @@
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.security import get_password_hash
+from app.db.routing import bind_user
+from app.models.item import Item
+from app.models.location import Location
+from app.models.user import User
+from tests.conftest import TestingSessionLocal, test_async_engine
+
+
+@pytest.fixture(scope="function")
+def statements() -> List[str]:
+    """记录测试期间异步引擎执行的SQL语句"""
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_async_engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestSuggest:
+    def test_suggest_items_categories_locations(
+        self, authenticated_client: TestClient, db: Session, test_user: User
+    ):
+        """测试一次返回物品名称、类别和位置的联想结果，且不包含他人的数据"""
+        other = User(
+            username="other", email="other@example.com",
+            hashed_password=get_password_hash("password"), is_active=True,
+        )
+        db.add(other)
+        db.commit()
+        kitchen = Location(name="厨房", owner_id=test_user.id)
+        db.add_all([
+            kitchen,
+            Location(name="厨房（别人的）", owner_id=other.id),
+            Item(name="德国厨刀", category="厨具", owner_id=test_user.id),
+            Item(name="厨刀磨刀石", category="厨具", owner_id=test_user.id),
+            Item(name="厨师帽", category="服装", owner_id=other.id),
+        ])
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/suggest/", params={"q": "厨"})
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": ["厨刀磨刀石", "德国厨刀"],
+            "categories": ["厨具"],
+            "locations": [{"id": kitchen.id, "name": "厨房"}],
+        }
+
+        response = authenticated_client.get("/api/v1/suggest/", params={"q": "厨", "limit": 1})
+        assert response.json()["items"] == ["厨刀磨刀石"]
+
+        assert authenticated_client.get("/api/v1/suggest/").status_code == 422
+
+    def test_index_cached_and_invalidated_on_write(
+        self, authenticated_client: TestClient, db: Session, test_user: User, statements: List[str]
+    ):
+        """测试索引缓存命中时不查询数据库，写入后失效重建"""
+        db.add(Item(name="Tea kettle", owner_id=test_user.id))
+        db.commit()
+
+        assert authenticated_client.get("/api/v1/suggest/", params={"q": "te"}).json()["items"] == ["Tea kettle"]
+        statements.clear()
+        assert authenticated_client.get("/api/v1/suggest/", params={"q": "ket"}).json()["items"] == ["Tea kettle"]
+        assert statements == []
+
+        response = authenticated_client.post("/api/v1/items/", json={"name": "Teapot"})
+        assert response.status_code == 200
+        data = authenticated_client.get("/api/v1/suggest/", params={"q": "te"}).json()
+        assert data["items"] == ["Tea kettle", "Teapot"]
+
+    def test_write_during_build_not_cached(
+        self, authenticated_client: TestClient, db: Session, test_user: User, monkeypatch
+    ):
+        """测试构建索引期间提交的写入会使这次构建的结果不被缓存"""
+        db.add(Item(name="Tea kettle", owner_id=test_user.id))
+        db.commit()
+        original = crud.item.aget_name_rows
+
+        async def read_then_write(*args, **kwargs):
+            rows = await original(*args, **kwargs)
+            # 读取之后、写入缓存之前，另一个请求提交了写入
+            with TestingSessionLocal() as session:
+                bind_user(session, test_user.id)
+                session.add(Item(name="Teapot", owner_id=test_user.id))
+                session.commit()
+            return rows
+
+        monkeypatch.setattr(crud.item, "aget_name_rows", read_then_write)
+        assert authenticated_client.get("/api/v1/suggest/", params={"q": "te"}).json()["items"] == ["Tea kettle"]
+        monkeypatch.setattr(crud.item, "aget_name_rows", original)
+
+        data = authenticated_client.get("/api/v1/suggest/", params={"q": "te"}).json()
+        assert data["items"] == ["Tea kettle", "Teapot"]
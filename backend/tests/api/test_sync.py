@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.maintenance import run_maintenance
+from app.core.settings import settings
+from app.crud.pagination import decode_sync_cursor, encode_sync_cursor
+from app.models.item import Item
+from app.models.location import Location
+from app.models.reminder import Reminder
+from app.models.tombstone import Tombstone
+
+
+@pytest.fixture(autouse=True)
+def no_settle(monkeypatch):
+    """测试中不需要等待 settle 窗口"""
+    monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", -1)
+
+
+class TestSync:
+    def test_initial_and_delta_sync(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试首次同步返回全部数据，之后只返回变更和删除"""
+        location = Location(name="Shelf", owner_id=test_user.id)
+        items = [Item(name=f"Item {i}", owner_id=test_user.id) for i in range(3)]
+        db.add_all([location, *items])
+        db.commit()
+        db.add(Reminder(title="R", due_date=datetime.utcnow(), owner_id=test_user.id))
+        db.commit()
+
+        response = authenticated_client.get("/api/v1/sync/")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 3
+        assert len(data["locations"]) == 1
+        assert len(data["reminders"]) == 1
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        cursor = data["next_cursor"]
+
+        # 无变化时增量为空
+        data = authenticated_client.get("/api/v1/sync/", params={"since": cursor}).json()
+        assert data["items"] == [] and data["locations"] == [] and data["reminders"] == []
+
+        authenticated_client.put(f"/api/v1/items/{items[0].id}", json={"name": "Renamed"})
+        authenticated_client.delete(f"/api/v1/items/{items[1].id}")
+        authenticated_client.post("/api/v1/items/", json={"name": "New"})
+
+        data = authenticated_client.get("/api/v1/sync/", params={"since": cursor}).json()
+        assert sorted(item["name"] for item in data["items"]) == ["New", "Renamed"]
+        assert data["locations"] == []
+        assert [(d["entity_type"], d["entity_id"]) for d in data["deleted"]] == [("item", items[1].id)]
+
+        data = authenticated_client.get("/api/v1/sync/", params={"since": data["next_cursor"]}).json()
+        assert data["items"] == [] and data["deleted"] == []
+
+    def test_bulk_delete_leaves_tombstones(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试批量删除和位置删除都会写入墓碑"""
+        location = Location(name="Box", owner_id=test_user.id)
+        items = [Item(name=f"Item {i}", owner_id=test_user.id) for i in range(2)]
+        db.add_all([location, *items])
+        db.commit()
+
+        authenticated_client.request(
+            "DELETE", "/api/v1/items/bulk", json={"ids": [item.id for item in items]}
+        )
+        authenticated_client.delete(f"/api/v1/locations/{location.id}")
+        tombstones = db.query(Tombstone).filter(Tombstone.owner_id == test_user.id).all()
+        assert sorted((t.entity_type, t.entity_id) for t in tombstones) == sorted(
+            [("item", items[0].id), ("item", items[1].id), ("location", location.id)]
+        )
+
+    def test_sync_pages(self, authenticated_client: TestClient, db: Session, test_user, monkeypatch):
+        """测试超过一页时 has_more 为 True，继续拉取可取完全部数据"""
+        monkeypatch.setattr(settings, "SYNC_PAGE_SIZE", 2)
+        now = datetime.utcnow()
+        db.add_all([
+            Item(name=f"Item {i}", owner_id=test_user.id, updated_at=now - timedelta(seconds=10))
+            for i in range(5)
+        ])
+        db.commit()
+
+        names, since = [], None
+        for _ in range(5):
+            params = {"since": since} if since else {}
+            data = authenticated_client.get("/api/v1/sync/", params=params).json()
+            names.extend(item["name"] for item in data["items"])
+            since = data["next_cursor"]
+            if not data["has_more"]:
+                break
+        assert sorted(names) == [f"Item {i}" for i in range(5)]
+
+    def test_invalid_cursor(self, authenticated_client: TestClient):
+        """测试无效游标返回400"""
+        response = authenticated_client.get("/api/v1/sync/", params={"since": "garbage"})
+        assert response.status_code == 400
+
+    def test_stale_cursor_requires_full_resync(self, authenticated_client: TestClient, db: Session, test_user):
+        """测试删除可能已超出墓碑保留期的游标返回410，而不是返回漏掉删除的增量"""
+        db.add(Item(name="Lamp", owner_id=test_user.id))
+        db.commit()
+        cursor = authenticated_client.get("/api/v1/sync/").json()["next_cursor"]
+        assert authenticated_client.get("/api/v1/sync/", params={"since": cursor}).status_code == 200
+
+        positions, _ = decode_sync_cursor(cursor)
+        stale = datetime.utcnow() - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS, seconds=1)
+        response = authenticated_client.get(
+            "/api/v1/sync/", params={"since": encode_sync_cursor(positions, stale)}
+        )
+        assert response.status_code == 410
+        assert response.json()["detail"] == "Full resync required"
+
+        # 没有删除时间点的旧格式游标无法确认是否漏掉删除
+        response = authenticated_client.get(
+            "/api/v1/sync/", params={"since": encode_sync_cursor(positions)}
+        )
+        assert response.status_code == 410
+
+    def test_maintenance_prunes_old_tombstones(self, db: Session, test_user):
+        """测试定期清理只删除超过保留期的墓碑"""
+        now = datetime.utcnow()
+        retention = timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+        db.add_all([
+            Tombstone(entity_type="item", entity_id=1, owner_id=test_user.id,
+                      deleted_at=now - retention - timedelta(minutes=1)),
+            Tombstone(entity_type="item", entity_id=2, owner_id=test_user.id,
+                      deleted_at=now - retention + timedelta(minutes=1)),
+        ])
+        db.commit()
+
+        assert run_maintenance(db, now=now)["tombstones"] == 1
+        assert run_maintenance(db, now=now)["tombstones"] == 0
+        assert [t.entity_id for t in db.query(Tombstone).all()] == [2]
@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.core.cache import user_cache
+from app.crud.crud_user import user as crud_user
+from app.main import app
+from app.models.user import User
+
+
+class TestUserCache:
+    def test_repeated_requests_hit_cache(self, authenticated_client: TestClient, test_user: User):
+        """测试同一用户的多个请求只查询一次用户表"""
+        for path in ("/api/v1/items/", "/api/v1/locations/", "/api/v1/reminders/", "/api/v1/stats/dashboard"):
+            assert authenticated_client.get(path).status_code == 200
+
+        stats = authenticated_client.get("/api/v1/health/cache").json()["user"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 3
+
+    def test_update_me_invalidates_cache(self, authenticated_client: TestClient, test_user: User):
+        """测试通过 /auth/me 更新用户后缓存失效"""
+        authenticated_client.get("/api/v1/items/")
+        assert user_cache.get(test_user.username) is not None
+
+        response = authenticated_client.put("/api/v1/auth/me", json={"first_name": "New"})
+        assert response.status_code == 200
+        assert user_cache.get(test_user.username) is None
+
+    def test_deactivation_invalidates_cache(self, authenticated_client: TestClient, db: Session, test_user: User):
+        """测试停用用户后缓存的快照不再生效"""
+        assert authenticated_client.get("/api/v1/items/").status_code == 200
+
+        crud_user.update(db, db_obj=test_user, obj_in={"is_active": False})
+
+        response = authenticated_client.get("/api/v1/items/")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_async_endpoints_authenticate_without_sync_session(
+        self, authenticated_client: TestClient, test_user: User
+    ):
+        """测试异步端点缓存未命中时通过 AsyncSession 查询用户，不签出同步会话"""
+        user_cache.clear()
+
+        def sync_session_not_allowed():
+            raise AssertionError("async endpoint opened a sync session")
+            yield
+
+        previous = app.dependency_overrides[get_db]
+        app.dependency_overrides[get_db] = sync_session_not_allowed
+        try:
+            for path in ("/api/v1/items/", "/api/v1/locations/tree", "/api/v1/reminders/", "/api/v1/sync/"):
+                assert authenticated_client.get(path).status_code == 200
+        finally:
+            app.dependency_overrides[get_db] = previous
+        assert user_cache.get(test_user.username) is not None
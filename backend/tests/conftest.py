@@ -7,13 +7,21 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import pytest
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from fastapi.testclient import TestClient
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy.pool import NullPool
 
 from app.main import app
 from app.db.base import Base
-from app.api.deps import get_db
+from app.api.deps import get_db, get_async_db, get_replica_db, get_async_replica_db
+from app.db.session import to_async_url
+from app.db.routing import recent_writes
+from app.core.revocation import revocation_list
+from app.core.cache import user_cache
+from app.core.suggest import suggest_cache
+from app.core.facets import facet_cache
+from app.core.throttle import login_throttle
 from app.core.settings import settings
 from app.models.user import User
 from app.crud.crud_user import user as crud_user
@@ -52,6 +60,18 @@ TestingSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# 异步引擎（asyncpg / aiosqlite），连接同一个测试数据库
+test_async_engine = create_async_engine(
+    to_async_url(TEST_DATABASE_URL),
+    poolclass=NullPool,
+)
+
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=test_async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # 重写依赖项以使用测试数据库
 def override_get_db() -> Generator[Session, None, None]:
     db = TestingSessionLocal()
@@ -60,7 +80,34 @@ def override_get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+
+async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+# 测试环境不配置从库，只读会话同样指向测试数据库
+app.dependency_overrides[get_replica_db] = override_get_db
+app.dependency_overrides[get_async_replica_db] = override_get_async_db
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_state() -> Generator[None, None, None]:
+    """清理进程内的认证状态（吊销名单、用户缓存、从库粘滞窗口、登录限流）和联想索引，避免测试间相互影响"""
+    revocation_list.clear()
+    user_cache.clear()
+    recent_writes.clear()
+    login_throttle.clear()
+    suggest_cache.clear()
+    facet_cache.clear()
+    yield
+    revocation_list.clear()
+    user_cache.clear()
+    recent_writes.clear()
+    login_throttle.clear()
+    suggest_cache.clear()
+    facet_cache.clear()
 
 
 @pytest.fixture(scope="function")
@@ -77,10 +124,13 @@ def db() -> Generator[Session, None, None]:
                 conn.execute(text("GRANT ALL ON SCHEMA public TO public"))
             except Exception as e:
                 print(f"重置数据库架构时出错: {e}")
-        
+        else:
+            # 不使用本夹具的测试（如 test_auth）可能留下数据，先删除所有表
+            Base.metadata.drop_all(bind=conn)
+
         # 创建所有表
         Base.metadata.create_all(bind=conn)
-    
+
     # 创建会话
     db = TestingSessionLocal()
     
@@ -129,6 +179,12 @@ def db() -> Generator[Session, None, None]:
                 Base.metadata.create_all(bind=conn)
 
 
+@pytest.fixture(scope="function")
+def async_session_factory(db: Session) -> async_sessionmaker:
+    """异步会话工厂（依赖 db 夹具以确保表已创建）"""
+    return TestingAsyncSessionLocal
+
+
 @pytest.fixture(scope="function")
 def client() -> Generator[TestClient, None, None]:
     """创建测试客户端"""
@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.admission import AdmissionController, AdmissionControlMiddleware
+from app.main import CORS_EXPOSE_HEADERS, app as main_app
+
+
+def create_app(controller: AdmissionController, release: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware, controller=controller, exempt_paths=("/health",)
+    )
+
+    @app.get("/slow")
+    async def slow():
+        await release.wait()
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+class TestAdmissionControl:
+    def test_rejects_when_queue_full(self):
+        """测试并发和等待队列都已满时快速返回503"""
+        controller = AdmissionController(max_concurrency=2, max_queue=1, queue_timeout=5)
+
+        async def run():
+            release = asyncio.Event()
+            app = create_app(controller, release)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                pending = [asyncio.create_task(client.get("/slow")) for _ in range(3)]
+                while controller.active < 2 or controller.waiting < 1:
+                    await asyncio.sleep(0.01)
+
+                rejected = await client.get("/slow")
+                assert rejected.status_code == 503
+                assert rejected.headers["Retry-After"] == "1"
+
+                # 健康检查不受准入控制影响
+                health = await client.get("/health")
+                assert health.status_code == 200
+
+                release.set()
+                responses = await asyncio.gather(*pending)
+                assert [r.status_code for r in responses] == [200, 200, 200]
+
+        asyncio.run(run())
+        stats = controller.snapshot()
+        assert stats["admitted"] == 3
+        assert stats["queued"] == 1
+        assert stats["rejected_queue_full"] == 1
+        assert stats["active"] == 0
+
+    def test_rejects_after_queue_timeout(self):
+        """测试排队超时的请求返回503"""
+        controller = AdmissionController(max_concurrency=1, max_queue=5, queue_timeout=0.05)
+
+        async def run():
+            release = asyncio.Event()
+            app = create_app(controller, release)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = asyncio.create_task(client.get("/slow"))
+                while controller.active < 1:
+                    await asyncio.sleep(0.01)
+
+                timed_out = await client.get("/slow")
+                assert timed_out.status_code == 503
+
+                release.set()
+                assert (await first).status_code == 200
+
+        asyncio.run(run())
+        assert controller.snapshot()["rejected_timeout"] == 1
+
+    def test_rejection_carries_cors_headers(self):
+        """测试 CORS 包在准入控制外层：503 响应带有 CORS 头，浏览器可以读取 Retry-After"""
+        order = [middleware.cls for middleware in main_app.user_middleware]
+        assert order.index(CORSMiddleware) < order.index(AdmissionControlMiddleware)
+        assert {"ETag", "Retry-After"} <= set(CORS_EXPOSE_HEADERS)
+
+        controller = AdmissionController(max_concurrency=1, max_queue=0, queue_timeout=5)
+
+        async def run():
+            release = asyncio.Event()
+            app = create_app(controller, release)
+            app.add_middleware(
+                CORSMiddleware, allow_origins=["*"], expose_headers=CORS_EXPOSE_HEADERS
+            )
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = asyncio.create_task(client.get("/slow"))
+                while controller.active < 1:
+                    await asyncio.sleep(0.01)
+
+                rejected = await client.get("/slow", headers={"Origin": "http://example.com"})
+                assert rejected.status_code == 503
+                assert rejected.headers["Access-Control-Allow-Origin"] == "*"
+                assert "Retry-After" in rejected.headers["Access-Control-Expose-Headers"]
+
+                release.set()
+                assert (await first).status_code == 200
+
+        asyncio.run(run())
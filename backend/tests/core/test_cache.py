@@ -0,0 +1,77 @@
+import time
+
+from app.core.cache import TTLCache, UserScopedCache
+
+
+class TestTTLCache:
+    def test_hit_and_miss_counters(self):
+        """测试命中与未命中计数"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_lru_eviction(self):
+        """测试超出容量时淘汰最久未使用的条目"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """测试条目过期"""
+        cache = TTLCache(maxsize=10, ttl=5)
+        cache.set("a", 1)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+        assert cache.get("a") is None
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate(self):
+        """测试手动失效"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+
+class TestUserScopedCache:
+    def test_invalidate_user(self):
+        """测试按用户失效，不影响其他用户"""
+        cache = UserScopedCache(maxsize=10, ttl=60)
+        cache.set(cache.key(1, "a"), 1)
+        cache.set(cache.key(1, "b"), 2)
+        cache.set(cache.key(2, "a"), 3)
+        cache.invalidate(1)
+
+        assert cache.get(cache.key(1, "a")) is None
+        assert cache.get(cache.key(1, "b")) is None
+        assert cache.get(cache.key(2, "a")) == 3
+
+    def test_write_during_computation(self):
+        """测试计算期间发生写入时，结果不会被之后的读取命中"""
+        cache = UserScopedCache(maxsize=10, ttl=60)
+        key = cache.key(1, "a")
+        cache.invalidate(1)
+        cache.set(key, "stale")
+        assert cache.get(cache.key(1, "a")) is None
+
+    def test_generation_table_bounded(self):
+        """测试代号表超过容量时整体清空，且不会命中旧条目"""
+        cache = UserScopedCache(maxsize=2, ttl=60)
+        cache.set(cache.key(1, "a"), 1)
+        for user_id in (2, 3, 4):
+            cache.invalidate(user_id)
+        assert len(cache._generations) <= 2
+        assert cache.get(cache.key(1, "a")) is None
@@ -0,0 +1,54 @@
+import asyncio
+import csv
+import io
+import re
+import zipfile
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Sequence
+
+from app.core.export import EXPORT_COLUMNS, iter_csv, iter_xlsx
+
+
+async def batches_of(rows: List[Sequence[Any]], size: int) -> AsyncIterator[List[Sequence[Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def collect(stream: AsyncIterator[bytes]) -> List[bytes]:
+    async def run() -> List[bytes]:
+        return [chunk async for chunk in stream]
+    return asyncio.run(run())
+
+
+ROWS = [
+    (1, "德国厨刀", "a, \"quoted\"\nline", "厨具", 1, 99.5, datetime(2024, 1, 2, 3, 4, 5),
+     None, "厨房 / 抽屉", datetime(2024, 1, 1), datetime(2024, 1, 1)),
+    (2, "牛奶\x01<&>", None, None, 2, None, None, None, None, datetime(2024, 1, 1), datetime(2024, 1, 1)),
+]
+
+
+class TestExportWriters:
+    def test_csv(self):
+        """测试 CSV 带 BOM、逐批输出且转义正确"""
+        chunks = collect(iter_csv(batches_of(ROWS, 1)))
+        assert len(chunks) == 3
+        text = b"".join(chunks).decode("utf-8-sig")
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0] == list(EXPORT_COLUMNS)
+        assert rows[1][1:4] == ["德国厨刀", "a, \"quoted\"\nline", "厨具"]
+        assert rows[1][6] == "2024-01-02T03:04:05"
+        assert rows[2][5] == ""
+
+    def test_xlsx(self):
+        """测试 XLSX 是合法的 zip 包，工作表包含表头和所有行"""
+        chunks = collect(iter_xlsx(batches_of(ROWS, 1)))
+        assert len(chunks) > 1
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.testzip() is None
+        assert {"[Content_Types].xml", "xl/workbook.xml", "xl/worksheets/sheet1.xml"} <= set(archive.namelist())
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        assert sheet.count("<row>") == 3
+        assert "德国厨刀" in sheet and '<v>99.5</v>' in sheet
+        # 非法控制字符被移除，特殊字符被转义
+        assert "牛奶&lt;&amp;&gt;" in sheet
+        assert not re.search("[\x00-\x08]", sheet)
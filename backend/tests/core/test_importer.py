@@ -0,0 +1,109 @@
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.core.export import iter_xlsx
+from app.core.importer import ImportFileError, ImportJob, ImportJobRegistry, read_rows
+from tests.core.test_export import ROWS, batches_of, collect
+
+SHEET_NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+
+
+def write_xlsx(path: Path, sheet_data: str, shared_strings: str = "") -> None:
+    """用标准库写出一个最小的 XLSX（工作表位于非默认路径，以验证通过关系文件定位）"""
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook {SHEET_NS} xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="物品" sheetId="1" r:id="rId7"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId7" Type="worksheet" Target="worksheets/data.xml"/></Relationships>',
+        )
+        archive.writestr("xl/worksheets/data.xml", f"<worksheet {SHEET_NS}><sheetData>{sheet_data}</sheetData></worksheet>")
+        if shared_strings:
+            archive.writestr("xl/sharedStrings.xml", f"<sst {SHEET_NS}>{shared_strings}</sst>")
+
+
+class TestReadRows:
+    def test_csv(self, tmp_path: Path):
+        """测试 CSV：识别表头（不区分大小写，可带 BOM），忽略未知列和空白单元格，跳过空行"""
+        path = tmp_path / "items.csv"
+        path.write_text(
+            "﻿ID,Name,Quantity,Location,备注\n1, 德国厨刀 ,2,厨房 / 抽屉,x\n,,,,\n2,牛奶,,,\n",
+            encoding="utf-8",
+        )
+        rows = list(read_rows(str(path), "csv"))
+        assert rows == [
+            (2, {"name": "德国厨刀", "quantity": "2", "location": "厨房 / 抽屉"}),
+            (4, {"name": "牛奶"}),
+        ]
+
+    def test_xlsx_round_trip(self, tmp_path: Path):
+        """测试读取导出的 XLSX（内联字符串、数值单元格）"""
+        path = tmp_path / "items.xlsx"
+        path.write_bytes(b"".join(collect(iter_xlsx(batches_of(ROWS, 1)))))
+        rows = dict(read_rows(str(path), "xlsx"))
+        assert rows[2]["name"] == "德国厨刀"
+        assert rows[2]["description"] == "a, \"quoted\"\nline"
+        assert rows[2]["price"] == 99.5 and rows[2]["quantity"] == 1
+        assert rows[2]["purchase_date"] == "2024-01-02T03:04:05"
+        assert rows[2]["location"] == "厨房 / 抽屉"
+        assert "id" not in rows[2] and "created_at" not in rows[2]
+        assert rows[3] == {"name": "牛奶<&>", "quantity": 2}
+
+    def test_xlsx_shared_strings(self, tmp_path: Path):
+        """测试共享字符串（含富文本）、跳过的列、日期序列号和数值名称"""
+        path = tmp_path / "items.xlsx"
+        write_xlsx(
+            path,
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="C1" t="s"><v>1</v></c></row>'
+            '<row r="3"><c r="A3" t="s"><v>2</v></c><c r="C3"><v>45292.5</v></c></row>'
+            '<row r="4"><c r="A4"><v>123</v></c></row>',
+            '<si><t>name</t></si><si><t>expiry_date</t></si>'
+            '<si><r><t>德国</t></r><r><t>厨刀</t></r><rPh><t>doku</t></rPh></si>',
+        )
+        assert list(read_rows(str(path), "xlsx")) == [
+            (3, {"name": "德国厨刀", "expiry_date": datetime(2024, 1, 1, 12)}),
+            (4, {"name": "123"}),
+        ]
+
+    def test_invalid_files(self, tmp_path: Path):
+        """测试无法解析的文件和缺少 name 列"""
+        path = tmp_path / "bad.xlsx"
+        path.write_bytes(b"not a zip")
+        with pytest.raises(ImportFileError):
+            list(read_rows(str(path), "xlsx"))
+
+        path = tmp_path / "bad.csv"
+        path.write_text("id,quantity\n1,2\n", encoding="utf-8")
+        with pytest.raises(ImportFileError, match="name"):
+            list(read_rows(str(path), "csv"))
+
+        path.write_bytes(b"name\n\xff\xfe\n")
+        with pytest.raises(ImportFileError):
+            list(read_rows(str(path), "csv"))
+
+        path.write_text("", encoding="utf-8")
+        with pytest.raises(ImportFileError):
+            list(read_rows(str(path), "csv"))
+
+
+class TestImportJobRegistry:
+    def test_running_job_is_not_expired_or_evicted(self):
+        """测试进行中的任务不受保留时间和容量限制，结束后才开始计算保留时间"""
+        registry = ImportJobRegistry(maxsize=1, ttl=0)
+        job = ImportJob(owner_id=1)
+        registry.start(job)
+        for _ in range(3):
+            other = ImportJob(owner_id=2)
+            registry.start(other)
+            registry.finish(other)
+        assert registry.get(job.id) is job
+
+        registry.finish(job)
+        assert registry.get(job.id) is None
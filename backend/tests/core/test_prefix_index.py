@@ -0,0 +1,38 @@
+from app.core.suggest import PrefixIndex, SuggestIndex
+
+
+class TestPrefixIndex:
+    def test_prefix_lookup(self):
+        """测试前缀匹配不区分大小写，整条前缀命中排在词内命中之前"""
+        index = PrefixIndex((name, name) for name in ["Phone Charger", "Phone", "Smart phone", "Laptop"])
+        assert index.lookup("PH") == ["Phone", "Phone Charger", "Smart phone"]
+        assert index.lookup("char") == ["Phone Charger"]
+        assert index.lookup("x") == []
+        assert index.lookup("  ") == []
+
+    def test_cjk_infix(self):
+        """测试中文词条内任意字符都可以作为匹配起点"""
+        index = PrefixIndex((name, name) for name in ["儿童积木玩具套装", "积木收纳盒", "德国WMF厨刀"])
+        assert index.lookup("积木") == ["积木收纳盒", "儿童积木玩具套装"]
+        assert index.lookup("wmf") == ["德国WMF厨刀"]
+        assert index.lookup("厨刀") == ["德国WMF厨刀"]
+
+    def test_limit_and_dedup(self):
+        """测试结果去重并截断到 limit 条"""
+        index = PrefixIndex((f"ab ab {i}", i) for i in range(20))
+        assert index.lookup("ab", limit=5) == [0, 1, 10, 11, 12]
+        assert len(index.lookup("ab", limit=50)) == 20
+
+
+class TestSuggestIndex:
+    def test_suggest(self):
+        """测试同时返回物品名称、去重类别和位置"""
+        index = SuggestIndex(
+            [("厨刀", "厨具"), ("厨刀", "厨具"), ("砧板", "厨具"), ("Tea", None)],
+            [(1, "厨房"), (2, "书房")],
+        )
+        assert index.suggest("厨") == {
+            "items": ["厨刀"],
+            "categories": ["厨具"],
+            "locations": [{"id": 1, "name": "厨房"}],
+        }
@@ -0,0 +1,36 @@
+from app.core.search import (
+    fts5_query_text,
+    query_tokens,
+    search_tokens,
+    tokenize,
+    tsquery_text,
+)
+
+
+class TestSearchTokenizer:
+    def test_cjk_unigrams_and_bigrams(self):
+        """测试中文片段拆成单字和二字组"""
+        assert tokenize("厨刀") == ["厨", "刀", "厨刀"]
+        assert tokenize("德国厨刀") == ["德", "国", "厨", "刀", "德国", "国厨", "厨刀"]
+
+    def test_mixed_text(self):
+        """测试中英文混排和大小写"""
+        assert tokenize("WMF 厨刀-2024款") == ["wmf", "厨", "刀", "厨刀", "2024", "款"]
+        assert tokenize(None) == []
+
+    def test_search_tokens(self):
+        """测试生成空格分隔的词元串"""
+        assert search_tokens("德国 Knife") == "德 国 德国 knife"
+        assert search_tokens(None) == ""
+
+    def test_query_tokens(self):
+        """测试查询只使用二字组，末尾英文单词按前缀匹配"""
+        assert query_tokens("积木玩具") == (["积木", "木玩", "玩具"], None)
+        assert query_tokens("刀") == (["刀"], None)
+        assert query_tokens("wmf 厨刀 kni") == (["wmf", "厨刀"], "kni")
+        assert query_tokens("!!!") == ([], None)
+
+    def test_query_text(self):
+        """测试生成 PostgreSQL 与 FTS5 查询表达式"""
+        assert tsquery_text(["厨刀"], "kni") == "'厨刀' & 'kni':*"
+        assert fts5_query_text(["厨刀"], "kni") == '"厨刀" AND "kni"*'
@@ -0,0 +1,86 @@
+import time
+
+from app.core.throttle import LoginThrottle, MemoryThrottleStore, TrustedProxies, resolve_client_ip
+
+
+def make_throttle(**overrides) -> LoginThrottle:
+    options = dict(
+        max_attempts_per_username=3,
+        max_attempts_per_ip=5,
+        window=60,
+        backoff_base=1,
+        backoff_max=8,
+    )
+    options.update(overrides)
+    return LoginThrottle(MemoryThrottleStore(), **options)
+
+
+class TestLoginThrottle:
+    def test_blocks_after_max_attempts(self):
+        """测试超过失败次数后封禁"""
+        throttle = make_throttle()
+        for _ in range(2):
+            throttle.record_failure("alice", "1.1.1.1")
+        assert throttle.retry_after("alice", "1.1.1.1") is None
+
+        throttle.record_failure("alice", "1.1.1.1")
+        assert throttle.retry_after("alice", "1.1.1.1") > 0
+        # 其他用户名不受影响
+        assert throttle.retry_after("bob", "2.2.2.2") is None
+
+    def test_exponential_backoff(self, monkeypatch):
+        """测试封禁时间按指数增长并有上限"""
+        throttle = make_throttle(max_attempts_per_username=1)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now)
+
+        waits = []
+        for _ in range(5):
+            throttle.record_failure("alice", None)
+            waits.append(throttle.retry_after("alice", None))
+        assert waits == [1, 2, 4, 8, 8]
+
+    def test_sliding_window(self, monkeypatch):
+        """测试窗口之外的失败不再计数"""
+        throttle = make_throttle()
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now)
+        throttle.record_failure("alice", None)
+        throttle.record_failure("alice", None)
+
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        throttle.record_failure("alice", None)
+        assert throttle.retry_after("alice", None) is None
+
+    def test_ip_limit_across_usernames(self):
+        """测试同一IP尝试多个用户名时按IP封禁"""
+        throttle = make_throttle()
+        for i in range(5):
+            throttle.record_failure(f"user{i}", "1.1.1.1")
+        assert throttle.retry_after("someone-else", "1.1.1.1") > 0
+        assert throttle.retry_after("someone-else", "2.2.2.2") is None
+
+    def test_success_resets_username_only(self):
+        """测试登录成功只重置用户名维度"""
+        throttle = make_throttle(max_attempts_per_ip=3)
+        for _ in range(3):
+            throttle.record_failure("alice", "1.1.1.1")
+        throttle.record_success("alice", "1.1.1.1")
+        assert throttle.retry_after("alice", None) is None
+        assert throttle.retry_after("alice", "1.1.1.1") > 0
+
+
+class TestClientIp:
+    def test_trusted_proxy_uses_forwarded_for(self):
+        """测试经可信代理转发时取 X-Forwarded-For 中最右边的不可信地址"""
+        trusted = TrustedProxies("10.0.0.0/8, nginx")
+        assert resolve_client_ip("10.0.0.2", "1.1.1.1", trusted) == "1.1.1.1"
+        # 客户端自己填写的 X-Forwarded-For 在最左边，不能用来伪造地址
+        assert resolve_client_ip("10.0.0.2", "6.6.6.6, 1.1.1.1, 10.0.0.3", trusted) == "1.1.1.1"
+        assert resolve_client_ip("nginx", "2.2.2.2", trusted) == "2.2.2.2"
+        assert resolve_client_ip("10.0.0.2", None, trusted) == "10.0.0.2"
+
+    def test_untrusted_peer_ignores_forwarded_for(self):
+        """测试直接连接的对端不是可信代理时忽略 X-Forwarded-For"""
+        assert resolve_client_ip("5.5.5.5", "1.1.1.1", TrustedProxies("10.0.0.0/8")) == "5.5.5.5"
+        assert resolve_client_ip("10.0.0.2", "1.1.1.1", TrustedProxies("")) == "10.0.0.2"
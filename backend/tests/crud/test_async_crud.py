@@ -0,0 +1,94 @@
+import asyncio
+
+from app.crud.crud_item import item as crud_item
+from app.crud.crud_location import location as crud_location
+from app.crud.crud_reminder import reminder as crud_reminder
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.location import LocationCreate
+from app.schemas.reminder import ReminderCreate
+from app.models.user import User
+from datetime import datetime, timedelta, timezone
+
+
+class TestAsyncCRUD:
+    def test_item_lifecycle(self, async_session_factory, test_user: User):
+        """测试异步创建、读取、更新和删除物品"""
+        async def run():
+            async with async_session_factory() as db:
+                item_in = ItemCreate(
+                    name="Async Item",
+                    description="An async item",
+                    category="Food",
+                    expiry_date=datetime.now(timezone.utc) + timedelta(days=3),
+                )
+                item = await crud_item.acreate(db, obj_in=item_in, owner_id=test_user.id)
+                assert item.id is not None
+                assert item.owner_id == test_user.id
+
+                stored = await crud_item.aget(db, id=item.id)
+                assert stored.name == "Async Item"
+
+                items = await crud_item.aget_by_categories(
+                    db, categories=["Food", "Books"], owner_id=test_user.id
+                )
+                assert [i.id for i in items] == [item.id]
+
+                found = await crud_item.asearch_by_name(db, name="async", owner_id=test_user.id)
+                assert len(found) == 1
+
+                updated = await crud_item.aupdate(
+                    db, db_obj=stored, obj_in=ItemUpdate(quantity=5)
+                )
+                assert updated.quantity == 5
+                assert updated.name == "Async Item"
+
+                removed = await crud_item.aremove(db, id=item.id)
+                assert removed.id == item.id
+                assert await crud_item.aget(db, id=item.id) is None
+
+        asyncio.run(run())
+
+    def test_location_tree(self, async_session_factory, test_user: User):
+        """测试异步一次性构建位置树"""
+        async def run():
+            async with async_session_factory() as db:
+                root = await crud_location.acreate(
+                    db, obj_in=LocationCreate(name="主卧"), owner_id=test_user.id
+                )
+                child = await crud_location.acreate(
+                    db, obj_in=LocationCreate(name="衣柜", parent_id=root.id), owner_id=test_user.id
+                )
+                await crud_location.acreate(
+                    db, obj_in=LocationCreate(name="抽屉", parent_id=child.id), owner_id=test_user.id
+                )
+
+                tree = await crud_location.aget_location_tree(db, owner_id=test_user.id)
+                assert len(tree) == 1
+                assert tree[0].name == "主卧"
+                assert tree[0].children[0].name == "衣柜"
+                assert tree[0].children[0].children[0].name == "抽屉"
+
+        asyncio.run(run())
+
+    def test_due_reminders_and_mark_completed(self, async_session_factory, test_user: User):
+        """测试异步查询到期提醒并标记完成"""
+        async def run():
+            async with async_session_factory() as db:
+                reminder = await crud_reminder.acreate(
+                    db,
+                    obj_in=ReminderCreate(
+                        title="过期提醒",
+                        due_date=datetime.now(timezone.utc) - timedelta(days=1),
+                    ),
+                    owner_id=test_user.id,
+                )
+                due = await crud_reminder.aget_due_reminders(db, owner_id=test_user.id)
+                assert [r.id for r in due] == [reminder.id]
+
+                completed = await crud_reminder.amark_completed(
+                    db, reminder_id=reminder.id, owner_id=test_user.id
+                )
+                assert completed.is_completed is True
+                assert await crud_reminder.aget_due_reminders(db, owner_id=test_user.id) == []
+
+        asyncio.run(run())
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.crud_category import ORPHAN_GRACE, category as crud_category
+from app.crud.crud_item import ItemFilter, item as crud_item
+from app.models.category import Category
+from app.models.item import Item
+from app.models.tombstone import Tombstone
+from app.models.user import User
+from app.schemas.item import ItemCreate, ItemUpdate
+
+
+class TestCategoryCRUD:
+    def test_items_reference_categories_by_id(self, db: Session, test_user: User):
+        """测试写入物品时按名称创建类别，同一用户的同名类别只保存一份"""
+        created = crud_item.create_multi(db, objs_in=[
+            ItemCreate(name="牛奶", category="食品"),
+            ItemCreate(name="面包", category="食品"),
+            ItemCreate(name="钢笔", category="文具"),
+            ItemCreate(name="剪刀"),
+        ], owner_id=test_user.id)
+        assert [row.category for row in created] == ["食品", "食品", "文具", None]
+
+        other = crud_item.create(db, obj_in=ItemCreate(name="苹果", category="食品"), owner_id=test_user.id + 1)
+        assert other.category == "食品"
+
+        categories = db.execute(select(Category).order_by(Category.id)).scalars().all()
+        assert [(c.owner_id, c.name) for c in categories] == [
+            (test_user.id, "文具"), (test_user.id, "食品"), (test_user.id + 1, "食品"),
+        ]
+        food = crud_category.get_by_name(db, name="食品", owner_id=test_user.id)
+        items = db.execute(select(Item).where(Item.owner_id == test_user.id)).scalars().all()
+        assert {item.name: item.category_id for item in items}["牛奶"] == food.id
+        assert {item.name: item.category for item in items}["剪刀"] is None
+
+    def test_update_category(self, db: Session, test_user: User):
+        """测试修改物品类别：ORM 和批量更新都改写 category_id，清空类别时置空"""
+        item = crud_item.create(db, obj_in=ItemCreate(name="牛奶", category="食品"), owner_id=test_user.id)
+        item = crud_item.update(db, db_obj=item, obj_in=ItemUpdate(category="饮料"))
+        assert item.category == "饮料"
+        assert item.category_id == crud_category.get_by_name(db, name="饮料", owner_id=test_user.id).id
+
+        row = crud_item.update_owned(db, id=item.id, owner_id=test_user.id, obj_in={"category": None})
+        assert row.category is None
+        db.refresh(item)
+        assert item.category_id is None
+
+    def test_rename_category(self, db: Session, test_user: User):
+        """测试类别改名不改写物品的 category_id，按类别筛选和分组随之使用新名称"""
+        created = crud_item.create_multi(db, objs_in=[
+            ItemCreate(name="牛奶", category="食品"),
+            ItemCreate(name="面包", category="食品"),
+            ItemCreate(name="钢笔", category="文具"),
+        ], owner_id=test_user.id)
+        food = crud_category.get_by_name(db, name="食品", owner_id=test_user.id)
+
+        renamed = crud_category.update_owned(db, id=food.id, owner_id=test_user.id, obj_in={"name": "吃的"})
+        assert renamed.name == "吃的"
+        # 只修改类别一行，物品行保持不变
+        items = {item.name: item for item in db.execute(select(Item)).scalars().all()}
+        assert [items[row.name].updated_at for row in created] == [row.updated_at for row in created]
+        assert items["牛奶"].category_id == food.id
+
+        assert crud_item.get_by_categories(db, categories=["食品"], owner_id=test_user.id) == []
+        items = crud_item.get_by_categories(db, categories=["吃的", "文具"], owner_id=test_user.id)
+        assert {item.name for item in items} == {"牛奶", "面包", "钢笔"}
+        filters = ItemFilter(categories=("吃的", "文具"))
+        facets = crud_item.get_facets(db, filters=filters, owner_id=test_user.id, now=datetime.utcnow())
+        assert [(c["name"], c["count"]) for c in facets["categories"]] == [("吃的", 2), ("文具", 1)]
+
+    def test_prune_orphans(self, db: Session, test_user: User):
+        """测试只清理超过 ORPHAN_GRACE 且没有物品引用的类别，写入墓碑并递增类别集合的版本号"""
+        item = crud_item.create(db, obj_in=ItemCreate(name="牛奶", category="食品"), owner_id=test_user.id)
+        crud_item.create(db, obj_in=ItemCreate(name="钢笔", category="文具"), owner_id=test_user.id)
+        food = crud_category.get_by_name(db, name="食品", owner_id=test_user.id)
+        crud_item.update(db, db_obj=item, obj_in=ItemUpdate(category="饮料"))
+        version = crud_category.collection_version(db, owner_id=test_user.id)
+
+        # 刚变成孤儿的类别在宽限期内保留
+        assert crud_category.prune_orphans(db, now=datetime.utcnow()) == 0
+        later = datetime.utcnow() + ORPHAN_GRACE + timedelta(minutes=1)
+        assert crud_category.prune_orphans(db, now=later) == 1
+        assert sorted(c.name for c in db.execute(select(Category)).scalars()) == ["文具", "饮料"]
+        assert int(crud_category.collection_version(db, owner_id=test_user.id)) == int(version) + 1
+        deleted = db.execute(select(Tombstone)).scalars().all()
+        assert [(t.entity_type, t.entity_id, t.owner_id) for t in deleted] == [
+            ("category", food.id, test_user.id),
+        ]
+        assert crud_category.prune_orphans(db, now=later) == 0
@@ -0,0 +1,102 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud.crud_category import category as crud_category
+from app.crud.crud_item import item as crud_item
+from app.crud.crud_location import location as crud_location
+from app.crud.crud_reminder import reminder as crud_reminder
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.location import LocationCreate
+
+
+def versions(db: Session, owner_id: int) -> dict:
+    return {
+        name: crud.collection_version(db, owner_id=owner_id)
+        for name, crud in (
+            ("item", crud_item), ("location", crud_location),
+            ("reminder", crud_reminder), ("category", crud_category),
+        )
+    }
+
+
+class TestCollectionVersion:
+    def test_orm_writes_bump_version(self, db: Session, test_user: User):
+        """测试经过 ORM 的新增、修改和删除在同一事务中递增版本号，无实际修改时不变"""
+        assert versions(db, test_user.id)["item"] == "0"
+
+        item = crud_item.create(db, obj_in=ItemCreate(name="牛奶", category="食品"), owner_id=test_user.id)
+        after_create = versions(db, test_user.id)
+        assert after_create["item"] == "1"
+        assert after_create["category"] == "1"
+        assert after_create["location"] == "0"
+
+        crud_item.update(db, db_obj=item, obj_in={"name": "牛奶"})
+        assert versions(db, test_user.id)["item"] == "1"
+        crud_item.update(db, db_obj=item, obj_in=ItemUpdate(quantity=3))
+        assert versions(db, test_user.id)["item"] == "2"
+
+        crud_item.remove(db, id=item.id)
+        after_remove = versions(db, test_user.id)
+        assert after_remove["item"] == "3"
+        assert after_remove["reminder"] == "1"
+
+    def test_bulk_writes_bump_version(self, db: Session, test_user: User):
+        """测试 Core 语句的批量写入同样递增版本号，且只影响写入的用户和集合"""
+        rows = crud_item.create_multi(db, objs_in=[
+            ItemCreate(name="牛奶"), ItemCreate(name="面包"),
+        ], owner_id=test_user.id)
+        assert versions(db, test_user.id)["item"] == "1"
+
+        ids = [row.id for row in rows]
+        crud_item.update_multi(db, ids=ids, owner_id=test_user.id, obj_in={"quantity": 2})
+        assert versions(db, test_user.id)["item"] == "2"
+        # 不属于该用户的记录不会被修改，版本号不变
+        crud_item.update_multi(db, ids=ids, owner_id=test_user.id + 1, obj_in={"quantity": 3})
+        assert versions(db, test_user.id)["item"] == "2"
+        assert versions(db, test_user.id + 1)["item"] == "0"
+
+        db.add(Reminder(title="喝牛奶", item_id=ids[0], owner_id=test_user.id))
+        db.commit()
+        assert versions(db, test_user.id)["reminder"] == "1"
+        crud_item.remove_multi(db, ids=ids, owner_id=test_user.id)
+        assert versions(db, test_user.id)["item"] == "3"
+        assert versions(db, test_user.id)["reminder"] == "2"
+
+        assert crud_item.load_multi(db, objs_in=[ItemCreate(name="剪刀")], owner_id=test_user.id) == 1
+        assert versions(db, test_user.id)["item"] == "4"
+
+        location = crud_location.create(db, obj_in=LocationCreate(name="厨房"), owner_id=test_user.id)
+        assert versions(db, test_user.id)["location"] == "1"
+        crud_location.remove_empty_owned(db, id=location.id, owner_id=test_user.id)
+        assert versions(db, test_user.id)["location"] == "2"
+
+    def test_category_rename_bumps_category_only(self, db: Session, test_user: User):
+        """测试类别改名只递增类别集合的版本号，物品集合不变"""
+        crud_item.create(db, obj_in=ItemCreate(name="牛奶", category="食品"), owner_id=test_user.id)
+        food = crud_category.get_by_name(db, name="食品", owner_id=test_user.id)
+        before = versions(db, test_user.id)
+
+        crud_category.update_owned(db, id=food.id, owner_id=test_user.id, obj_in={"name": "食物"})
+        after = versions(db, test_user.id)
+        assert int(after["category"]) == int(before["category"]) + 1
+        assert after["item"] == before["item"]
+
+    def test_version_is_single_row_lookup(self, db: Session, test_user: User):
+        """测试读取版本号是一次按主键的查询，不对集合做聚合"""
+        crud_item.create_multi(db, objs_in=[ItemCreate(name=f"物品{i}") for i in range(20)], owner_id=test_user.id)
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            assert crud_item.collection_version(db, owner_id=test_user.id) == "1"
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+        assert len(statements) == 1
+        assert "FROM collection_version" in statements[0]
+        assert "count(" not in statements[0].lower() and "max(" not in statements[0].lower()
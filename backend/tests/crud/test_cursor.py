@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud.pagination import (
+    Cursor,
+    PaginationError,
+    decode_cursor,
+    encode_cursor,
+    resolve_page,
+)
+
+
+def test_cursor_round_trip():
+    """测试游标编码后可以还原"""
+    token = encode_cursor("-created_at", datetime(2024, 1, 2, 3, 4, 5), 42)
+    assert decode_cursor(token) == Cursor(sort="-created_at", value="2024-01-02T03:04:05", id=42)
+
+
+def test_decode_invalid_cursor():
+    """测试无法解析的游标"""
+    with pytest.raises(PaginationError):
+        decode_cursor("%%%")
+
+
+def test_resolve_page_uses_cursor_sort():
+    """测试省略 sort 时沿用游标中的排序"""
+    page = resolve_page(
+        skip=5, limit=10, cursor=encode_cursor("name", "a", 1), sort=None, allowed=("id", "name")
+    )
+    assert page.sort == "name"
+    assert page.cursor.id == 1
+
+
+def test_resolve_page_rejects_unknown_field():
+    """测试不允许的排序字段"""
+    with pytest.raises(PaginationError):
+        resolve_page(skip=0, limit=10, cursor=None, sort="-secret", allowed=("id", "name"))
@@ -0,0 +1,86 @@
+from typing import List
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.crud.crud_item import item as crud_item
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import ItemCreate, ItemUpdate
+
+
+@pytest.fixture(scope="function")
+def kitchen_items(db: Session, test_user: User) -> List[Item]:
+    items = [
+        Item(name="德国厨刀", description="WMF 不锈钢主厨刀", owner_id=test_user.id),
+        Item(name="儿童积木玩具套装", description="乐高积木", owner_id=test_user.id),
+        Item(name="厨房剪刀", description="剪鸡骨用", owner_id=test_user.id),
+        Item(name="刀架", description="放厨刀和剪刀", owner_id=test_user.id),
+    ]
+    db.add_all(items)
+    db.commit()
+    return items
+
+
+def names(items: List[Item]) -> List[str]:
+    return [item.name for item in items]
+
+
+class TestItemSearchIndex:
+    def test_tokens_maintained_on_write(self, db: Session, kitchen_items: List[Item]):
+        """测试新增和修改名称时自动维护检索词元"""
+        knife = kitchen_items[0]
+        assert knife.name_tokens == "德 国 厨 刀 德国 国厨 厨刀"
+        assert knife.description_tokens.startswith("wmf 不 锈 钢")
+
+        crud_item.update(db, db_obj=knife, obj_in=ItemUpdate(name="日本厨刀"))
+        assert "日本" in knife.name_tokens.split()
+        assert "德国" not in names(crud_item.search_by_name(db, name="德国", owner_id=knife.owner_id))
+
+    def test_search_chinese(self, db: Session, test_user: User, kitchen_items: List[Item]):
+        """测试中文检索：二字组必须全部命中"""
+        assert names(crud_item.search_by_name(db, name="积木", owner_id=test_user.id)) == ["儿童积木玩具套装"]
+        assert names(crud_item.search_by_name(db, name="积木套装", owner_id=test_user.id)) == []
+        assert names(crud_item.search_by_name(db, name="玩具套装", owner_id=test_user.id)) == ["儿童积木玩具套装"]
+        assert set(names(crud_item.search_by_name(db, name="剪刀", owner_id=test_user.id))) == {"厨房剪刀", "刀架"}
+        assert names(crud_item.search_by_name(db, name="wm", owner_id=test_user.id)) == ["德国厨刀"]
+
+    def test_relevance_ranking(self, db: Session, test_user: User, kitchen_items: List[Item]):
+        """测试名称命中排在仅描述命中之前"""
+        found = names(crud_item.search_by_name(db, name="厨刀", owner_id=test_user.id))
+        assert found == ["德国厨刀", "刀架"]
+
+        by_id = names(crud_item.search_by_name(db, name="厨刀", owner_id=test_user.id, sort="-id"))
+        assert by_id == ["刀架", "德国厨刀"]
+
+    def test_search_uses_fts_index(self, db: Session, test_user: User, kitchen_items: List[Item]):
+        """测试 SQLite 下检索走 FTS5 索引而不是 LIKE 全表扫描"""
+        executed: List[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            crud_item.search_by_name(db, name="积木", owner_id=test_user.id)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+        assert "item_fts MATCH" in executed[-1]
+        assert "LIKE" not in executed[-1]
+
+    def test_index_follows_bulk_writes(self, db: Session, test_user: User, kitchen_items: List[Item]):
+        """测试批量新增、修改、删除同步更新索引"""
+        rows = crud_item.create_multi(
+            db, objs_in=[ItemCreate(name="保温杯"), ItemCreate(name="玻璃杯")], owner_id=test_user.id
+        )
+        assert len(crud_item.search_by_name(db, name="杯", owner_id=test_user.id)) == 2
+
+        crud_item.update_owned(db, id=rows[0].id, owner_id=test_user.id, obj_in={"name": "保温壶"})
+        assert names(crud_item.search_by_name(db, name="杯", owner_id=test_user.id)) == ["玻璃杯"]
+        assert names(crud_item.search_by_name(db, name="保温", owner_id=test_user.id)) == ["保温壶"]
+
+        crud_item.remove_multi(db, ids=[row.id for row in rows], owner_id=test_user.id)
+        assert crud_item.search_by_name(db, name="保温", owner_id=test_user.id) == []
+        count = db.execute(text("SELECT count(*) FROM item_fts WHERE item_fts MATCH '\"杯\"'")).scalar()
+        assert count == 0
@@ -0,0 +1,65 @@
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.crud_refresh_token import hash_token, refresh_token as crud_refresh_token
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from tests.conftest import TestingSessionLocal
+
+
+class TestRefreshTokenRotation:
+    def test_concurrent_rotation_consumes_token_once(self, db: Session, test_user: User):
+        """测试并发使用同一刷新令牌时只有一个请求轮换成功，其余按重用处理并吊销整个令牌族"""
+        token = crud_refresh_token.issue(db, user_id=test_user.id)
+        barrier = threading.Barrier(4)
+        results = []
+
+        def refresh():
+            with TestingSessionLocal() as session:
+                barrier.wait()
+                results.append(crud_refresh_token.rotate(session, token=token))
+
+        threads = [threading.Thread(target=refresh) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        rotated = [result for result in results if result is not None]
+        assert len(results) == 4
+        assert len(rotated) == 1
+        db.expire_all()
+        assert all(row.revoked for row in db.execute(select(RefreshToken)).scalars())
+
+    def test_expired_token_is_not_reuse(self, db: Session, test_user: User):
+        """测试过期的令牌刷新失败，但不会吊销令牌族"""
+        token = crud_refresh_token.issue(db, user_id=test_user.id)
+        db_obj = crud_refresh_token.get_by_token(db, token=token)
+        db_obj.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+
+        assert crud_refresh_token.rotate(db, token=token) is None
+        db.refresh(db_obj)
+        assert db_obj.used_at is None and not db_obj.revoked
+
+    def test_prune_deletes_expired_tokens(self, db: Session, test_user: User):
+        """测试清理只删除过期的令牌（包括已使用和已吊销的）"""
+        tokens = [crud_refresh_token.issue(db, user_id=test_user.id) for _ in range(3)]
+        crud_refresh_token.rotate(db, token=tokens[0])
+
+        later = datetime.utcnow() + timedelta(days=30)
+        crud_refresh_token.issue(db, user_id=test_user.id)
+        db.execute(
+            RefreshToken.__table__.update()
+            .where(RefreshToken.token_hash == hash_token(tokens[2]))
+            .values(expires_at=later + timedelta(days=1))
+        )
+        db.commit()
+
+        assert crud_refresh_token.prune(db, now=datetime.utcnow()) == 0
+        assert crud_refresh_token.prune(db, now=later) == 4
+        remaining = db.execute(select(RefreshToken.token_hash)).scalars().all()
+        assert remaining == [hash_token(tokens[2])]
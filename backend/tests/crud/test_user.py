@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.crud.crud_user import user as crud_user
 from app.schemas.user import UserCreate, UserUpdate
 from app.models.user import User
+from app.core import security
 from app.core.security import verify_password
 from datetime import datetime, timezone
 
@@ -156,4 +157,42 @@ class TestUserCRUD:
         invalid_auth = crud_user.authenticate(
             db, username="testuser", password="wrongpassword"
         )
-        assert invalid_auth is None 
\ No newline at end of file
+        assert invalid_auth is None
+
+    def test_authenticate_rehashes_outdated_rounds(self, db: Session, monkeypatch):
+        """测试登录时透明地按新的工作因子重新哈希"""
+        old_context = security.build_password_context("bcrypt", 4)
+        user = User(
+            username="rehash",
+            email="rehash@example.com",
+            hashed_password=old_context.hash("testpassword"),
+            is_active=True
+        )
+        db.add(user)
+        db.commit()
+
+        monkeypatch.setattr(security, "pwd_context", security.build_password_context("bcrypt", 5))
+        authenticated_user = crud_user.authenticate(db, username="rehash", password="testpassword")
+
+        assert authenticated_user
+        assert authenticated_user.hashed_password.startswith("$2b$05$")
+        assert security.verify_password("testpassword", authenticated_user.hashed_password)
+
+    def test_authenticate_migrates_scheme(self, db: Session, monkeypatch):
+        """测试登录时将旧方案的哈希迁移到当前方案"""
+        old_context = security.build_password_context("pbkdf2_sha256", 1000)
+        user = User(
+            username="migrate",
+            email="migrate@example.com",
+            hashed_password=old_context.hash("testpassword"),
+            is_active=True
+        )
+        db.add(user)
+        db.commit()
+
+        monkeypatch.setattr(security, "pwd_context", security.build_password_context("bcrypt", 4))
+        assert crud_user.authenticate(db, username="migrate", password="wrongpassword") is None
+        assert user.hashed_password.startswith("$pbkdf2-sha256$")
+
+        authenticated_user = crud_user.authenticate(db, username="migrate", password="testpassword")
+        assert authenticated_user.hashed_password.startswith("$2b$04$")
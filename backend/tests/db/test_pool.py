@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db.pool import InstrumentedQueuePool, pool_status
+
+
+class TestInstrumentedPool:
+    @pytest.fixture(scope="function")
+    def pool_engine(self, tmp_path):
+        """创建一个容量为1、无溢出的小连接池"""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.05,
+        )
+        yield engine
+        engine.dispose()
+
+    def test_records_checkouts_and_overflow(self, pool_engine):
+        """测试签出次数与溢出连接统计"""
+        with pool_engine.connect() as conn1:
+            conn1.execute(text("SELECT 1"))
+            with pool_engine.connect() as conn2:
+                conn2.execute(text("SELECT 1"))
+                status = pool_status(pool_engine)
+                assert status["checked_out"] == 2
+                assert status["overflow"] == 1
+
+        status = pool_status(pool_engine)
+        assert status["checkouts"] == 2
+        assert status["overflow_checkouts"] == 1
+        assert status["overflow_peak"] == 1
+        assert status["timeouts"] == 0
+        assert status["checked_out"] == 0
+
+    def test_records_timeouts(self, pool_engine):
+        """测试连接池耗尽时记录超时和等待时间"""
+        with pool_engine.connect(), pool_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                pool_engine.connect()
+
+        status = pool_status(pool_engine)
+        assert status["timeouts"] == 1
+        assert status["wait_max_ms"] >= 50
+
+    def test_metrics_survive_dispose(self, pool_engine):
+        """测试重建连接池后保留累计统计"""
+        with pool_engine.connect():
+            pass
+        pool_engine.dispose()
+        assert pool_status(pool_engine)["checkouts"] == 1
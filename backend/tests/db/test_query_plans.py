@@ -0,0 +1,205 @@
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app import crud
+from app.crud.crud_item import ItemFilter
+from app.models.item import Item
+from app.models.location import Location
+from app.models.reminder import Reminder
+from app.models.tombstone import Tombstone
+from app.models.user import User
+
+TABLES = ("item", "location", "reminder", "category", "tombstone", "collection_version")
+# PostgreSQL: "Seq Scan on item"；SQLite: "SCAN item"（带索引的查找为 "SEARCH item USING INDEX ..."）
+SEQ_SCAN = {
+    "postgresql": re.compile(rf"Seq Scan on ({'|'.join(TABLES)})\b"),
+    "sqlite": re.compile(rf"^SCAN ({'|'.join(TABLES)})\b"),
+}
+# 每个查询预期使用的索引。两种数据库的计划中都会出现索引名：
+# PostgreSQL 为 "Index Scan using ix_... on item" / "Bitmap Index Scan on ix_..."，
+# SQLite 为 "SEARCH item USING [COVERING] INDEX ix_..."
+OWNER_INDEX = {table: rf"ix_{table}_owner_id_\w+" for table in TABLES}
+EXPECTED_INDEX = {
+    "item_list": OWNER_INDEX["item"],
+    "item_categories": r"ix_item_owner_id_category_id",
+    "item_location": r"ix_item_owner_id_location_id",
+    "item_location_subtree": r"ix_item_owner_id_location_id",
+    # 全文检索：PostgreSQL 为 GIN 表达式索引，SQLite 为 FTS5 虚拟表
+    "item_search": r"ix_item_search_vector|item_fts VIRTUAL TABLE",
+    "item_expiring": r"ix_item_owner_id_expiry_date",
+    "item_expiry_counts": r"ix_item_owner_id_expiry_date",
+    # 集合版本号按主键 (owner_id, collection) 读取一行
+    "item_version": r"collection_version_pkey|sqlite_autoindex_collection_version_1",
+    "item_changed_since": r"ix_item_owner_id_updated_at",
+    "location_list": OWNER_INDEX["location"],
+    "location_children": r"ix_location_owner_id_parent_id",
+    "reminder_list": OWNER_INDEX["reminder"],
+    "reminder_due": r"ix_reminder_owner_id_due_date_open",
+    "reminder_upcoming": r"ix_reminder_owner_id_due_date_open",
+    "reminder_by_item": rf"ix_reminder_item_id|{OWNER_INDEX['reminder']}",
+    "category_changed_since": r"ix_category_owner_id_updated_at",
+    "tombstone_since": r"ix_tombstone_owner_id_deleted_at",
+}
+
+
+def hot_queries(seed: Dict[str, int], dialect: str) -> Dict[str, Callable[[], Select]]:
+    """
+    各 CRUD 模块中按 owner_id 过滤的高频查询（与接口实际执行的语句相同）
+    """
+    owner_id = seed["owner_id"]
+    now = datetime.utcnow()
+
+    def items(filters: ItemFilter, sort=None) -> Select:
+        return crud.item._filtered(
+            filters=filters, owner_id=owner_id, dialect=dialect,
+            skip=0, limit=50, cursor=None, sort=sort, fields=None,
+        )
+
+    return {
+        "item_list": lambda: crud.item._page(crud.item._by_owner_stmt(owner_id=owner_id), limit=50),
+        "item_categories": lambda: items(ItemFilter(categories=("食品", "药品"))),
+        "item_location": lambda: items(ItemFilter(location_id=seed["location_id"])),
+        "item_location_subtree": lambda: items(
+            ItemFilter(location_id=seed["root_location_id"], include_sublocations=True)
+        ),
+        "item_search": lambda: items(ItemFilter(search="牛奶")),
+        "item_expiring": lambda: crud.item._page(
+            crud.item._expiring_stmt(owner_id=owner_id, bucket="30d", now=now),
+            default_sort="expiry_date",
+        ),
+        "item_expiry_counts": lambda: crud.item._expiry_counts_stmt(owner_id=owner_id, now=now),
+        "item_version": lambda: crud.item._version_stmt(owner_id=owner_id),
+        "item_changed_since": lambda: crud.item._changed_since_stmt(
+            owner_id=owner_id, until=now, cursor=None, limit=500
+        ),
+        "location_list": lambda: crud.location._page(crud.location._by_owner_stmt(owner_id=owner_id)),
+        "location_children": lambda: crud.location._by_parent_stmt(
+            parent_id=seed["root_location_id"], owner_id=owner_id
+        ),
+        "reminder_list": lambda: crud.reminder._page(crud.reminder._by_owner_stmt(owner_id=owner_id)),
+        "reminder_due": lambda: crud.reminder._page(
+            crud.reminder._due_stmt(owner_id=owner_id), default_sort="due_date"
+        ),
+        "reminder_upcoming": lambda: crud.reminder._page(
+            crud.reminder._upcoming_stmt(owner_id=owner_id, days=7), default_sort="due_date"
+        ),
+        "reminder_by_item": lambda: crud.reminder._by_item_stmt(
+            item_id=seed["item_id"], owner_id=owner_id
+        ),
+        "category_changed_since": lambda: crud.category._changed_since_stmt(
+            owner_id=owner_id, until=now, cursor=None, limit=500
+        ),
+        "tombstone_since": lambda: crud.tombstone._since_stmt(
+            owner_id=owner_id, until=now, cursor=None, limit=500
+        ),
+    }
+
+
+def _seed_other_owner(db: Session, now: datetime) -> None:
+    """
+    另一个用户的大量数据：被测用户只占各表的一小部分，按 owner_id 的索引才比全表扫描更划算，
+    PostgreSQL 的计划不需要关闭顺序扫描也能反映真实的索引选择
+    """
+    user = User(username="plan-bulk", email="plan-bulk@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    db.flush()
+    db.execute(insert(Location.__table__), [
+        {"name": f"位置{i}", "owner_id": user.id, "created_at": now, "updated_at": now}
+        for i in range(200)
+    ])
+    db.execute(insert(Item.__table__), [
+        {"name": f"物品{i}", "price": i, "owner_id": user.id, "created_at": now, "updated_at": now,
+         "expiry_date": now + timedelta(days=i % 100 - 10)}
+        for i in range(4000)
+    ])
+    db.execute(insert(Reminder.__table__), [
+        {"title": f"提醒{i}", "due_date": now + timedelta(days=i % 30 - 10), "is_completed": i % 3 == 0,
+         "owner_id": user.id, "created_at": now, "updated_at": now}
+        for i in range(1200)
+    ])
+    db.execute(insert(Tombstone.__table__), [
+        {"entity_type": "item", "entity_id": 100000 + i, "owner_id": user.id, "deleted_at": now}
+        for i in range(400)
+    ])
+
+
+@pytest.fixture(scope="function")
+def seed(db: Session) -> Dict[str, int]:
+    """多个用户各自拥有位置、物品、提醒和墓碑，模拟共享表中的数据分布"""
+    now = datetime.utcnow()
+    result: Dict[str, int] = {}
+    for u in range(5):
+        user = User(username=f"plan{u}", email=f"plan{u}@example.com", hashed_password="x", is_active=True)
+        db.add(user)
+        db.flush()
+        root = Location(name="厨房", owner_id=user.id)
+        db.add(root)
+        db.flush()
+        children = [Location(name=f"柜子{i}", parent_id=root.id, owner_id=user.id) for i in range(5)]
+        db.add_all(children)
+        db.flush()
+        items = [
+            Item(
+                name=f"牛奶{i}" if i % 10 == 0 else f"物品{i}",
+                category=("食品", "药品", "书籍", "电器")[i % 4],
+                price=i, location_id=children[i % 5].id, owner_id=user.id,
+                expiry_date=now + timedelta(days=i % 100 - 10),
+            )
+            for i in range(200)
+        ]
+        db.add_all(items)
+        db.flush()
+        db.add_all([
+            Reminder(title=f"提醒{i}", due_date=now + timedelta(days=i % 30 - 10),
+                     is_completed=i % 3 == 0, item_id=items[i].id, owner_id=user.id)
+            for i in range(60)
+        ])
+        db.add_all([
+            Tombstone(entity_type="item", entity_id=10000 + i, owner_id=user.id, deleted_at=now)
+            for i in range(20)
+        ])
+        result = {
+            "owner_id": user.id, "root_location_id": root.id,
+            "location_id": children[0].id, "item_id": items[0].id,
+        }
+    _seed_other_owner(db, now)
+    db.commit()
+    return result
+
+
+def explain(db: Session, stmt: Select) -> List[str]:
+    dialect = db.get_bind().dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    if dialect.name == "postgresql":
+        # 先更新统计信息，计划按真实的数据分布选择（不关闭顺序扫描）
+        db.execute(text("ANALYZE"))
+        return [row[0] for row in db.execute(text(f"EXPLAIN {sql}"))]
+    return [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+QUERY_NAMES = list(hot_queries({"owner_id": 0, "root_location_id": 0, "location_id": 0, "item_id": 0}, "sqlite"))
+
+
+class TestQueryPlans:
+    @pytest.mark.parametrize("name", QUERY_NAMES)
+    def test_hot_query_uses_index(self, db: Session, seed: Dict[str, int], name: str):
+        """测试高频查询使用预期的按所有者索引，而不是对共享表做顺序扫描或改用其他索引"""
+        dialect = db.get_bind().dialect.name
+        if dialect not in SEQ_SCAN:
+            pytest.skip(f"no plan check for {dialect}")
+        stmt = hot_queries(seed, dialect)[name]()
+        plan = explain(db, stmt)
+        scans = [line for line in plan if SEQ_SCAN[dialect].search(line.strip())]
+        assert not scans, f"{name} falls back to a sequential scan:\n" + "\n".join(plan)
+        assert re.search(EXPECTED_INDEX[name], "\n".join(plan)), (
+            f"{name} does not use {EXPECTED_INDEX[name]}:\n" + "\n".join(plan)
+        )
+
+    def test_expected_index_for_every_query(self):
+        assert set(EXPECTED_INDEX) == set(QUERY_NAMES)